@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""Design every filter of a json lines file in parallel.
+
+Usage::
+
+    python -m filterdesigner.batch specs.jsonl --jobs 4 --out taps
+
+Each line of specs.jsonl is a FilterSpec as accepted by FilterSpec.from_dict
+with an optional "name". The taps of each spec are written to
+<out>/<name>.npy and the metrics and design time of every spec are written to
+<out>/summary.json. Characters of a name other than letters, digits, '_', '-'
+and '.' are replaced by '_', and a repeated name gets the suffix _2, _3, ...
+A line which is not a valid spec is reported with its line number and
+skipped.
+
+With --bits N, the taps are also quantized to N-bit fixed point and saved as
+integer codes to <out>/<name>_q<N>.npy, and the summary reports the format
+and the stopband attenuation of every word length of --explore-bits (8 to 32
+by default).
+"""
+
+# Standard library imports
+import argparse
+import json
+import os
+import os.path as osp
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Third party imports
+import numpy as np
+
+# Local import
+from filterdesigner.filterdesign.cost import fir_cost
+from filterdesigner.filterdesign.design import FilterSpec
+from filterdesigner.filterdesign.metrics import design_and_measure
+from filterdesigner.filterdesign.quantize import (WORD_LENGTHS, quantize_taps,
+                                                  explore_word_lengths)
+
+
+def file_name(name):
+    """Return name with only letters, digits, '_', '-' and '.' so that it is
+    a file name inside the output directory."""
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', name).lstrip('.')
+
+
+def read_specs(path, errors=None):
+    """Read (name, FilterSpec) of every line of a json lines file.
+
+    The names are made file names by file_name, and a name which is already
+    used gets the suffix _2, _3, ...
+
+    Parameters
+    ----------
+    path: str
+    errors: list, optional
+        "line N: message" of every invalid line is appended and the line is
+        skipped (the default is None, None이면 ValueError 발생)
+
+    Returns
+    -------
+    list of (str, FilterSpec)
+    """
+    specs = []
+    used = set()
+    with open(path) as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                name = file_name(str(data.get('name', '')))
+                spec = FilterSpec.from_dict(data)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                message = f"line {line_no}: {type(e).__name__}: {e}"
+                if errors is None:
+                    raise ValueError(message) from e
+                errors.append(message)
+                continue
+
+            name = name or f"spec{line_no:04d}"
+            unique = name
+            suffix = 2
+            # Compared in lower case for case-insensitive file systems
+            while unique.lower() in used:
+                unique = f"{name}_{suffix}"
+                suffix += 1
+            used.add(unique.lower())
+            specs.append((unique, spec))
+    return specs
+
+
+def run_batch(specs, out_dir, jobs=None, log=print, n_bit=None,
+              n_bits=WORD_LENGTHS):
+    """Design specs with a process pool and write the results to out_dir.
+
+    Parameters
+    ----------
+    specs: list of (str, FilterSpec)
+    out_dir: str
+    jobs: int, optional
+        number of worker processes (the default is None, None이면 CPU 개수)
+    log: callable
+        called with a line of report for every spec
+    n_bit: int, optional
+        word length of the quantized taps (the default is None, None이면
+        양자화하지 않음)
+    n_bits: iterable of int
+        word lengths reported in the summary if n_bit is given
+
+    Returns
+    -------
+    list of dict
+        summary of every spec
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    summary = []
+    t_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(design_and_measure,
+                               [spec for _, spec in specs])
+        for (name, spec), (taps, metrics, elapsed, error) in zip(specs,
+                                                                 results):
+            record = {'name': name, 'spec': spec.to_dict(),
+                      'design_time': elapsed, 'error': error}
+            if error is None:
+                np.save(osp.join(out_dir, name + '.npy'), taps)
+                record.update(metrics._asdict())
+                record['cost'] = fir_cost(taps, spec.fs)._asdict()
+                log(f"{name}: {len(taps)} taps, "
+                    f"ripple {metrics.passband_ripple_db:.3f} dB, "
+                    f"attenuation {metrics.stopband_atten_db:.1f} dB, "
+                    f"{elapsed * 1e3:.1f} ms")
+                if n_bit is not None:
+                    record.update(quantize_record(spec, taps, n_bit, n_bits,
+                                                  osp.join(out_dir, name)))
+            else:
+                log(f"{name}: failed ({error}), {elapsed * 1e3:.1f} ms")
+            summary.append(record)
+
+    log(f"{len(specs)} specs in {time.perf_counter() - t_start:.2f} s")
+    with open(osp.join(out_dir, 'summary.json'), 'w') as f:
+        json.dump(summary, f, indent=2)
+
+    return summary
+
+
+def quantize_record(spec, taps, n_bit, n_bits, path):
+    """Save the taps quantized to n_bit to <path>_q<n_bit>.npy and return
+    the quantization results of the summary."""
+    quantized = quantize_taps(taps, n_bit)
+    np.save(f"{path}_q{n_bit}.npy", quantized.integers)
+    points = explore_word_lengths(spec, taps, sorted(set(n_bits) | {n_bit}))
+    return {'n_bit': n_bit, 'frac_bits': quantized.frac_bits,
+            'q_format': quantized.q_format,
+            'word_lengths': [point._asdict() for point in points]}
+
+
+def main(argv=None):
+    """Run batch design from the command line."""
+    parser = argparse.ArgumentParser(
+        prog='python -m filterdesigner.batch',
+        description="Design every filter spec of a json lines file.")
+    parser.add_argument('specs', help="json lines file of filter specs")
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help="number of worker processes")
+    parser.add_argument('--out', '-o', default='filterdesigner_out',
+                        help="output directory")
+    parser.add_argument('--bits', type=int, default=None,
+                        help="also save the taps quantized to this word "
+                             "length")
+    parser.add_argument('--explore-bits', default='8:32',
+                        help="word lengths reported with --bits "
+                             "(start:stop or comma separated)")
+    args = parser.parse_args(argv)
+
+    if ':' in args.explore_bits:
+        start, stop = (int(part) for part in args.explore_bits.split(':'))
+        n_bits = range(start, stop + 1)
+    else:
+        n_bits = [int(part) for part in args.explore_bits.split(',')]
+    errors = []
+    specs = read_specs(args.specs, errors)
+    for error in errors:
+        print(f"{args.specs}: {error}")
+    summary = run_batch(specs, args.out, args.jobs, n_bit=args.bits,
+                        n_bits=n_bits)
+    return 1 if errors or any(record['error'] for record in summary) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Benchmarks of Filter Designer."""
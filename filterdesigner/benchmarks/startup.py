@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Measure the cold start time of Filter Designer.
+
+Usage::
+
+    python -m filterdesigner.benchmarks.startup --runs 5 --save startup.json
+    python -m filterdesigner.benchmarks.startup --baseline startup.json
+
+Every run is a new python process. The import time of filterdesigner.main is
+taken from ``python -X importtime`` and the time to the first paint of the
+main window is measured from the launch of the process. The median of the
+runs is reported and, if a baseline is given, the command exits with 1 when a
+time is slower than the baseline by more than the tolerance.
+"""
+
+# Standard library imports
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MODULE = 'filterdesigner.main'
+N_TOP_MODULE = 15
+PAINT_TIMEOUT_MS = 60000
+
+
+def parse_importtime(text):
+    """Parse the output of -X importtime to {module: cumulative seconds}."""
+    times = {}
+    for line in text.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def import_times(module=MODULE):
+    """Import module in a new process and return {module: seconds}."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                           f'import {module}'],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    return parse_importtime(proc.stderr)
+
+
+def first_paint_time():
+    """Launch the application in a new process and return the seconds to
+    the first paint of the main window."""
+    t_launch = time.time()
+    proc = subprocess.run([sys.executable, '-m', __spec__.name, '--child',
+                           repr(t_launch)],
+                          stdout=subprocess.PIPE, universal_newlines=True,
+                          check=True)
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def _child(t_launch):
+    """Show the main window and print the seconds from t_launch to the first
+    paint."""
+    from qtpy.QtCore import QObject, QEvent, QTimer
+    from qtpy.QtWidgets import QApplication
+
+    from filterdesigner.config import UserConfig as CONF
+    from filterdesigner.main import QDesignerMainWindow
+
+    class PaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and self.elapsed is None:
+                self.elapsed = time.time() - t_launch
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    app = QApplication(sys.argv[:1])
+    window = QDesignerMainWindow()
+    if CONF.dark_theme:
+        from qdarkstyle import load_stylesheet_from_environment
+        app.setStyleSheet(load_stylesheet_from_environment())
+
+    paint_filter = PaintFilter()
+    paint_filter.elapsed = None
+    window.installEventFilter(paint_filter)
+    QTimer.singleShot(PAINT_TIMEOUT_MS, app.quit)
+    window.show()
+    app.exec_()
+
+    if paint_filter.elapsed is None:
+        raise SystemExit("The main window was not painted")
+    print(paint_filter.elapsed)
+
+
+def run(runs=5):
+    """Measure the cold start runs times and return the median.
+
+    Returns
+    -------
+    dict
+        'import' and 'first_paint' in seconds and 'modules', the cumulative
+        import time of the slowest modules
+    """
+    imports = [import_times() for _ in range(runs)]
+    paints = [first_paint_time() for _ in range(runs)]
+
+    modules = {name: statistics.median(times.get(name, 0)
+                                       for times in imports)
+               for name in imports[0]}
+    top = sorted(modules.items(), key=lambda item: -item[1])[:N_TOP_MODULE]
+    return {'import': modules.get(MODULE, 0.0),
+            'first_paint': statistics.median(paints),
+            'modules': dict(top)}
+
+
+def compare(result, baseline, tolerance):
+    """Return the list of messages of the times slower than baseline."""
+    regressions = []
+    for key in ('import', 'first_paint'):
+        if key in baseline and result[key] > baseline[key] * (1 + tolerance):
+            regressions.append(f"{key}: {result[key]:.3f} s > baseline "
+                               f"{baseline[key]:.3f} s (+{tolerance:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    """Run the startup benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        prog='python -m filterdesigner.benchmarks.startup',
+        description="Measure the cold start time of Filter Designer.")
+    parser.add_argument('--runs', '-n', type=int, default=5,
+                        help="number of cold starts")
+    parser.add_argument('--save', help="write the result to a json file")
+    parser.add_argument('--baseline', help="json file of a previous result")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown over the baseline")
+    parser.add_argument('--child', type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        _child(args.child)
+        return 0
+
+    result = run(args.runs)
+    for name, elapsed in result['modules'].items():
+        print(f"{elapsed * 1e3:9.1f} ms  {name}")
+    print(f"import {MODULE}: {result['import']:.3f} s")
+    print(f"first paint: {result['first_paint']:.3f} s")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)),
+                    exist_ok=True)
+        with open(args.save, 'w') as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for message in regressions:
+            print("Regression:", message)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
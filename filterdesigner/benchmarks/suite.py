@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the design, response and rendering hot paths.
+
+Usage::
+
+    python -m filterdesigner.benchmarks.suite
+    python -m filterdesigner.benchmarks.suite --quick --select response
+    python -m filterdesigner.benchmarks.suite --save baseline.json
+
+Every case is run once under tracemalloc for the peak memory and then timed
+without it. The result is compared against the stored baseline
+(baseline.json next to this file by default) and the command exits with 1 if
+a case is slower or uses more memory than the baseline allows. The baseline
+depends on the machine, so regenerate it with --save when the machine
+changes.
+
+The GUI cases need a Qt platform; set QT_QPA_PLATFORM=offscreen to run them
+without a display.
+"""
+
+# Standard library imports
+import argparse
+import json
+import os
+import os.path as osp
+import sys
+import time
+import tracemalloc
+
+# Third party imports
+import numpy as np
+
+BASELINE_PATH = osp.join(osp.dirname(__file__), 'baseline.json')
+ORDERS = (129, 513, 2049, 8193)
+QUICK_ORDERS = (129, 513, 2049)
+RESPONSE_TAPS = (129, 1025, 8193, 65537)
+PLOT_TAPS = (129, 8193)
+BATCH_SHAPE = (256, 1025)
+STREAM_SAMPLES = 2 ** 20
+STREAM_CHUNK = 4096
+RESAMPLE_RATES = ((1, 8), (8, 1), (147, 160))
+CHANNELS_SHAPE = (64, 2 ** 16)
+UPRATE = 8
+FS = 1000.0
+# Transition width of the designs in units of fs / n_tap
+TRANSITION_TAPS = 4
+# remez fails to converge for these designs, whatever the transition width
+UNCONVERGED_CASES = ('calc_filter/Equiripple/highpass/8193',)
+
+# Repeat a case while its total time is below MIN_TIME, up to MAX_REPEAT
+MIN_TIME = 0.5
+MAX_REPEAT = 20
+# Slowdowns smaller than this are noise of the timer
+MIN_TIME_DIFF = 1e-3
+
+
+def measure(func):
+    """Measure the wall time and the peak memory of func().
+
+    Returns
+    -------
+    dict
+        'time' (fastest of the repeats in seconds), 'repeat', 'peak_bytes'
+        and 'error' (None if func did not raise)
+    """
+    error = None
+    tracemalloc.start()
+    try:
+        func()
+    except Exception as e:  # Failures of a design are a result too
+        error = str(e)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times = []
+    while len(times) < MAX_REPEAT and sum(times) < MIN_TIME:
+        t_start = time.perf_counter()
+        try:
+            func()
+        except Exception:
+            pass
+        times.append(time.perf_counter() - t_start)
+
+    return {'time': min(times), 'repeat': len(times),
+            'peak_bytes': peak, 'error': error}
+
+
+def response_cases():
+    """Yield (name, func) of frequency_response, db2,
+    frequency_response_points, frequency_response_batch, StreamFilter,
+    FoldedFilter, SOSStreamFilter, Resampler and filter_channels."""
+    from filterdesigner.helper.signal import (db2, frequency_response,
+                                              frequency_response_batch,
+                                              frequency_response_points)
+
+    rng = np.random.RandomState(0)
+    for n_tap in RESPONSE_TAPS:
+        taps = rng.standard_normal(n_tap)
+        response = np.fft.fft(taps, n_tap * UPRATE)
+        yield (f"frequency_response/{n_tap}",
+               lambda taps=taps: frequency_response(taps, FS, UPRATE))
+        yield (f"db2/{n_tap}", lambda response=response: db2(response, 90))
+        yield (f"frequency_response_points/{n_tap}",
+               lambda taps=taps: frequency_response_points(taps, FS,
+                                                           8192))
+
+    from filterdesigner.helper.stream import StreamFilter
+
+    data = rng.standard_normal(STREAM_SAMPLES)
+    chunks = np.array_split(data, STREAM_SAMPLES // STREAM_CHUNK)
+    for n_tap in RESPONSE_TAPS[:-1]:
+        stream_filter = StreamFilter(rng.standard_normal(n_tap))
+        yield (f"stream_filter/{n_tap}",
+               lambda stream_filter=stream_filter: list(
+                   stream_filter.stream(chunks)))
+
+    from filterdesigner.helper.linearphase import FoldedFilter
+
+    for n_tap in RESPONSE_TAPS[:2]:
+        taps = rng.standard_normal(n_tap)
+        folded_filter = FoldedFilter(taps + taps[::-1])
+        yield (f"folded_filter/{n_tap}",
+               lambda folded_filter=folded_filter: list(
+                   folded_filter.stream(chunks)))
+
+    from filterdesigner.filterbase import TYPE_BPF
+    from filterdesigner.filterdesign.design import (IIRSpec, METHOD_ELLIPTIC,
+                                                    design_filter)
+    from filterdesigner.helper.signal import sos_response_points
+    from filterdesigner.helper.stream import SOSStreamFilter
+
+    sos = design_filter(IIRSpec.create(TYPE_BPF, METHOD_ELLIPTIC, 8, FS,
+                                       [100, 110, 300, 310], 0.1, 80))
+    yield ("sos_response_points/8",
+           lambda: sos_response_points(sos, FS, 8192))
+    sos_filter = SOSStreamFilter(sos)
+    yield ("sos_stream_filter/8",
+           lambda: list(sos_filter.stream(chunks)))
+
+    from filterdesigner.helper.resample import Resampler
+
+    for up, down in RESAMPLE_RATES:
+        resampler = Resampler(rng.standard_normal(1025), up, down)
+        yield (f"resample/{up}_{down}",
+               lambda resampler=resampler: list(resampler.stream(chunks)))
+
+    from filterdesigner.helper.multichannel import filter_channels
+
+    channels = rng.standard_normal(CHANNELS_SHAPE)
+    taps = rng.standard_normal(1025)
+    for backend in ('thread', 'process'):
+        yield (f"filter_channels/{CHANNELS_SHAPE[0]}x{CHANNELS_SHAPE[1]}/"
+               f"{backend}",
+               lambda backend=backend: filter_channels(taps, channels,
+                                                       backend=backend))
+
+    stack = rng.standard_normal(BATCH_SHAPE)
+    for dtype in (np.float64, np.float32):
+        yield (f"frequency_response_batch/{BATCH_SHAPE[0]}x{BATCH_SHAPE[1]}/"
+               f"{np.dtype(dtype).name}",
+               lambda dtype=dtype: frequency_response_batch(
+                   stack, FS, 4096, dtype=dtype))
+
+
+def _widget():
+    """Return a FilterDesignWidget, whose designs are not kept on disk."""
+    from qtpy.QtWidgets import QApplication
+    from filterdesigner.filterdesign.filterwidget import FilterDesignWidget
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    widget = FilterDesignWidget()
+    widget.resize(1000, 700)
+    widget.check_preview.setChecked(False)
+    return app, widget
+
+
+def design_cases(widget, orders):
+    """Yield (name, func) of calc_filter of every FIR method but
+    UNCONVERGED_CASES."""
+    import scipy.signal  # noqa: F401, not to measure the import
+    from filterdesigner.filterdesign.design import TYPE_NAMES
+    from filterdesigner.filterdesign.designcache import design_cache
+
+    for idx, filter_class in enumerate(widget.fir_list):
+        widget.combo_fir.setCurrentIndex(idx)
+        filter_instance = widget.get_filter()
+        for type_name, filter_type in TYPE_NAMES.items():
+            for n_tap in orders:
+                def func(filter_instance=filter_instance,
+                         filter_type=filter_type, n_tap=n_tap):
+                    filter_instance.order_line.setText(str(n_tap))
+                    filter_instance.fs_line.setText(f"{FS:g}")
+                    # Longer filters are used for narrower transitions
+                    transition = TRANSITION_TAPS * FS / n_tap
+                    for line, freq in zip(
+                            [filter_instance.fre1_line,
+                             filter_instance.fre2_line,
+                             filter_instance.fre3_line,
+                             filter_instance.fre4_line],
+                            [100, 100 + transition, 300, 300 + transition]):
+                        line.setText(f"{freq:g}")
+                    design_cache.memory.clear()
+                    return filter_instance.calc_filter(filter_type)
+
+                name = f"calc_filter/{filter_class.name}/{type_name}/{n_tap}"
+                if name not in UNCONVERGED_CASES:
+                    yield name, func
+
+
+def plot_cases(app, widget):
+    """Yield (name, func) of plot_filter and the redraw of every view."""
+    from filterdesigner.filterdesign.filterwidget import (
+        ANALYSIS_MAG, ANALYSIS_PHASE, ANALYSIS_MAG_PHASE, ANALYSIS_IMPULSE)
+
+    views = {'magnitude': ANALYSIS_MAG, 'phase': ANALYSIS_PHASE,
+             'magnitude_phase': ANALYSIS_MAG_PHASE,
+             'impulse': ANALYSIS_IMPULSE}
+    widget.show()
+    app.processEvents()
+    rng = np.random.RandomState(0)
+    for n_tap in PLOT_TAPS:
+        taps = rng.standard_normal(n_tap)
+        for view_name, view in views.items():
+            def func(taps=taps, view=view):
+                widget.taps = taps
+                widget.fs = FS
+                widget.analysis_method_radio_group.button(view).setChecked(
+                    True)
+                widget.response_cache.clear()
+                widget.plot_filter()
+                widget.canvas.draw()
+
+            yield f"plot_filter/{view_name}/{n_tap}", func
+
+
+def run(select=None, quick=False, gui=True, log=print):
+    """Run the cases whose name contains select.
+
+    Returns
+    -------
+    dict
+        {case name: result of measure}
+    """
+    cases = response_cases()
+    if gui:
+        from itertools import chain
+        app, widget = _widget()
+        cases = chain(cases,
+                      design_cases(widget, QUICK_ORDERS if quick else ORDERS),
+                      plot_cases(app, widget))
+
+    results = {}
+    for name, func in cases:
+        if select and select not in name:
+            continue
+        results[name] = result = measure(func)
+        log(f"{name:48s} {result['time'] * 1e3:10.2f} ms "
+            f"{result['peak_bytes'] / 2 ** 20:9.2f} MB"
+            + (" (failed)" if result['error'] else ""))
+
+    if gui:
+        widget.design_worker.shutdown()
+        widget.close()
+    return results
+
+
+def compare(results, baseline, time_tolerance, memory_tolerance):
+    """Return the list of messages of the cases worse than baseline.
+
+    Cases which are not in the baseline are ignored and slowdowns below
+    MIN_TIME_DIFF are not reported. A case which failed in the baseline is
+    reported, since its time and memory measure the failure.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if base['error']:
+            regressions.append(
+                f"{name}: failed in the baseline ({base['error'].strip()})")
+            continue
+        if (result['time'] > base['time'] * (1 + time_tolerance) and
+                result['time'] - base['time'] > MIN_TIME_DIFF):
+            regressions.append(
+                f"{name}: {result['time'] * 1e3:.2f} ms > baseline "
+                f"{base['time'] * 1e3:.2f} ms (+{time_tolerance:.0%})")
+        if result['peak_bytes'] > base['peak_bytes'] * (1 + memory_tolerance):
+            regressions.append(
+                f"{name}: {result['peak_bytes']} bytes > baseline "
+                f"{base['peak_bytes']} bytes (+{memory_tolerance:.0%})")
+        if result['error']:
+            regressions.append(f"{name}: failed ({result['error']})")
+    return regressions
+
+
+def main(argv=None):
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(
+        prog='python -m filterdesigner.benchmarks.suite',
+        description="Benchmark the design, response and rendering paths.")
+    parser.add_argument('--select', '-k',
+                        help="run only the cases whose name contains this")
+    parser.add_argument('--quick', action='store_true',
+                        help=f"design up to {QUICK_ORDERS[-1]} taps only")
+    parser.add_argument('--no-gui', action='store_true',
+                        help="skip calc_filter and plot_filter")
+    parser.add_argument('--save', help="write the result to a json file")
+    parser.add_argument('--baseline', default=BASELINE_PATH,
+                        help="json file of a previous result")
+    parser.add_argument('--time-tolerance', type=float, default=0.5,
+                        help="allowed slowdown over the baseline")
+    parser.add_argument('--memory-tolerance', type=float, default=0.1,
+                        help="allowed increase of the peak memory")
+    args = parser.parse_args(argv)
+
+    results = run(args.select, args.quick, not args.no_gui)
+
+    if args.save:
+        failed = [name for name, result in results.items()
+                  if result['error']]
+        if failed:
+            for name in failed:
+                print(f"Failed: {name}: {results[name]['error'].strip()}")
+            print("The baseline is not saved with failed cases")
+            return 1
+        os.makedirs(osp.dirname(osp.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+        return 0
+
+    if not osp.exists(args.baseline):
+        print(f"No baseline at {args.baseline}")
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.time_tolerance,
+                              args.memory_tolerance)
+    for message in regressions:
+        print("Regression:", message)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
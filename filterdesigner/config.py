@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
 """Filter Designer configuration options"""
 
+# Standard library imports
+import os.path as osp
+
 
 class UserConfig(object):
     """"""
     dark_theme: bool = True
+    design_cache_dir: str = osp.join(osp.expanduser('~'), '.filterdesigner',
+                                     'design_cache')
+    design_cache_disk_bytes: int = 256 * 1024 * 1024
+    profile: bool = False
+    profile_memory: bool = False
 
     def __init__(self):
         """Init."""
@@ -12,7 +12,7 @@ TYPE_HPF = 1
 TYPE_BPF = 2
 TYPE_BSF = 3
 METHOD_IIR = 0
-METHOD_FIR = 0
+METHOD_FIR = 1
 
 
 class FilterBase(metaclass=ABCMeta):
@@ -33,10 +33,22 @@ class FilterBase(metaclass=ABCMeta):
     def get_ui_magnitude(self, filter_type):
         pass
 
+    @abstractmethod
+    def get_spec(self, filter_type):
+        pass
+
     @abstractmethod
     def calc_filter(self, filter_type):
         pass
 
+    def get_order_target(self):
+        """Return the targets of the minimum order search or None."""
+        return None
+
+    def set_order_result(self, result):
+        """Show the result of the minimum order search."""
+        pass
+
     @staticmethod
     def set_size_policy_when_hidden(widget, is_retain):
         policy = widget.sizePolicy()
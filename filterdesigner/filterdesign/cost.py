@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Computational cost and latency of designed filters."""
+
+# Standard library imports
+from typing import NamedTuple
+
+# Third party imports
+import numpy as np
+
+# Local import
+from filterdesigner.helper.linearphase import symmetry_of
+from filterdesigner.helper.signal import complex_response_points
+
+# Frequency points searched for the highest gain of an IIR design
+GROUP_DELAY_POINTS = 4096
+
+
+class DesignCost(NamedTuple):
+    """Cost of running a design, per output sample.
+
+    Attributes
+    ----------
+    mults_per_sample: float
+        multiplies per output sample
+    adds_per_sample: float
+        additions per output sample
+    n_coef: int
+        coefficients to store
+    n_state: int
+        delayed samples to store (per channel)
+    group_delay: float
+        group delay in output samples, at the frequency of the highest gain
+        for a nonlinear phase
+    fs: float
+        output sampling frequency
+    """
+    mults_per_sample: float
+    adds_per_sample: float
+    n_coef: int
+    n_state: int
+    group_delay: float
+    fs: float
+
+    @property
+    def group_delay_s(self):
+        """Group delay in seconds."""
+        return self.group_delay / self.fs if self.fs > 0 else float('nan')
+
+    def memory_bytes(self, itemsize=8):
+        """Return the bytes of the coefficients and the state."""
+        return (self.n_coef + self.n_state) * itemsize
+
+    def summary(self):
+        """Return the cost in one line of text."""
+        return (f"{self.mults_per_sample:g} mults, "
+                f"{self.adds_per_sample:g} adds / sample, "
+                f"{self.n_coef} coefs, {self.n_state} states, "
+                f"delay {self.group_delay:g} samples "
+                f"({self.group_delay_s * 1e3:.3g} ms)")
+
+
+def fir_cost(taps, fs):
+    """Return the cost of taps in direct form.
+
+    Linear-phase taps are folded as FoldedFilter does: a mirrored pair of
+    taps takes one multiply and only the half of the taps is stored.
+    """
+    taps = np.asarray(taps, dtype=float)
+    n_tap = len(taps)
+    if symmetry_of(taps) is None:
+        n_coef = n_tap
+        group_delay = _fir_group_delay(taps)
+    else:
+        n_coef = (n_tap + 1) // 2
+        group_delay = (n_tap - 1) / 2
+    # Every tap but the first is one addition, the pre-additions included
+    return DesignCost(float(n_coef), float(max(n_tap - 1, 0)), n_coef,
+                      max(n_tap - 1, 0), float(group_delay), float(fs))
+
+
+def _fir_group_delay(taps):
+    """Return the group delay of taps at the frequency of the highest
+    gain."""
+    response = complex_response_points(taps, GROUP_DELAY_POINTS)
+    ramp = complex_response_points(np.arange(len(taps)) * taps,
+                                   GROUP_DELAY_POINTS)
+    peak = np.argmax(np.abs(response))
+    return float(np.real(ramp[peak] / response[peak]))
+
+
+def sos_cost(sos, fs):
+    """Return the cost of second-order sections in transposed direct form II.
+
+    Only the nonzero coefficients of b0, b1, b2, a1 and a2 are multiplied
+    (a0 is 1), and every section keeps two delayed values.
+    """
+    sos = np.atleast_2d(np.asarray(sos, dtype=float))
+    coefs = np.count_nonzero(sos[:, [0, 1, 2, 4, 5]], axis=1)
+    n_mult = int(coefs.sum())
+    n_add = int(np.maximum(coefs - 1, 0).sum())
+    return DesignCost(float(n_mult), float(n_add), n_mult, 2 * len(sos),
+                      _sos_group_delay(sos), float(fs))
+
+
+def _sos_group_delay(sos):
+    """Return the group delay of sos at the frequency of the highest gain.
+
+    The group delay of a polynomial is Re(DTFT(k * c) / DTFT(c)), and the
+    delays of the numerators minus the denominators are summed over the
+    sections.
+    """
+    ramp = np.arange(3)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        num = complex_response_points(sos[:, :3], GROUP_DELAY_POINTS)
+        den = complex_response_points(sos[:, 3:], GROUP_DELAY_POINTS)
+        delay = np.real(
+            complex_response_points(ramp * sos[:, :3], GROUP_DELAY_POINTS)
+            / num -
+            complex_response_points(ramp * sos[:, 3:], GROUP_DELAY_POINTS)
+            / den).sum(axis=0)
+        peak = np.argmax(np.abs(np.prod(num / den, axis=0)))
+    return float(delay[peak])
+
+
+def design_cost(coefs, fs):
+    """Return the cost of taps (1-D) or second-order sections (2-D)."""
+    coefs = np.asarray(coefs)
+    if coefs.ndim == 2:
+        return sos_cost(coefs, fs)
+    return fir_cost(coefs, fs)
+
+
+class DesignResult(NamedTuple):
+    """Result of calc_filter, unpacked as (coefs, fs).
+
+    Attributes
+    ----------
+    coefs: ndarray
+        taps of an FIR design or (n_section, 6) second-order sections of an
+        IIR design
+    fs: float
+        sampling frequency
+    """
+    coefs: np.ndarray
+    fs: float
+
+    @property
+    def cost(self):
+        """Return the DesignCost of the design."""
+        return design_cost(self.coefs, self.fs)
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Headless filter design.
+
+The functions of this module never touch Qt, so filters can be designed in
+worker processes or on machines without a display.
+"""
+
+# Standard library imports
+from typing import NamedTuple, Tuple
+
+# Third party imports
+from numpy import ndarray
+
+# Local import
+from filterdesigner.filterbase import TYPE_LPF, TYPE_HPF, TYPE_BPF, TYPE_BSF
+
+METHOD_EQUIRIPPLE = 'Equiripple'
+METHOD_LEASTSQUARE = 'Least-squares'
+METHOD_BUTTERWORTH = 'Butterworth'
+METHOD_CHEBYSHEV1 = 'Chebyshev I'
+METHOD_CHEBYSHEV2 = 'Chebyshev II'
+METHOD_ELLIPTIC = 'Elliptic'
+FIR_METHODS = (METHOD_EQUIRIPPLE, METHOD_LEASTSQUARE)
+IIR_METHODS = (METHOD_BUTTERWORTH, METHOD_CHEBYSHEV1, METHOD_CHEBYSHEV2,
+               METHOD_ELLIPTIC)
+
+# Grid density of remez, as scipy.signal.remez
+DEFAULT_DENSITY = 16
+N_EDGE = {TYPE_LPF: 2, TYPE_HPF: 2, TYPE_BPF: 4, TYPE_BSF: 4}
+TYPE_NAMES = {'lowpass': TYPE_LPF, 'highpass': TYPE_HPF,
+              'bandpass': TYPE_BPF, 'bandstop': TYPE_BSF}
+# Desired gain of each band
+BAND_GAINS = {TYPE_LPF: [1, 0],
+              TYPE_HPF: [0, 1],
+              TYPE_BPF: [0, 1, 0],
+              TYPE_BSF: [1, 0, 1]}
+
+
+class FilterSpec(NamedTuple):
+    """Immutable and hashable description of a filter design.
+
+    Attributes
+    ----------
+    filter_type: int
+        [TYPE_LPF, TYPE_HPF, TYPE_BPF, TYPE_BSF]
+    method: str
+        Name of the design method (ex. METHOD_EQUIRIPPLE)
+    n_tap: int
+        Number of taps (the value of "Specify order")
+    fs: float
+        sampling frequency
+    freqs: tuple of float
+        Band edges in ascending order (2 for LPF/HPF, 4 for BPF/BSF)
+    weights: tuple of float
+        Weight of each band (2 for LPF/HPF, 3 for BPF/BSF)
+    density: int
+        Grid density of remez
+    """
+    filter_type: int
+    method: str
+    n_tap: int
+    fs: float
+    freqs: Tuple[float, ...]
+    weights: Tuple[float, ...]
+    density: int = DEFAULT_DENSITY
+
+    @classmethod
+    def create(cls, filter_type, method, n_tap, fs, freqs, weights,
+               density=DEFAULT_DENSITY):
+        """Create FilterSpec keeping only the edges and weights in use.
+
+        Every parameter is converted to a plain python type, so two specs
+        built from the same values are always equal and have the same hash.
+        """
+        n_edge = N_EDGE[filter_type]
+        return cls(int(filter_type), str(method), int(n_tap), float(fs),
+                   tuple(float(f) for f in freqs[:n_edge]),
+                   tuple(float(w) for w in weights[:n_edge // 2 + 1]),
+                   int(density))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create FilterSpec from a dict such as a line of a json file.
+
+        filter_type can be given either as TYPE_* or as a key of TYPE_NAMES.
+        Keys which are not a field of FilterSpec are ignored.
+        """
+        filter_type = data['filter_type']
+        if isinstance(filter_type, str):
+            try:
+                filter_type = TYPE_NAMES[filter_type.lower()]
+            except KeyError:
+                raise ValueError(f"Unknown filter type: {filter_type}")
+
+        return cls.create(filter_type, data['method'], data['n_tap'],
+                          data['fs'], data['freqs'], data['weights'],
+                          data.get('density', DEFAULT_DENSITY))
+
+    def to_dict(self):
+        """Return a json serializable dict which from_dict accepts."""
+        data = self._asdict()
+        data['freqs'] = list(self.freqs)
+        data['weights'] = list(self.weights)
+        return data
+
+    def validate(self):
+        """Raise ValueError if the specification can not be designed."""
+        if self.filter_type not in N_EDGE:
+            raise ValueError(f"Unknown filter type: {self.filter_type}")
+        if self.method not in FIR_METHODS:
+            raise ValueError(f"Unknown design method: {self.method}")
+        n_edge = N_EDGE[self.filter_type]
+        if len(self.freqs) != n_edge:
+            raise ValueError(f"{n_edge} band edges are required")
+        if len(self.weights) != n_edge // 2 + 1:
+            raise ValueError(f"{n_edge // 2 + 1} weights are required")
+        if self.n_tap < 1:
+            raise ValueError("Order must be a positive integer")
+        if self.fs <= 0:
+            raise ValueError("fs must be positive")
+        if not all(0 < f1 < f2 < self.fs / 2
+                   for f1, f2 in zip(self.freqs, self.freqs[1:])):
+            raise ValueError("Band edges must be ascending in (0, fs/2)")
+
+
+class IIRSpec(NamedTuple):
+    """Immutable and hashable description of an IIR filter design.
+
+    Attributes
+    ----------
+    filter_type: int
+        [TYPE_LPF, TYPE_HPF, TYPE_BPF, TYPE_BSF]
+    method: str
+        Name of the design method (ex. METHOD_ELLIPTIC)
+    order: int
+        Order of the filter, or 0 for the minimum order which meets
+        ripple_db and atten_db
+    fs: float
+        sampling frequency
+    freqs: tuple of float
+        Band edges in ascending order, as FilterSpec.freqs
+    ripple_db: float
+        Maximum loss in the passbands in dB
+    atten_db: float
+        Minimum attenuation of the stopbands in dB
+    """
+    filter_type: int
+    method: str
+    order: int
+    fs: float
+    freqs: Tuple[float, ...]
+    ripple_db: float = 1.0
+    atten_db: float = 60.0
+
+    @classmethod
+    def create(cls, filter_type, method, order, fs, freqs, ripple_db=1.0,
+               atten_db=60.0):
+        """Create IIRSpec keeping only the edges in use."""
+        n_edge = N_EDGE[filter_type]
+        return cls(int(filter_type), str(method), int(order), float(fs),
+                   tuple(float(f) for f in freqs[:n_edge]),
+                   float(ripple_db), float(atten_db))
+
+    def validate(self):
+        """Raise ValueError if the specification can not be designed."""
+        if self.filter_type not in N_EDGE:
+            raise ValueError(f"Unknown filter type: {self.filter_type}")
+        if self.method not in IIR_METHODS:
+            raise ValueError(f"Unknown design method: {self.method}")
+        n_edge = N_EDGE[self.filter_type]
+        if len(self.freqs) != n_edge:
+            raise ValueError(f"{n_edge} band edges are required")
+        if self.order < 0:
+            raise ValueError("Order must be a positive integer")
+        if self.fs <= 0:
+            raise ValueError("fs must be positive")
+        if not all(0 < f1 < f2 < self.fs / 2
+                   for f1, f2 in zip(self.freqs, self.freqs[1:])):
+            raise ValueError("Band edges must be ascending in (0, fs/2)")
+        if not 0 < self.ripple_db < self.atten_db:
+            raise ValueError("Apass must be positive and less than Astop")
+
+
+class IIRDesign(NamedTuple):
+    """Result of design_iir.
+
+    Attributes
+    ----------
+    spec: IIRSpec
+        designed spec, whose order is the minimum order if it was 0
+    sos: ndarray
+        (n_section, 6) second-order sections
+    """
+    spec: IIRSpec
+    sos: ndarray
+
+
+def _bands(spec):
+    """Return band edges including 0 and fs/2."""
+    return [0, *spec.freqs, spec.fs / 2]
+
+
+def band_ranges(spec):
+    """Return the passbands and the stopbands of spec.
+
+    Returns
+    -------
+    (list, list)
+        [(start, stop), ...] of passbands, [(start, stop), ...] of stopbands
+    """
+    edges = _bands(spec)
+    passbands = []
+    stopbands = []
+    for idx, gain in enumerate(BAND_GAINS[spec.filter_type]):
+        band = (edges[2 * idx], edges[2 * idx + 1])
+        if gain:
+            passbands.append(band)
+        else:
+            stopbands.append(band)
+    return passbands, stopbands
+
+
+def _design_equiripple(spec):
+    """Calculate filter coefficient using remez."""
+    from scipy.signal import remez  # scipy.signal is slow to import
+
+    desired = BAND_GAINS[spec.filter_type]
+    return remez(spec.n_tap, _bands(spec), desired,
+                 weight=list(spec.weights), grid_density=spec.density,
+                 fs=spec.fs)
+
+
+def _design_leastsquare(spec):
+    """Calculate filter coefficient using firls."""
+    from scipy.signal import firls  # scipy.signal is slow to import
+
+    desired = {TYPE_LPF: [1, 1, 0, 0],
+               TYPE_HPF: [0, 0, 1, 1],
+               TYPE_BPF: [0, 0, 1, 1, 0, 0],
+               TYPE_BSF: [1, 1, 0, 0, 1, 1]}[spec.filter_type]
+    return firls(spec.n_tap, _bands(spec), desired,
+                 weight=list(spec.weights), fs=spec.fs)
+
+
+def _iir_edges(spec):
+    """Return the passband and the stopband edges of an IIRSpec.
+
+    Returns
+    -------
+    (float or list, float or list)
+        wp, ws as accepted by scipy.signal.iirdesign
+    """
+    f = spec.freqs
+    if spec.filter_type == TYPE_LPF:
+        return f[0], f[1]
+    if spec.filter_type == TYPE_HPF:
+        return f[1], f[0]
+    if spec.filter_type == TYPE_BPF:
+        return [f[1], f[2]], [f[0], f[3]]
+    return [f[0], f[3]], [f[1], f[2]]
+
+
+def iir_order(spec):
+    """Return the minimum order of spec and its natural frequencies.
+
+    Returns
+    -------
+    (int, float or ndarray)
+        order, critical frequencies for the design function
+    """
+    from scipy import signal  # scipy.signal is slow to import
+
+    order_func = {METHOD_BUTTERWORTH: signal.buttord,
+                  METHOD_CHEBYSHEV1: signal.cheb1ord,
+                  METHOD_CHEBYSHEV2: signal.cheb2ord,
+                  METHOD_ELLIPTIC: signal.ellipord}[spec.method]
+    wp, ws = _iir_edges(spec)
+    order, wn = order_func(wp, ws, spec.ripple_db, spec.atten_db,
+                           fs=spec.fs)
+    return int(order), wn
+
+
+def _iir_design(spec):
+    """Calculate second-order sections of an IIRSpec with their order.
+
+    With a given order, the critical frequencies are the passband edges
+    (the -3 dB points for Butterworth), or the stopband edges for
+    Chebyshev II. With order 0, the minimum order and its critical
+    frequencies are found by the order function of the method.
+
+    Returns
+    -------
+    IIRDesign
+    """
+    from scipy import signal  # scipy.signal is slow to import
+
+    wp, ws = _iir_edges(spec)
+    if spec.order == 0:
+        order, wn = iir_order(spec)
+    else:
+        order = spec.order
+        wn = ws if spec.method == METHOD_CHEBYSHEV2 else wp
+
+    btype = {TYPE_LPF: 'lowpass', TYPE_HPF: 'highpass',
+             TYPE_BPF: 'bandpass', TYPE_BSF: 'bandstop'}[spec.filter_type]
+    kwargs = dict(btype=btype, output='sos', fs=spec.fs)
+    if spec.method == METHOD_BUTTERWORTH:
+        sos = signal.butter(order, wn, **kwargs)
+    elif spec.method == METHOD_CHEBYSHEV1:
+        sos = signal.cheby1(order, spec.ripple_db, wn, **kwargs)
+    elif spec.method == METHOD_CHEBYSHEV2:
+        sos = signal.cheby2(order, spec.atten_db, wn, **kwargs)
+    else:
+        sos = signal.ellip(order, spec.ripple_db, spec.atten_db, wn,
+                           **kwargs)
+    return IIRDesign(spec._replace(order=order), sos)
+
+
+def _design_iir(spec):
+    """Calculate second-order sections of an IIRSpec."""
+    return _iir_design(spec).sos
+
+
+DESIGN_METHODS = {METHOD_EQUIRIPPLE: _design_equiripple,
+                  METHOD_LEASTSQUARE: _design_leastsquare,
+                  METHOD_BUTTERWORTH: _design_iir,
+                  METHOD_CHEBYSHEV1: _design_iir,
+                  METHOD_CHEBYSHEV2: _design_iir,
+                  METHOD_ELLIPTIC: _design_iir}
+
+
+def design_filter(spec: FilterSpec) -> ndarray:
+    """Design filter taps from spec without any UI.
+
+    Parameters
+    ----------
+    spec: FilterSpec or IIRSpec
+
+    Returns
+    -------
+    ndarray
+        taps, or (n_section, 6) second-order sections of an IIRSpec
+    """
+    spec.validate()
+    return DESIGN_METHODS[spec.method](spec)
+
+
+def design_iir(spec: IIRSpec) -> IIRDesign:
+    """Design second-order sections of spec with their order.
+
+    The minimum order of order 0 is found by the design itself, so it is
+    returned without being searched again.
+
+    Returns
+    -------
+    IIRDesign
+    """
+    spec.validate()
+    return _iir_design(spec)
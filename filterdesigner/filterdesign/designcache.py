@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Cache of designed taps."""
+
+# Standard library imports
+import hashlib
+import os
+import os.path as osp
+from collections import OrderedDict
+from functools import lru_cache
+
+# Third party imports
+import numpy as np
+
+# Local import
+from filterdesigner.filterdesign.design import design_filter
+from filterdesigner.helper.cache import LRUCache
+
+
+@lru_cache(maxsize=None)
+def scipy_version():
+    """Return the version of scipy, importing it on the first call."""
+    import scipy
+    return scipy.__version__
+
+
+def spec_key(spec):
+    """Return the cache key of spec.
+
+    The version of scipy is a part of the key because the result of remez
+    and firls can change between versions.
+    """
+    text = repr((scipy_version(), type(spec).__name__, tuple(spec)))
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+class DesignCache(object):
+    """LRU cache of designed taps, optionally persisted on disk.
+
+    Taps are kept in memory up to max_bytes. If cache_dir is set, every
+    design is also stored as a compressed npz file in a shard directory
+    named after the first two characters of its key, and the least recently
+    used files are removed while the total size exceeds max_disk_bytes.
+    The files on disk are scanned once, on the first use of cache_dir, and
+    their sizes are kept up to date afterwards, so a put does not depend on
+    the number of cached files.
+
+    Parameters
+    ----------
+    max_bytes: int
+    cache_dir: str, optional
+        (the default is None, None이면 disk에 저장 안함)
+    max_disk_bytes: int
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, cache_dir=None,
+                 max_disk_bytes=256 * 1024 * 1024):
+        self.memory = LRUCache(max_bytes)
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+
+        # path: size of the files of _index_dir, the least recently used
+        # first
+        self._index = OrderedDict()
+        self._index_dir = None
+        self._disk_bytes = 0
+
+    def _path(self, key):
+        return osp.join(self.cache_dir, key[:2], key + '.npz')
+
+    def get(self, spec):
+        """Return the cached taps of spec or None."""
+        key = spec_key(spec)
+        taps = self.memory.get(key)
+        if taps is not None or self.cache_dir is None:
+            return taps
+
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                taps = data['taps']
+            os.utime(path)  # mark as recently used
+        except (OSError, KeyError, ValueError):
+            return None
+        if self._index_dir == self.cache_dir and path in self._index:
+            self._index.move_to_end(path)
+
+        self.memory.put(key, taps)
+        return taps
+
+    def put(self, spec, taps):
+        """Cache taps of spec."""
+        key = spec_key(spec)
+        self.memory.put(key, taps)
+        if self.cache_dir is None:
+            return
+
+        path = self._path(key)
+        try:
+            os.makedirs(osp.dirname(path), exist_ok=True)
+            path_tmp = path + f'.{os.getpid()}.tmp'
+            with open(path_tmp, 'wb') as f:
+                np.savez_compressed(f, taps=taps)
+            os.replace(path_tmp, path)
+            self._add_to_index(path, os.stat(path).st_size)
+            self.trim_disk()
+        except OSError:
+            pass  # The disk cache is optional
+
+    def _scan_disk(self):
+        """Build the index of the files of cache_dir if it is not built."""
+        if self._index_dir == self.cache_dir:
+            return
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith('.npz'):
+                    path = osp.join(root, name)
+                    stat = os.stat(path)
+                    files.append((stat.st_mtime, stat.st_size, path))
+
+        self._index = OrderedDict((path, size)
+                                  for _, size, path in sorted(files))
+        self._index_dir = self.cache_dir
+        self._disk_bytes = sum(self._index.values())
+
+    def _add_to_index(self, path, size):
+        """Record a written file as the most recently used."""
+        self._scan_disk()
+        self._disk_bytes += size - self._index.pop(path, 0)
+        self._index[path] = size
+
+    def trim_disk(self):
+        """Remove the least recently used files over max_disk_bytes."""
+        self._scan_disk()
+        while self._index and self._disk_bytes > self.max_disk_bytes:
+            path, size = self._index.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Removed by another process
+
+    def clear(self):
+        """Remove every cached design in memory and on disk."""
+        self.memory.clear()
+        if self.cache_dir is None:
+            return
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith('.npz'):
+                    os.remove(osp.join(root, name))
+        self._index.clear()
+        self._index_dir = self.cache_dir
+        self._disk_bytes = 0
+
+
+design_cache = DesignCache()
+
+
+def cached_design_filter(spec, cache=None):
+    """Design taps of spec or return them from cache.
+
+    Parameters
+    ----------
+    spec: FilterSpec
+    cache: DesignCache, optional
+        (the default is None, None이면 design_cache 사용)
+
+    Returns
+    -------
+    ndarray
+        taps
+    """
+    if cache is None:
+        cache = design_cache
+
+    taps = cache.get(spec)
+    if taps is None:
+        taps = design_filter(spec)
+        cache.put(spec, taps)
+    return taps
@@ -9,21 +9,38 @@ import warnings
 import sip
 
 # Third party imports
-from numpy import ndarray, zeros
-from matplotlib.pyplot import Figure
+from numpy import (ndarray, arange, zeros, empty, linspace, floor, ceil,
+                   minimum, maximum)
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
 from matplotlib.backends.backend_qt5agg import (FigureCanvasQTAgg,
                                                 NavigationToolbar2QT)
-from qtpy.QtCore import Slot
+from qtpy.QtCore import Signal, Slot, QTimer
 from qtpy.QtWidgets import (QVBoxLayout, QHBoxLayout, QWidget, QGroupBox,
                             QLabel, QRadioButton, QPushButton, QComboBox,
-                            QButtonGroup, QMessageBox)
+                            QButtonGroup, QMessageBox, QProgressBar,
+                            QCheckBox, QLineEdit)
 
 # Local import
 from filterdesigner.config import UserConfig as CONF
 from filterdesigner.filterbase import (TYPE_LPF, TYPE_HPF, TYPE_BPF, TYPE_BSF,
                                        METHOD_IIR, METHOD_FIR)
+from filterdesigner.filterdesign.cost import design_cost
+from filterdesigner.filterdesign.design import (FilterSpec, IIRSpec,
+                                                IIRDesign, design_iir)
+from filterdesigner.filterdesign.designcache import design_cache
 from filterdesigner.filterdesign.fir import EquiRipple, LeastSquare
-from filterdesigner.helper.signal import frequency_response
+from filterdesigner.filterdesign.iir import (Butterworth, Chebyshev1,
+                                             Chebyshev2, Elliptic)
+from filterdesigner.filterdesign.sweepwidget import SweepDialog
+from filterdesigner.filterdesign.minorder import OrderSearchResult
+from filterdesigner.filterdesign.worker import DesignWorker
+from filterdesigner.helper.cache import LRUCache, array_hash
+from filterdesigner.helper.profiler import profiler
+from filterdesigner.helper.signal import (frequency_response_points,
+                                          minmax_envelope,
+                                          sos_response_points)
+from filterdesigner.helper.stream import sos_impulse_response
 
 
 ANALYSIS_MAG = 0
@@ -31,23 +48,55 @@ ANALYSIS_PHASE = 1
 ANALYSIS_MAG_PHASE = 2
 ANALYSIS_IMPULSE = 3
 
+# Number of frequency points evaluated per horizontal pixel of the canvas
+RESPONSE_POINTS_PER_PIXEL = 8
+RESPONSE_CACHE_BYTES = 256 * 1024 * 1024
+
+# Live preview waits for the edits to stop and designs with a coarse grid
+PREVIEW_DELAY_MS = 300
+PREVIEW_DENSITY = 4
+
+# Markers of the impulse response are hidden above this number of taps
+IMPULSE_MARKER_MAX_TAP = 256
+
+
+class ProfiledCanvas(FigureCanvasQTAgg):
+    """FigureCanvasQTAgg which records the span of every draw."""
+
+    def draw(self):
+        """Override draw of FigureCanvasQTAgg."""
+        with profiler.span('plot.draw'):
+            super(ProfiledCanvas, self).draw()
+
 
 class FilterDesignWidget(QWidget):
     """UI for FilterDesign Window."""
 
+    # Summary of the spans of the last design or plot, if profiling
+    sig_profile = Signal(str)
+
     def __init__(self, parent=None):
         super(FilterDesignWidget, self).__init__(parent)
 
-        self.fir_list = [EquiRipple(self), LeastSquare(self)]
-        self.iir_list = []
+        # Filter classes are instantiated by get_filter on the first use
+        self.fir_list = [EquiRipple, LeastSquare]
+        self.iir_list = [Butterworth, Chebyshev1, Chebyshev2, Elliptic]
+        self.filter_instances = {}
 
         # filter result
+        # taps is the impulse response of sos for an IIR design
         self.taps: ndarray = zeros(1)
+        self.sos: ndarray = None
         self.fs: float = 0
+        self.response_cache = LRUCache(RESPONSE_CACHE_BYTES)
+        self.curves = {}  # Line2D: (x, y) before the envelope
+
+        profiler.set_enabled(CONF.profile, CONF.profile_memory)
+        self.profile_since = 0.0
 
         # Analysis Method
         self.analysis_method_radio_group = QButtonGroup(self)
-        self.analysis_method_radio_group.buttonClicked.connect(self.plot_filter)
+        self.analysis_method_radio_group.buttonClicked.connect(self.replot)
         self.radio_mag = QRadioButton("Magnitude Response", self)
         self.radio_phase = QRadioButton("Phase Response", self)
         self.radio_mag_phase = QRadioButton("Magnitude+Phase  Responses", self)
@@ -65,7 +114,7 @@ class FilterDesignWidget(QWidget):
         self.fig = Figure()
         self.ax = self.fig.add_subplot(111)
         self.ax_twin = self.ax.twinx()
-        self.canvas = FigureCanvasQTAgg(self.fig)
+        self.canvas = ProfiledCanvas(self.fig)
         self.canvas_toolbar = NavigationToolbar2QT(self.canvas, self, True)
 
         if CONF.dark_theme:
@@ -83,11 +132,16 @@ class FilterDesignWidget(QWidget):
 
         self.init_plot()
 
+        # Cost of the design, next to the plot
+        self.cost_label = QLabel("", self)
+        self.cost_label.setWordWrap(True)
+
         # Units
         unit_layout = QHBoxLayout()
         unit_layout.addWidget(QLabel("Units", self))
         self.freq_unit_combo = QComboBox(self)
         self.freq_unit_combo.addItems(['Hz', 'Khz', 'Mhz', 'Ghz'])
+        self.freq_unit_combo.currentIndexChanged.connect(self.replot)
         unit_layout.addWidget(self.freq_unit_combo)
 
         # Radio Button for Filter Type
@@ -110,14 +164,42 @@ class FilterDesignWidget(QWidget):
         self.method_radio_group.addButton(self.radio_fir, METHOD_FIR)
         self.combo_iir = QComboBox()
         self.combo_fir = QComboBox()
-
-        self.radio_iir.setDisabled(True)
-        self.combo_iir.setVisible(False)
+        self.method_radio_group.buttonClicked.connect(self.change_ui)
 
         # Push Button for Filter Design
         self.push_design = QPushButton("Filter Design", self)
         self.push_design.clicked.connect(self.push_filter_design)
 
+        # Background design
+        self.design_worker = DesignWorker(self)
+        self.design_worker.sig_finished.connect(self.design_finished)
+        self.design_worker.sig_failed.connect(self.design_failed)
+        self.design_worker.sig_busy.connect(self.set_design_busy)
+        self.design_worker.start()  # warm up before the first design
+        self.design_progress = QProgressBar(self)
+        self.design_progress.setRange(0, 0)  # busy indicator
+        self.design_progress.setTextVisible(False)
+        self.design_progress.setVisible(False)
+        self.push_cancel = QPushButton("Cancel", self)
+        self.push_cancel.clicked.connect(self.cancel_design)
+        self.push_cancel.setEnabled(False)
+
+        # Live preview
+        self.is_preview = False
+        self.refine_spec = None
+        self.design_owner = None  # filter instance of the submitted design
+        self.check_preview = QCheckBox("Live preview", self)
+        self.check_preview.toggled.connect(self.schedule_preview)
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DELAY_MS)
+        self.preview_timer.timeout.connect(self.preview_filter_design)
+        self.type_radio_group.buttonClicked.connect(self.schedule_preview)
+
+        # Push Button for Parameter Sweep
+        self.push_sweep = QPushButton("Parameter Sweep", self)
+        self.push_sweep.clicked.connect(self.show_sweep)
+
         # GroupBox
         self.group_order = QGroupBox(self)
         layout = QVBoxLayout()
@@ -151,7 +233,7 @@ class FilterDesignWidget(QWidget):
 
         base_layout.addLayout(upper_hbox)
         base_layout.addLayout(bottom_hbox)
-        base_layout.addWidget(self.push_design)
+        base_layout.addLayout(self.design_layout())
 
         upper_hbox.addWidget(self.group_analysis_method())
         upper_hbox.addWidget(self.group_figure())
@@ -163,16 +245,33 @@ class FilterDesignWidget(QWidget):
         # Add Filter to Combobox
         for fir in self.fir_list:
             self.combo_fir.addItem(fir.name)
+        for iir in self.iir_list:
+            self.combo_iir.addItem(iir.name)
 
         self.combo_fir.currentIndexChanged.connect(self.change_ui)
+        self.combo_iir.currentIndexChanged.connect(self.change_ui)
         self.change_ui()
 
     def clear_axes(self):
-        """Clear axes of canvas."""
-        self.ax.cla()
-        self.ax_twin.cla()
-        self.ax_twin.set_frame_on(False)
-        self.ax_twin.get_yaxis().set_visible(False)
+        """Hide every line of canvas."""
+        self.curves = {}
+        for line in self.response_lines:
+            line.set_visible(False)
+        self.set_impulse_visible(False)
+        self.set_twin_visible(False)
+
+    def set_twin_visible(self, visible):
+        """Show or hide the right axis used by Magnitude+Phase."""
+        self.ax_twin.set_frame_on(visible)
+        self.ax_twin.get_yaxis().set_visible(visible)
+        # For display the coordinate of self.ax in self.canvas_toolbar
+        self.ax_twin.set_zorder(2 if visible else -1)
+
+    def set_impulse_visible(self, visible):
+        """Show or hide the artists of the impulse response."""
+        self.impulse_marker.set_visible(visible)
+        self.impulse_stems.set_visible(visible)
+        self.impulse_base.set_visible(visible)
 
     def select_filter_type(self):
         """Change UI based on filter type in type_radio_group."""
@@ -181,10 +280,55 @@ class FilterDesignWidget(QWidget):
         filter_type = self.type_radio_group.checkedId()
         filter_instance.set_ui_options(filter_type)
 
+    def connect_preview_inputs(self):
+        """Update the live preview whenever an input of the filter changes."""
+        for group in (self.group_order, self.group_options,
+                      self.group_fre_spec, self.group_mag_spec):
+            for line in group.findChildren(QLineEdit):
+                line.textEdited.connect(self.schedule_preview)
+            for check in group.findChildren(QCheckBox):
+                check.toggled.connect(self.schedule_preview)
+
     def init_plot(self):
-        """Init Figure of filter widget."""
+        """Init Figure of filter widget.
+
+        The lines are created once and updated with set_data by plot_filter.
+        """
+        self.line_mag, = self.ax.plot([], [])
+        self.line_phase, = self.ax.plot([], [])
+        self.line_twin_phase, = self.ax_twin.plot([], [], '-g')
+        self.response_lines = [self.line_mag, self.line_phase,
+                               self.line_twin_phase]
+        self.impulse_marker, = self.ax.plot([], [], 'C0o')
+        self.impulse_stems = LineCollection([], colors='C0')
+        self.ax.add_collection(self.impulse_stems)
+        self.impulse_base, = self.ax.plot([], [], 'C3-')
+
+        color = self.line_twin_phase.get_color()
+        self.ax_twin.yaxis.label.set_color(color)
+        self.ax_twin.tick_params(axis='y', colors=color)
+        self.ax_twin.spines["right"].set_edgecolor(color)
+        self.ax_twin.set_ylabel("Phase [rad]")
+        self.ax_twin.grid(False)
+
+        self.layout_key = None
+        self.layout_timer = QTimer(self)
+        self.layout_timer.setSingleShot(True)
+        self.layout_timer.setInterval(100)
+        self.layout_timer.timeout.connect(self.update_layout)
+        self.ax.callbacks.connect('xlim_changed', self.update_envelope)
+        self.canvas.mpl_connect('draw_event', self.schedule_profile)
+
         self.clear_axes()
-        self.fig.tight_layout()
+        self.update_layout()
+
+    @Slot()
+    def update_layout(self):
+        """Fit the axes into the figure and redraw it."""
+        with profiler.span('plot.tight_layout'), warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            self.fig.tight_layout()
+        self.update_envelope()
         self.fig.canvas.draw_idle()
 
     def group_analysis_method(self):
@@ -204,11 +348,23 @@ class FilterDesignWidget(QWidget):
 
         return group
 
+    def design_layout(self):
+        """Generate layout for design button and busy indicator."""
+        hbox = QHBoxLayout()
+        hbox.addWidget(self.check_preview)
+        hbox.addWidget(self.push_design)
+        hbox.addWidget(self.design_progress)
+        hbox.addWidget(self.push_cancel)
+        hbox.addWidget(self.push_sweep)
+
+        return hbox
+
     def group_figure(self):
         """Generate GroupBox for figure."""
         vbox = QVBoxLayout()
         vbox.addWidget(self.canvas)
         vbox.addWidget(self.canvas_toolbar)
+        vbox.addWidget(self.cost_label)
 
         group = QGroupBox(self)
         group.setLayout(vbox)
@@ -288,80 +444,336 @@ class FilterDesignWidget(QWidget):
 
     @Slot()
     def push_filter_design(self):
-        """Design filter tap and plot filter."""
+        """Submit filter design of the current specification."""
+        self.preview_timer.stop()
+        with profiler.span('push_filter_design'):
+            self.submit_design(preview=False)
+
+    @Slot()
+    def schedule_preview(self):
+        """Restart the debounce timer of the live preview."""
+        if not self.check_preview.isChecked():
+            return
+        self.cancel_design()
+        self.preview_timer.start()
+
+    @Slot()
+    def preview_filter_design(self):
+        """Design at a coarse grid density first, then at the requested."""
+        self.submit_design(preview=True)
+
+    def shutdown(self):
+        """Stop the live preview and the design processes."""
+        self.preview_timer.stop()
+        self.refine_spec = None
+        self.design_worker.shutdown()
+
+    @Slot()
+    def cancel_design(self):
+        """Stop the running design and the pending refinement."""
+        self.refine_spec = None
+        self.design_worker.cancel()
+
+    def submit_design(self, preview):
+        """Submit filter design of the current specification.
+
+        Parameters
+        ----------
+        preview: bool
+            If True, errors are not reported and remez runs with a grid
+            density of PREVIEW_DENSITY before the requested density.
+        """
+        self.is_preview = preview
+        self.refine_spec = None
+        self.profile_since = profiler.now()
 
         filter_instance = self.get_filter()
+        self.design_owner = filter_instance
 
         filter_type = self.type_radio_group.checkedId()
 
-        self.clear_axes()
         try:
-            self.taps, self.fs = filter_instance.calc_filter(filter_type)
-            self.plot_filter()
+            with profiler.span('design.spec'):
+                spec = filter_instance.get_spec(filter_type)
+                spec.validate()
+                target = filter_instance.get_order_target()
+        except ValueError as e:
+            if not preview:
+                self.design_failed(0, str(e))
+            return
+
+        if target is not None:
+            self.design_worker.submit_search(spec, *target)
+            return
+        if isinstance(spec, IIRSpec) and spec.order == 0:
+            # The minimum order comes with the sections, not from the cache
+            self.design_worker.submit(spec, design_iir)
+            return
+
+        with profiler.span('design.cache_get'):
+            taps = design_cache.get(spec)
+        if taps is not None:
+            self.design_worker.cancel()
+            self.design_finished(0, spec, taps, cached=True)
+            return
+
+        if preview and isinstance(spec, FilterSpec):
+            coarse = spec._replace(density=min(spec.density,
+                                               PREVIEW_DENSITY))
+            if coarse != spec:
+                self.refine_spec = spec
+                spec = coarse
+
+        self.design_worker.submit(spec)
+
+    @Slot()
+    def show_sweep(self):
+        """Open the parameter sweep around the current specification."""
+        filter_type = self.type_radio_group.checkedId()
+        try:
+            spec = self.get_filter().get_spec(filter_type)
+            spec.validate()
         except ValueError as e:
-            self.taps = zeros(1)
-            self.fs = 0
             QMessageBox.warning(self, "Error", str(e))
+            return
+
+        dialog = SweepDialog(spec, self)
+        dialog.show()
+
+    @Slot(int, object, object)
+    def design_finished(self, job_id, spec, taps, cached=False):
+        """Plot the designed filter.
 
-        self.fig.tight_layout()
+        taps is an OrderSearchResult if the minimum order was searched, or
+        an IIRDesign of an IIRSpec of the minimum order. The order is shown
+        by the filter instance which submitted the design, even if the
+        method was changed meanwhile.
+        taps are not stored again if they came from the cache (cached).
+        """
+        if isinstance(taps, OrderSearchResult):
+            self.design_owner.set_order_result(taps)
+            spec, taps = taps.spec, taps.taps
+        elif isinstance(taps, IIRDesign):
+            self.design_owner.set_order_result(taps.spec)
+            taps = taps.sos
+            cached = True  # order 0 is never read from the cache
+        if not cached:
+            with profiler.span('design.cache_put'):
+                design_cache.put(spec, taps)
+        if isinstance(spec, IIRSpec):
+            self.sos = taps
+            taps = sos_impulse_response(taps)
+        else:
+            self.sos = None
+        self.taps = taps
+        self.fs = spec.fs
+        self.cost_label.setText(
+            "Cost: " + design_cost(taps if self.sos is None else self.sos,
+                                   self.fs).summary())
+        self.plot_filter()
+
+        if self.refine_spec is not None:
+            refine_spec, self.refine_spec = self.refine_spec, None
+            self.design_worker.submit(refine_spec)
+
+    @Slot(int, str)
+    def design_failed(self, job_id, message):
+        """Clear the plot and show the error of the design.
+
+        The live preview does not show a message box, since the
+        specification is often incomplete while it is being typed.
+        """
+        if self.refine_spec is not None:
+            # remez may not converge on the coarse grid only
+            refine_spec, self.refine_spec = self.refine_spec, None
+            self.design_worker.submit(refine_spec)
+            return
+
+        self.taps = zeros(1)
+        self.sos = None
+        self.fs = 0
+        self.cost_label.setText("")
+        self.clear_axes()
         self.fig.canvas.draw_idle()
+        if not self.is_preview:
+            QMessageBox.warning(self, "Error", message)
+
+    @Slot(bool)
+    def set_design_busy(self, busy):
+        """Show the busy indicator while a design job is running."""
+        self.design_progress.setVisible(busy)
+        self.push_cancel.setEnabled(busy)
 
     def plot_filter(self):
         """Plot the filter response."""
-        if (isinstance(self.taps, ndarray) is not True) or \
-           (len(self.taps) < 2):
-            return
+        with profiler.span('plot_filter'):
+            if (isinstance(self.taps, ndarray) is not True) or \
+               (len(self.taps) < 2):
+                return
+
+            self.clear_axes()
+
+            unit = self.freq_unit_combo.itemText(
+                self.freq_unit_combo.currentIndex())
+
+            check_id = self.analysis_method_radio_group.checkedId()
+            if check_id == ANALYSIS_IMPULSE:
+                self.ax.set_ylabel("Amplitude")
+                self.ax.set_xlabel(f"[sample]")
+                self.ax.set_xlim([0, len(self.taps) - 1])
+                self.impulse_base.set_data([0, len(self.taps) - 1], [0, 0])
+                self.set_impulse_visible(True)
+                self.update_envelope()
+            else:
+                with profiler.span('plot.response'):
+                    mag_fre_db, phase_fre_rad, fre = self.get_response()
+                self.ax.set_xlabel(f"Frequency [{unit}]")
+                self.ax.set_xlim([0, self.fs / 2])
+
+                if check_id == ANALYSIS_PHASE:
+                    self.curves[self.line_phase] = (fre, phase_fre_rad)
+                    self.ax.set_ylabel("Phase [rad]")
+                else:
+                    self.curves[self.line_mag] = (fre, mag_fre_db)
+                    self.ax.set_ylabel("Magnitude [dB]")
+
+                if check_id == ANALYSIS_MAG_PHASE:
+                    self.curves[self.line_twin_phase] = (fre, phase_fre_rad)
+                    self.set_twin_visible(True)
+
+                self.update_envelope()
+                for line in self.curves:
+                    line.set_visible(True)
+
+                if check_id == ANALYSIS_MAG_PHASE:
+                    self.ax_twin.relim(visible_only=True)
+                    self.ax_twin.set_autoscaley_on(True)
+                    self.ax_twin.autoscale_view(scalex=False)
+
+            with profiler.span('plot.autoscale'):
+                self.ax.relim(visible_only=True)
+                if check_id == ANALYSIS_IMPULSE:
+                    # relim ignores LineCollection
+                    self.ax.update_datalim(
+                        [(0, self.taps.min()),
+                         (len(self.taps) - 1, self.taps.max())])
+                self.ax.set_autoscaley_on(True)
+                self.ax.autoscale_view(scalex=False)
+
+            # Tick labels only change their width with the view or the unit.
+            layout_key = (check_id, unit)
+            if layout_key != self.layout_key:
+                self.layout_key = layout_key
+                self.update_layout()
+            else:
+                self.fig.canvas.draw_idle()
 
-        self.clear_axes()
+    @Slot()
+    def replot(self):
+        """Plot the filter response again after a change of the view."""
+        self.profile_since = profiler.now()
+        self.plot_filter()
 
-        mag_fre_db, phase_fre_rad, fre = frequency_response(
-            self.taps, self.fs, 1024)
-        unit = self.freq_unit_combo.itemText(
-            self.freq_unit_combo.currentIndex())
-        self.ax_twin.set_zorder(-1)  # For display the coordinate of self.ax in self.canvas_toolbar
-
-        check_id = self.analysis_method_radio_group.checkedId()
-        if check_id == ANALYSIS_MAG:
-            self.ax.plot(fre, mag_fre_db)
-            self.ax.set_ylabel("Magnitude [dB]")
-            self.ax.set_xlabel(f"Frequency [{unit}]")
-            self.ax.set_xlim([0, self.fs / 2])
-        elif check_id == ANALYSIS_PHASE:
-            self.ax.plot(fre, phase_fre_rad)
-            self.ax.set_ylabel("Phase [rad]")
-            self.ax.set_xlabel(f"Frequency [{unit}]")
-            self.ax.set_xlim([0, self.fs / 2])
-        elif check_id == ANALYSIS_MAG_PHASE:
-            self.ax.plot(fre, mag_fre_db)
-
-            line_right = self.ax_twin.plot(fre, phase_fre_rad, '-g')
-            self.ax_twin.yaxis.label.set_color(line_right[0].get_color())
-            self.ax_twin.tick_params(axis='y', colors=line_right[0].get_color())
-            self.ax_twin.spines["right"].set_edgecolor(line_right[0].get_color())
-            self.ax_twin.set_ylabel("Phase [rad]")
-            self.ax_twin.get_yaxis().set_visible(True)
-            self.ax_twin.set_frame_on(True)
-            self.ax_twin.grid(False)
-            self.ax_twin.set_zorder(2)
-
-            self.ax.set_ylabel("Magnitude [dB]")
-            self.ax.set_xlabel(f"Frequency [{unit}]")
-            self.ax.set_xlim([0, self.fs / 2])
-
-        elif check_id == ANALYSIS_IMPULSE:
-            self.ax.stem(self.taps)
-            self.ax.set_ylabel("Amplitude")
-            self.ax.set_xlabel(f"[sample]")
-            self.ax.set_xlim([0, len(self.taps) - 1])
-
-        self.fig.tight_layout()
-        self.fig.canvas.draw_idle()
+    def schedule_profile(self, event=None):
+        """Show the spans once the current draw has finished."""
+        if profiler.enabled:
+            QTimer.singleShot(0, self.show_profile)
+
+    @Slot()
+    def show_profile(self):
+        """Emit the total time of every span since the last action."""
+        totals = profiler.summary(self.profile_since)
+        self.sig_profile.emit(' | '.join(
+            f"{name} {elapsed * 1e3:.1f} ms"
+            for name, elapsed in totals.items()))
+
+    def update_envelope(self, ax=None):
+        """Reduce the curves to the min/max envelope of the axes pixels.
+
+        It is called again whenever the x range is changed by the toolbar.
+        """
+        with profiler.span('plot.envelope'):
+            x_lim = self.ax.get_xlim()
+            n_bin = self.ax.bbox.width
+            for line, (x, y) in self.curves.items():
+                line.set_data(*minmax_envelope(x, y, n_bin, x_lim))
+            if self.impulse_stems.get_visible():
+                self.update_impulse(x_lim, max(n_bin, 1))
+
+    def update_impulse(self, x_lim, n_bin):
+        """Update the stems of the impulse response in x_lim.
+
+        Every stem is a segment of one LineCollection. If there are more
+        taps than pixels, each pixel gets one segment covering the min/max of
+        its taps, and markers are drawn only for a few visible taps.
+        """
+        n_tap = len(self.taps)
+        start = min(max(int(floor(x_lim[0])), 0), n_tap - 1)
+        stop = max(min(int(ceil(x_lim[1])) + 1, n_tap), start + 1)
+        x = arange(start, stop)
+        taps = self.taps[start:stop]
+
+        if len(x) > 2 * n_bin:
+            edges = linspace(0, len(x), int(n_bin),
+                             endpoint=False).astype(int)
+            x_stem = x[edges]
+            low = minimum(minimum.reduceat(taps, edges), 0)
+            high = maximum(maximum.reduceat(taps, edges), 0)
+        else:
+            x_stem = x
+            low = minimum(taps, 0)
+            high = maximum(taps, 0)
+
+        segments = empty((len(x_stem), 2, 2))
+        segments[:, :, 0] = x_stem[:, None]
+        segments[:, 0, 1] = low
+        segments[:, 1, 1] = high
+        self.impulse_stems.set_segments(segments)
+
+        show_marker = len(x) <= IMPULSE_MARKER_MAX_TAP
+        self.impulse_marker.set_visible(show_marker)
+        if show_marker:
+            self.impulse_marker.set_data(x, taps)
+
+    def get_response(self):
+        """Return the frequency response of taps from the response cache.
+
+        The response of an IIR design is evaluated from its sections.
+
+        Returns
+        -------
+        (ndarray, ndarray, ndarray)
+            mag_fre_db, phase_fre_rad, frequnecy
+        """
+        n_point = self.response_points()
+        coefs = self.taps if self.sos is None else self.sos
+        key = (array_hash(coefs), self.fs, n_point)
+        response = self.response_cache.get(key)
+        if response is None:
+            if self.sos is None:
+                response = frequency_response_points(self.taps, self.fs,
+                                                     n_point)
+            else:
+                response = sos_response_points(self.sos, self.fs, n_point)
+            self.response_cache.put(key, response)
+
+        return response
+
+    def response_points(self):
+        """Return the number of frequency points to evaluate.
+
+        It follows the width of the canvas, but is not less than the number
+        of taps so that the unwrapped phase stays correct.
+        """
+        n_pixel = max(self.canvas.width(), 640)
+        return max(n_pixel * RESPONSE_POINTS_PER_PIXEL, len(self.taps))
 
     def resizeEvent(self, event):
-        """Override resizeEvent of Qt."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            self.fig.tight_layout()
+        """Override resizeEvent of Qt.
+
+        tight_layout runs once after the resizing stops.
+        """
+        self.layout_timer.start()
         super(FilterDesignWidget, self).resizeEvent(event)
 
     def delete_layout(self, layout):
@@ -379,17 +791,25 @@ class FilterDesignWidget(QWidget):
     def get_filter(self):
         """Get the selected filter instance in filter type combobox."""
         if self.method_radio_group.checkedId() == METHOD_FIR:
-            filter_instance = self.fir_list[self.combo_fir.currentIndex()]
+            filter_class = self.fir_list[self.combo_fir.currentIndex()]
         else:
-            filter_instance = self.iir_list[self.combo_iir.currentIndex()]
+            filter_class = self.iir_list[self.combo_iir.currentIndex()]
 
+        filter_instance = self.filter_instances.get(filter_class)
+        if filter_instance is None:
+            filter_instance = filter_class(self)
+            self.filter_instances[filter_class] = filter_instance
         return filter_instance
 
     def change_ui(self):
         """
         Change UI of filterwidget based on the selected filter_type and
         filter_method in the Combobox.
+
+        The running design is cancelled, since its result belongs to the
+        previous UI.
         """
+        self.cancel_design()
         filter_instance = self.get_filter()
 
         filter_type = self.type_radio_group.checkedId()
@@ -409,3 +829,10 @@ class FilterDesignWidget(QWidget):
             filter_instance.get_ui_magnitude(filter_type))
 
         filter_instance.set_ui_options(filter_type)
+
+        # The parameter sweep designs FIR specifications only
+        self.push_sweep.setEnabled(
+            self.method_radio_group.checkedId() == METHOD_FIR)
+
+        self.connect_preview_inputs()
+        self.schedule_preview()
@@ -5,27 +5,34 @@
 """."""
 
 # Third party imports
-from numpy import ndarray
 from qtpy.QtGui import QIntValidator, QDoubleValidator
 from qtpy.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-                            QRadioButton, QButtonGroup)
+                            QRadioButton, QButtonGroup, QCheckBox)
 
 # Local import
-from scipy.signal import firls, remez
-
 from filterdesigner.filterbase import (FilterBase, TYPE_LPF, TYPE_BPF,
                                        TYPE_BSF, TYPE_HPF)
+from filterdesigner.filterdesign.cost import DesignResult
+from filterdesigner.filterdesign.design import (
+    DEFAULT_DENSITY, FilterSpec, METHOD_EQUIRIPPLE, METHOD_LEASTSQUARE)
+from filterdesigner.filterdesign.designcache import cached_design_filter
+from filterdesigner.filterdesign.minorder import minimum_order
 
 
 class LPFBase(FilterBase):
     """."""
+    name = 'LPFBase'
+
     def __init__(self, ui_parent):
         self.ui_parent = ui_parent
-        self.name = 'LPFBase'
 
         # ui_order
         self.order_layout: QVBoxLayout = None
         self.order_line: QLineEdit = None
+        self.auto_order_check: QCheckBox = None
+        self.ripple_line: QLineEdit = None
+        self.atten_line: QLineEdit = None
+        self.order_info_label: QLabel = None
 
         # ui_options
         self.options_layout: QVBoxLayout = None
@@ -64,10 +71,41 @@ class LPFBase(FilterBase):
         hbox.addWidget(self.order_line)
         self.order_layout.addLayout(hbox)
 
+        self.auto_order_check = QCheckBox("Minimum order", self.ui_parent)
+        self.auto_order_check.toggled.connect(self.set_auto_order)
+        self.order_layout.addWidget(self.auto_order_check)
+
+        self.ripple_line = QLineEdit('0.1', self.ui_parent)
+        self.ripple_line.setValidator(QDoubleValidator(0, 100, 10))
+        hbox = QHBoxLayout()
+        hbox.addWidget(QLabel("Apass [dB]", self.ui_parent))
+        hbox.addWidget(self.ripple_line)
+        self.order_layout.addLayout(hbox)
+
+        self.atten_line = QLineEdit('60', self.ui_parent)
+        self.atten_line.setValidator(QDoubleValidator(0, 1000, 10))
+        hbox = QHBoxLayout()
+        hbox.addWidget(QLabel("Astop [dB]", self.ui_parent))
+        hbox.addWidget(self.atten_line)
+        self.order_layout.addLayout(hbox)
+
+        self.order_info_label = QLabel("", self.ui_parent)
+        self.order_info_label.setWordWrap(True)
+        self.order_layout.addWidget(self.order_info_label)
+
+        self.set_auto_order(False)
+
+    def set_auto_order(self, checked):
+        """Enable the targets of the minimum order search."""
+        self.order_line.setEnabled(not checked)
+        self.ripple_line.setEnabled(checked)
+        self.atten_line.setEnabled(checked)
+        self.order_info_label.setText("")
+
     def generate_ui_options(self):
         self.options_layout = QHBoxLayout()
         label = QLabel("Density Factor")
-        self.density_line = QLineEdit("16", self.ui_parent)
+        self.density_line = QLineEdit(str(DEFAULT_DENSITY), self.ui_parent)
         self.density_line.setValidator(QIntValidator(1, 1000))
         self.options_layout.addWidget(label)
         self.options_layout.addWidget(self.density_line)
@@ -296,18 +334,8 @@ class LPFBase(FilterBase):
             self.weight2_label.setText("Wstop1")
             self.weight3_label.setText("Wpass2")
 
-    def calc_filter(self, filter_type):
-        pass
-
-
-class EquiRipple(LPFBase):
-    """."""
-    def __init__(self, ui_parent):
-        super(EquiRipple, self).__init__(ui_parent)
-        self.name = 'Equiripple'
-
-    def calc_filter(self, filter_type):
-        """alculate LPF coefficient using remez.
+    def get_spec(self, filter_type):
+        """Read the filter specification from the UI.
 
         Parameters
         ----------
@@ -316,58 +344,51 @@ class EquiRipple(LPFBase):
 
         Returns
         -------
-        (ndarray, float)
-            taps, sampling frequency
+        FilterSpec
 
         """
-        n_tap = int(self.order_line.text())
-
-        fs = float(self.fs_line.text())
-        f1 = float(self.fre1_line.text())
-        f2 = float(self.fre2_line.text())
-        f3 = float(self.fre3_line.text())
-        f4 = float(self.fre4_line.text())
-        density = int(self.density_line.text())
-
-        w1 = float(self.weight1_line.text())
-        w2 = float(self.weight2_line.text())
-        w3 = float(self.weight3_line.text())
-
-        if filter_type == TYPE_LPF:
-            taps = remez(n_tap, [0, f1, f2, fs / 2], [1, 0], [w1, w2],
-                         grid_density=density, fs=fs)
-        elif filter_type == TYPE_HPF:
-            taps = remez(n_tap, [0, f1, f2, fs / 2], [0, 1], [w1, w2],
-                         grid_density=density, fs=fs)
-        elif filter_type == TYPE_BPF:
-            taps = remez(n_tap, [0, f1, f2, f3, f4, fs / 2], [0, 1, 0],
-                         [w1, w2, w3],
-                         grid_density=density, fs=fs)
+        if self.density_line is not None:
+            density = int(self.density_line.text())
         else:
-            taps = remez(n_tap, [0, f1, f2, f3, f4, fs / 2], [1, 0, 1],
-                         [w1, w2, w3],
-                         grid_density=density, fs=fs)
+            density = DEFAULT_DENSITY
 
-        return taps, fs
+        return FilterSpec.create(
+            filter_type, self.name, int(self.order_line.text()),
+            float(self.fs_line.text()),
+            [float(self.fre1_line.text()), float(self.fre2_line.text()),
+             float(self.fre3_line.text()), float(self.fre4_line.text())],
+            [float(self.weight1_line.text()),
+             float(self.weight2_line.text()),
+             float(self.weight3_line.text())],
+            density)
 
+    def get_order_target(self):
+        """Return (max_ripple_db, min_atten_db) if Minimum order is checked.
 
-class LeastSquare(LPFBase):
-    """."""
+        Returns
+        -------
+        (float, float) or None
+        """
+        if not self.auto_order_check.isChecked():
+            return None
+        return float(self.ripple_line.text()), float(self.atten_line.text())
 
-    def __init__(self, ui_parent):
-        super(LeastSquare, self).__init__(ui_parent)
-        self.name = 'Least-squares'
+    def set_order_result(self, result):
+        """Show the result of the minimum order search.
 
-    def generate_ui_options(self):
-        """Generate UI for options of firls."""
-        self.options_layout = QHBoxLayout()
-        label = QLabel(
-            "There are no optional parameters for this design method")
-        label.setWordWrap(True)
-        self.options_layout.addWidget(label)
+        Parameters
+        ----------
+        result: OrderSearchResult
+        """
+        self.order_line.setText(str(result.spec.n_tap))
+        self.order_info_label.setText(
+            f"{result.n_design} designs in {result.search_time:.2f} s")
 
     def calc_filter(self, filter_type):
-        """Calculate LPF coefficient using firls.
+        """Calculate filter coefficient of the specification in the UI.
+
+        If Minimum order is checked, the smallest order which meets the
+        targets is searched.
 
         Parameters
         ----------
@@ -376,35 +397,33 @@ class LeastSquare(LPFBase):
 
         Returns
         -------
-        (ndarray, float)
-            taps, sampling frequency
+        DesignResult
+            (taps, sampling frequency) with the cost of the taps
 
         """
-        n_tap = int(self.order_line.text())
+        spec = self.get_spec(filter_type)
+        target = self.get_order_target()
+        if target is not None:
+            result = minimum_order(spec, *target)
+            self.set_order_result(result)
+            return DesignResult(result.taps, spec.fs)
 
-        fs = float(self.fs_line.text())
-        f1 = float(self.fre1_line.text())
-        f2 = float(self.fre2_line.text())
-        f3 = float(self.fre3_line.text())
-        f4 = float(self.fre4_line.text())
+        return DesignResult(cached_design_filter(spec), spec.fs)
 
-        w1 = float(self.weight1_line.text())
-        w2 = float(self.weight2_line.text())
-        w3 = float(self.weight3_line.text())
 
-        if filter_type == TYPE_LPF:
-            taps = firls(n_tap, [0, f1, f2, fs / 2], [1, 1, 0, 0],
-                         [w1, w2], fs=fs)
-        elif filter_type == TYPE_HPF:
-            taps = firls(n_tap, [0, f1, f2, fs / 2], [0, 0, 1, 1],
-                         [w1, w2], fs=fs)
-        elif filter_type == TYPE_BPF:
-            taps = firls(n_tap, [0, f1, f2, f3, f4, fs / 2],
-                         [0, 0, 1, 1, 0, 0],
-                         [w1, w2, w3], fs=fs)
-        else:
-            taps = firls(n_tap, [0, f1, f2, f3, f4, fs / 2],
-                         [1, 1, 0, 0, 1, 1],
-                         [w1, w2, w3], fs=fs)
+class EquiRipple(LPFBase):
+    """Equiripple FIR designed by remez."""
+    name = METHOD_EQUIRIPPLE
+
+
+class LeastSquare(LPFBase):
+    """Least-squares FIR designed by firls."""
+    name = METHOD_LEASTSQUARE
 
-        return taps, fs
+    def generate_ui_options(self):
+        """Generate UI for options of firls."""
+        self.options_layout = QHBoxLayout()
+        label = QLabel(
+            "There are no optional parameters for this design method")
+        label.setWordWrap(True)
+        self.options_layout.addWidget(label)
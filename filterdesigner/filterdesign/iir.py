@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third party imports
+from qtpy.QtGui import QIntValidator, QDoubleValidator
+from qtpy.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                            QCheckBox)
+
+# Local import
+from filterdesigner.filterbase import TYPE_LPF, TYPE_HPF, TYPE_BPF, TYPE_BSF
+from filterdesigner.filterdesign.cost import DesignResult
+from filterdesigner.filterdesign.design import (
+    IIRSpec, METHOD_BUTTERWORTH, METHOD_CHEBYSHEV1, METHOD_CHEBYSHEV2,
+    METHOD_ELLIPTIC, iir_order)
+from filterdesigner.filterdesign.designcache import cached_design_filter
+from filterdesigner.filterdesign.fir import LPFBase
+
+FREQUENCY_LABELS = {TYPE_LPF: ("Fpass", "Fstop"),
+                    TYPE_HPF: ("Fstop", "Fpass"),
+                    TYPE_BPF: ("Fstop1", "Fpass1", "Fpass2", "Fstop2"),
+                    TYPE_BSF: ("Fpass1", "Fstop1", "Fstop2", "Fpass2")}
+
+
+class IIRBase(LPFBase):
+    """IIR filter designed as second-order sections.
+
+    The order is given, or the minimum order which meets Apass and Astop is
+    found by the order function of the method.
+    """
+    name = 'IIRBase'
+
+    def __init__(self, ui_parent):
+        super(IIRBase, self).__init__(ui_parent)
+
+        # ui_magnitude
+        self.apass_line: QLineEdit = None
+        self.astop_line: QLineEdit = None
+
+    def generate_ui_order(self):
+        """Generate UI for the order and the minimum order check.
+
+        Apass and Astop of the magnitude specification are the targets of
+        the minimum order.
+        """
+        self.order_line = QLineEdit('8', self.ui_parent)
+        self.order_line.setValidator(QIntValidator(1, 64))
+
+        self.order_layout = QVBoxLayout()
+        hbox = QHBoxLayout()
+        hbox.addWidget(QLabel("Specify order", self.ui_parent))
+        hbox.addWidget(self.order_line)
+        self.order_layout.addLayout(hbox)
+
+        self.auto_order_check = QCheckBox("Minimum order", self.ui_parent)
+        self.auto_order_check.toggled.connect(self.set_auto_order)
+        self.order_layout.addWidget(self.auto_order_check)
+
+        self.order_info_label = QLabel("", self.ui_parent)
+        self.order_info_label.setWordWrap(True)
+        self.order_layout.addWidget(self.order_info_label)
+
+        self.set_auto_order(False)
+
+    def set_auto_order(self, checked):
+        """Enable the order line unless the minimum order is designed."""
+        self.order_line.setEnabled(not checked)
+        self.order_info_label.setText("")
+
+    def generate_ui_options(self):
+        """Generate UI for options of the IIR design."""
+        self.options_layout = QHBoxLayout()
+        label = QLabel(
+            "There are no optional parameters for this design method")
+        label.setWordWrap(True)
+        self.options_layout.addWidget(label)
+
+    def generate_ui_magnitude(self):
+        """Generate UI for the passband ripple and stopband attenuation."""
+        self.mag_layout = QVBoxLayout()
+
+        self.mag_label = QLabel(
+            "Enter the passband ripple and the stopband attenuation")
+        self.mag_label.setMaximumHeight(50)
+        self.mag_label.setWordWrap(True)
+        self.mag_layout.addWidget(self.mag_label)
+
+        hbox = QHBoxLayout()
+        self.apass_line = QLineEdit('1', self.ui_parent)
+        self.apass_line.setValidator(QDoubleValidator(0, 100, 10))
+        hbox.addWidget(QLabel("Apass [dB]", self.ui_parent))
+        hbox.addWidget(self.apass_line)
+        self.mag_layout.addLayout(hbox)
+
+        hbox = QHBoxLayout()
+        self.astop_line = QLineEdit('60', self.ui_parent)
+        self.astop_line.setValidator(QDoubleValidator(0, 1000, 10))
+        hbox.addWidget(QLabel("Astop [dB]", self.ui_parent))
+        hbox.addWidget(self.astop_line)
+        self.mag_layout.addLayout(hbox)
+
+    def set_ui_options(self, filter_type):
+        """Change ui according to the filter type."""
+        labels = FREQUENCY_LABELS[filter_type]
+        for idx, (label, line) in enumerate(
+                [(self.fre1_label, self.fre1_line),
+                 (self.fre2_label, self.fre2_line),
+                 (self.fre3_label, self.fre3_line),
+                 (self.fre4_label, self.fre4_line)]):
+            visible = idx < len(labels)
+            label.setVisible(visible)
+            line.setVisible(visible)
+            if visible:
+                label.setText(labels[idx])
+
+    def get_spec(self, filter_type):
+        """Read the filter specification from the UI.
+
+        If Minimum order is checked, the order of the spec is 0, which the
+        design replaces with the minimum order.
+
+        Parameters
+        ----------
+        filter_type: int
+            [TYPE_LPF, TYPE_BPF, TYPE_BSF, TYPE_HPF]
+
+        Returns
+        -------
+        IIRSpec
+        """
+        is_auto = self.auto_order_check.isChecked()
+        return IIRSpec.create(
+            filter_type, self.name,
+            0 if is_auto else int(self.order_line.text()),
+            float(self.fs_line.text()),
+            [float(self.fre1_line.text()), float(self.fre2_line.text()),
+             float(self.fre3_line.text()), float(self.fre4_line.text())],
+            float(self.apass_line.text()), float(self.astop_line.text()))
+
+    def get_order_target(self):
+        """The minimum order is designed by the IIR design itself."""
+        return None
+
+    def set_order_result(self, result):
+        """Show the minimum order found by the design.
+
+        Parameters
+        ----------
+        result: IIRSpec
+            spec whose order is the minimum order
+        """
+        self.order_line.setText(str(result.order))
+        self.order_info_label.setText(f"Minimum order {result.order}")
+
+    def calc_filter(self, filter_type):
+        """Calculate second-order sections of the specification in the UI.
+
+        Parameters
+        ----------
+        filter_type: int
+            [TYPE_LPF, TYPE_BPF, TYPE_BSF, TYPE_HPF]
+
+        Returns
+        -------
+        DesignResult
+            ((n_section, 6) second-order sections, sampling frequency) with
+            the cost of the sections
+        """
+        spec = self.get_spec(filter_type)
+        sos = cached_design_filter(spec)
+        if spec.order == 0:
+            self.set_order_result(spec._replace(order=iir_order(spec)[0]))
+        return DesignResult(sos, spec.fs)
+
+
+class Butterworth(IIRBase):
+    """Butterworth IIR, -3 dB at the passband edges for a given order."""
+    name = METHOD_BUTTERWORTH
+
+
+class Chebyshev1(IIRBase):
+    """Chebyshev type I IIR, equiripple in the passbands."""
+    name = METHOD_CHEBYSHEV1
+
+
+class Chebyshev2(IIRBase):
+    """Chebyshev type II IIR, equiripple in the stopbands."""
+    name = METHOD_CHEBYSHEV2
+
+
+class Elliptic(IIRBase):
+    """Elliptic IIR, equiripple in the passbands and the stopbands."""
+    name = METHOD_ELLIPTIC
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Figures of merit of designed filters."""
+
+# Standard library imports
+import time
+from typing import NamedTuple
+
+# Third party imports
+import numpy as np
+
+# Local import
+from filterdesigner.filterdesign.design import band_ranges, design_filter
+from filterdesigner.helper.signal import complex_response_points
+
+# Frequency points per tap used to find the extremes of each band
+POINTS_PER_TAP = 8
+MIN_POINTS = 8192
+
+
+class FilterMetrics(NamedTuple):
+    """Passband ripple and stopband attenuation of a design.
+
+    Attributes
+    ----------
+    passband_ripple_db: float
+        Peak to peak ripple of the passbands in dB
+    stopband_atten_db: float
+        Minimum attenuation of the stopbands in dB relative to gain 1
+    """
+    passband_ripple_db: float
+    stopband_atten_db: float
+
+
+def filter_metrics(spec, taps, n_point=None):
+    """Measure the passband ripple and stopband attenuation of taps.
+
+    Parameters
+    ----------
+    spec: FilterSpec
+        The specification which defines the bands
+    taps: ndarray
+    n_point: int, optional
+        number of frequency points (the default is None, None이면
+        POINTS_PER_TAP * len(taps))
+
+    Returns
+    -------
+    FilterMetrics
+    """
+    if n_point is None:
+        n_point = max(POINTS_PER_TAP * len(taps), MIN_POINTS)
+    mag = np.abs(complex_response_points(taps, n_point))
+    ripple, atten = band_metrics(spec, mag)
+    return FilterMetrics(float(ripple), float(atten))
+
+
+def band_metrics(spec, mag):
+    """Measure the ripple and attenuation of magnitude responses at once.
+
+    Parameters
+    ----------
+    spec: FilterSpec
+        The specification which defines the bands
+    mag: ndarray
+        magnitudes of n_point frequencies from 0 to fs / 2 (exclusive) along
+        the last axis, with any leading axes (ex. one row per filter)
+
+    Returns
+    -------
+    (ndarray, ndarray)
+        passband ripple and stopband attenuation in dB of the leading shape
+    """
+    n_point = mag.shape[-1]
+    fre = np.arange(n_point) / n_point * spec.fs / 2
+
+    passbands, stopbands = band_ranges(spec)
+
+    ripple = np.zeros(mag.shape[:-1])
+    for start, stop in passbands:
+        band = mag[..., (fre >= start) & (fre <= stop)]
+        if band.shape[-1]:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ripple = np.fmax(ripple, 20 * np.log10(
+                    band.max(axis=-1) / band.min(axis=-1)))
+
+    peak = np.zeros(mag.shape[:-1])
+    for start, stop in stopbands:
+        band = mag[..., (fre >= start) & (fre <= stop)]
+        if band.shape[-1]:
+            peak = np.maximum(peak, band.max(axis=-1))
+    with np.errstate(divide='ignore'):
+        atten = -20 * np.log10(peak)
+
+    return ripple, atten
+
+
+def design_and_measure(spec):
+    """Design spec and measure it. It can run in a worker process.
+
+    Returns
+    -------
+    (ndarray, FilterMetrics, float, str)
+        taps, metrics, design time in seconds, error message (None if the
+        design succeeded)
+    """
+    t_start = time.perf_counter()
+    try:
+        taps = design_filter(spec)
+    except Exception as e:  # Report every failure to the caller
+        return None, None, time.perf_counter() - t_start, str(e)
+    elapsed = time.perf_counter() - t_start
+
+    return taps, filter_metrics(spec, taps), elapsed, None
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Search of the minimum order which meets ripple and attenuation targets."""
+
+# Standard library imports
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+# Third party imports
+from numpy import ndarray
+
+# Local import
+from filterdesigner.filterbase import TYPE_HPF, TYPE_BSF
+from filterdesigner.filterdesign.design import FilterSpec, METHOD_LEASTSQUARE
+from filterdesigner.filterdesign.metrics import (FilterMetrics,
+                                                 design_and_measure)
+
+MAX_N_TAP = 8192
+
+
+class OrderSearchResult(NamedTuple):
+    """Result of minimum_order.
+
+    Attributes
+    ----------
+    spec: FilterSpec
+        spec with the minimum number of taps
+    taps: ndarray
+    metrics: FilterMetrics
+    n_design: int
+        number of designs tried
+    search_time: float
+        total time of the search in seconds
+    """
+    spec: FilterSpec
+    taps: ndarray
+    metrics: FilterMetrics
+    n_design: int
+    search_time: float
+
+
+def ripple_to_delta(ripple_db):
+    """Convert peak to peak passband ripple in dB to the linear deviation."""
+    gain = 10 ** (ripple_db / 20)
+    return (gain - 1) / (gain + 1)
+
+
+def estimate_n_tap(spec, max_ripple_db, min_atten_db):
+    """Estimate the number of taps by the formula of Kaiser.
+
+    Parameters
+    ----------
+    spec: FilterSpec
+    max_ripple_db: float
+        peak to peak passband ripple
+    min_atten_db: float
+        stopband attenuation
+
+    Returns
+    -------
+    int
+    """
+    delta_p = ripple_to_delta(max_ripple_db)
+    delta_s = 10 ** (-min_atten_db / 20)
+    edges = spec.freqs
+    transition = min(edges[idx + 1] - edges[idx]
+                     for idx in range(0, len(edges), 2)) / spec.fs
+    if transition <= 0:
+        raise ValueError("Band edges must be ascending")
+
+    n_tap = ((-20 * math.log10(math.sqrt(delta_p * delta_s)) - 13) /
+             (14.6 * transition) + 1)
+    return max(int(math.ceil(n_tap)), 3)
+
+
+def _is_odd_only(spec):
+    """Return True if spec can only be designed with an odd number of taps.
+
+    firls requires odd taps, and even taps force a zero at fs/2 which a
+    highpass or a bandstop can not have.
+    """
+    return (spec.method == METHOD_LEASTSQUARE or
+            spec.filter_type in (TYPE_HPF, TYPE_BSF))
+
+
+def minimum_order(spec, max_ripple_db, min_atten_db, jobs=None,
+                  executor=None, max_n_tap=MAX_N_TAP):
+    """Find the smallest number of taps of spec which meets the targets.
+
+    The search starts from estimate_n_tap and narrows the interval between
+    the largest failing and the smallest passing number of taps. Every step
+    designs `jobs` candidates in parallel, dividing the interval evenly,
+    which is a bisection if jobs is 1.
+
+    Parameters
+    ----------
+    spec: FilterSpec
+        n_tap of spec is ignored
+    max_ripple_db: float
+        maximum peak to peak passband ripple
+    min_atten_db: float
+        minimum stopband attenuation
+    jobs: int, optional
+        number of candidates designed in parallel (the default is None,
+        None이면 CPU 개수). If jobs is 1, candidates are designed in this
+        process.
+    executor: concurrent.futures.Executor, optional
+        executor to use instead of a new ProcessPoolExecutor
+    max_n_tap: int
+
+    Returns
+    -------
+    OrderSearchResult
+    """
+    t_start = time.perf_counter()
+    spec.validate()
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    step = 2 if _is_odd_only(spec) else 1
+
+    def valid(n_tap):
+        n_tap = max(min(int(n_tap), max_n_tap), 1)
+        if step == 2 and n_tap % 2 == 0:
+            n_tap = n_tap + 1 if n_tap < max_n_tap else n_tap - 1
+        return n_tap
+
+    results = {}
+
+    def evaluate(n_taps, map_func):
+        n_taps = sorted(set(valid(n) for n in n_taps) - set(results))
+        specs = [spec._replace(n_tap=n) for n in n_taps]
+        for n_tap, result in zip(n_taps, map_func(design_and_measure,
+                                                  specs)):
+            taps, metrics, _, error = result
+            passed = (error is None and
+                      metrics.passband_ripple_db <= max_ripple_db and
+                      metrics.stopband_atten_db >= min_atten_db)
+            results[n_tap] = (passed, taps, metrics)
+
+    def search(map_func):
+        n_start = valid(estimate_n_tap(spec, max_ripple_db, min_atten_db))
+        n_taps = [n_start * (1 + 0.25 * (idx - jobs // 2))
+                  for idx in range(max(jobs, 2))]
+        evaluate([n for n in n_taps if n >= 1], map_func)
+
+        # Grow until a passing design is found
+        while not any(passed for passed, _, _ in results.values()):
+            n_max = max(results)
+            if n_max >= valid(max_n_tap):
+                raise ValueError(
+                    f"No filter up to {max_n_tap} taps meets the target")
+            evaluate([n_max * 2 ** ((idx + 1) / max(jobs, 1))
+                      for idx in range(max(jobs, 1))], map_func)
+
+        while True:
+            hi = min(n for n, (passed, _, _) in results.items() if passed)
+            failed = [n for n, (passed, _, _) in results.items()
+                      if not passed and n < hi]
+            lo = max(failed) if failed else 1 - step
+            candidates = range(lo + step, hi, step)
+            if not candidates:
+                return hi
+            if len(candidates) <= jobs:
+                evaluate(candidates, map_func)
+            else:
+                evaluate([candidates[len(candidates) * (idx + 1) //
+                                     (jobs + 1)]
+                          for idx in range(jobs)], map_func)
+
+    if executor is not None:
+        n_tap = search(executor.map)
+    elif jobs == 1:
+        n_tap = search(map)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            n_tap = search(executor.map)
+
+    _, taps, metrics = results[n_tap]
+    return OrderSearchResult(spec._replace(n_tap=n_tap), taps, metrics,
+                             len(results), time.perf_counter() - t_start)
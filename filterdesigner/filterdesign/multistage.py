@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Multistage decimation filters with the fewest multiplies per sample."""
+
+# Standard library imports
+import time
+from typing import NamedTuple, Optional, Tuple
+
+# Third party imports
+from numpy import ndarray
+
+# Local import
+from filterdesigner.filterbase import TYPE_LPF
+from filterdesigner.filterdesign.cost import DesignCost
+from filterdesigner.filterdesign.design import FilterSpec, METHOD_EQUIRIPPLE
+from filterdesigner.filterdesign.metrics import FilterMetrics
+from filterdesigner.filterdesign.minorder import (
+    MAX_N_TAP, estimate_n_tap, minimum_order, ripple_to_delta)
+from filterdesigner.helper.resample import Decimator
+
+N_STAGES = (2, 3, 4)
+N_CANDIDATE = 3
+
+
+class DecimationStage(NamedTuple):
+    """One lowpass decimator of a chain.
+
+    Attributes
+    ----------
+    factor: int
+        decimation factor of the stage
+    spec: FilterSpec
+        lowpass at the input rate of the stage
+    taps: ndarray
+        None if the stage was only estimated
+    metrics: FilterMetrics
+        None if the stage was only estimated
+    """
+    factor: int
+    spec: FilterSpec
+    taps: Optional[ndarray] = None
+    metrics: Optional[FilterMetrics] = None
+
+
+class DecimationChain(NamedTuple):
+    """Cascade of decimation stages, the first stage at the input rate."""
+    stages: Tuple[DecimationStage, ...]
+
+    @property
+    def factors(self):
+        """Return the decimation factor of every stage."""
+        return tuple(stage.factor for stage in self.stages)
+
+    @property
+    def n_taps(self):
+        """Return the number of taps of every stage."""
+        return tuple(stage.spec.n_tap for stage in self.stages)
+
+    @property
+    def mults_per_input(self):
+        """Multiplies per input sample of polyphase decimators.
+
+        A stage computes only its outputs, n_tap multiplies each, at the
+        input rate divided by the factors up to the stage.
+        """
+        total = 0.0
+        rate = 1
+        for stage in self.stages:
+            rate *= stage.factor
+            total += stage.spec.n_tap / rate
+        return total
+
+    @property
+    def passband_ripple_db(self):
+        """Upper bound of the peak to peak ripple of the cascade."""
+        return sum(stage.metrics.passband_ripple_db for stage in self.stages)
+
+    @property
+    def stopband_atten_db(self):
+        """Lower bound of the attenuation of the cascade."""
+        return min(stage.metrics.stopband_atten_db for stage in self.stages)
+
+    @property
+    def cost(self):
+        """Return the DesignCost of the chain per output sample.
+
+        Every stage computes n_tap multiplies per output of the stage, and
+        the group delay is the sum of (n_tap - 1) / 2 samples at the input
+        rate of every stage.
+        """
+        n_out = 1  # outputs of the stage per output of the chain
+        for stage in self.stages:
+            n_out *= stage.factor
+        n_mult = n_add = delay_s = 0.0
+        for stage in self.stages:
+            n_out //= stage.factor
+            n_tap = stage.spec.n_tap
+            n_mult += n_tap * n_out
+            n_add += (n_tap - 1) * n_out
+            delay_s += (n_tap - 1) / 2 / stage.spec.fs
+        last = self.stages[-1]
+        fs = last.spec.fs / last.factor
+        return DesignCost(n_mult, n_add, sum(self.n_taps),
+                          sum(n_tap - 1 for n_tap in self.n_taps),
+                          delay_s * fs, fs)
+
+    def decimators(self):
+        """Return a Decimator of every stage, to be applied in order."""
+        return [Decimator(stage.taps, stage.factor) for stage in self.stages]
+
+
+class MultistageResult(NamedTuple):
+    """Result of design_multistage.
+
+    Attributes
+    ----------
+    best: DecimationChain
+        designed chain with the fewest multiplies per input sample
+    single: DecimationChain
+        single-stage equivalent, designed or only estimated if it needs
+        more than max_n_tap taps
+    candidates: list of DecimationChain
+        every factorization with the estimated numbers of taps, the
+        cheapest first
+    search_time: float
+        total time of the search in seconds
+    """
+    best: DecimationChain
+    single: DecimationChain
+    candidates: list
+    search_time: float
+
+    @property
+    def saving(self):
+        """Ratio of the multiplies of the single stage to the best chain."""
+        return self.single.mults_per_input / self.best.mults_per_input
+
+    def report(self):
+        """Return a text comparing the best chain with the single stage."""
+        lines = []
+        for name, chain in (("single stage", self.single),
+                            ("multistage", self.best)):
+            designed = chain.stages[0].taps is not None
+            lines.append(
+                f"{name}: factors {' x '.join(map(str, chain.factors))}, "
+                f"taps {' + '.join(map(str, chain.n_taps))}"
+                f"{'' if designed else ' (estimated)'}, "
+                f"{chain.mults_per_input:.2f} mults/input sample, "
+                f"delay {chain.cost.group_delay_s * 1e3:.3g} ms")
+            for stage in chain.stages:
+                if stage.metrics is not None:
+                    lines.append(
+                        f"  {stage.spec.fs:g} Hz / {stage.factor}: "
+                        f"{stage.spec.n_tap} taps, stopband "
+                        f"{stage.spec.freqs[1]:g} Hz, ripple "
+                        f"{stage.metrics.passband_ripple_db:.3g} dB, "
+                        f"attenuation {stage.metrics.stopband_atten_db:.1f}"
+                        f" dB")
+        lines.append(f"{self.saving:.1f}x fewer multiplies than the single "
+                     f"stage, {len(self.candidates)} factorizations in "
+                     f"{self.search_time:.2f} s")
+        return '\n'.join(lines)
+
+
+def ordered_factorizations(factor, n_stage):
+    """Return every ordered factorization of factor into n_stage factors
+    of at least 2.
+
+    Returns
+    -------
+    list of tuple of int
+    """
+    if n_stage == 1:
+        return [(factor,)] if factor >= 2 else []
+    return [(first, *rest)
+            for first in range(2, factor // 2 + 1) if factor % first == 0
+            for rest in ordered_factorizations(factor // first, n_stage - 1)]
+
+
+def stage_specs(fs, factors, fpass, fstop, ripple_db, atten_db):
+    """Return the lowpass spec of every stage of a chain.
+
+    The passband of every stage is [0, fpass]. An intermediate stage only
+    has to reject what aliases onto [0, fstop] of the final rate, so its
+    stopband starts at its output rate minus fstop; the last stage has the
+    stopband edge fstop. The passband ripple is split evenly between the
+    stages and every stage has the full attenuation, so the cascade meets
+    ripple_db and atten_db.
+
+    Returns
+    -------
+    list of FilterSpec
+        n_tap of the specs is 1
+    """
+    stage_ripple = ripple_db / len(factors)
+    weights = [1, ripple_to_delta(stage_ripple) / 10 ** (-atten_db / 20)]
+    specs = []
+    rate = fs
+    for idx, stage_factor in enumerate(factors):
+        out_rate = rate / stage_factor
+        stop = fstop if idx == len(factors) - 1 else out_rate - fstop
+        specs.append(FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 1, rate,
+                                       [fpass, stop], weights))
+        rate = out_rate
+    return specs
+
+
+def estimate_chain(fs, factors, fpass, fstop, ripple_db, atten_db):
+    """Return the chain of factors with the numbers of taps estimated by
+    estimate_n_tap, without designing."""
+    specs = stage_specs(fs, factors, fpass, fstop, ripple_db, atten_db)
+    stage_ripple = ripple_db / len(factors)
+    return DecimationChain(tuple(
+        DecimationStage(stage_factor, spec._replace(
+            n_tap=estimate_n_tap(spec, stage_ripple, atten_db)))
+        for stage_factor, spec in zip(factors, specs)))
+
+
+def design_chain(fs, factors, fpass, fstop, ripple_db, atten_db, jobs=1,
+                 max_n_tap=MAX_N_TAP):
+    """Design every stage of the chain with its minimum number of taps.
+
+    Raises ValueError if a stage needs more than max_n_tap taps.
+    """
+    specs = stage_specs(fs, factors, fpass, fstop, ripple_db, atten_db)
+    stage_ripple = ripple_db / len(factors)
+    stages = []
+    for stage_factor, spec in zip(factors, specs):
+        result = minimum_order(spec, stage_ripple, atten_db, jobs=jobs,
+                               max_n_tap=max_n_tap)
+        stages.append(DecimationStage(stage_factor, result.spec,
+                                      result.taps, result.metrics))
+    return DecimationChain(tuple(stages))
+
+
+def design_multistage(fs, factor, fpass, fstop, ripple_db, atten_db,
+                      n_stages=N_STAGES, n_candidate=N_CANDIDATE, jobs=1,
+                      max_n_tap=MAX_N_TAP):
+    """Find the decimation chain with the fewest multiplies per input sample.
+
+    Every ordered factorization of factor into n_stages stages is estimated
+    with the formula of Kaiser, then the n_candidate cheapest ones are
+    designed with their minimum orders, since the estimates are only close.
+    A candidate whose stage needs more than max_n_tap taps is skipped. The
+    single stage is designed too for the comparison.
+
+    Parameters
+    ----------
+    fs: float
+        input sampling frequency
+    factor: int
+        overall decimation factor
+    fpass: float
+        passband edge
+    fstop: float
+        stopband edge, at most fs / factor - fpass so that the transition
+        band never aliases onto the passband
+    ripple_db: float
+        peak to peak passband ripple of the whole chain
+    atten_db: float
+        stopband attenuation of the whole chain
+    n_stages: iterable of int
+        numbers of stages to search
+    n_candidate: int
+        number of the cheapest estimated chains which are designed
+    jobs: int, optional
+        number of candidates designed in parallel by minimum_order (the
+        default is 1, None이면 CPU 개수)
+    max_n_tap: int
+
+    Returns
+    -------
+    MultistageResult
+
+    Raises
+    ------
+    ValueError
+        if the edges are invalid or no candidate could be designed
+    """
+    t_start = time.perf_counter()
+    factor = int(factor)
+    if factor < 2:
+        raise ValueError("factor must be at least 2")
+    if not 0 < fpass < fstop <= fs / factor - fpass:
+        raise ValueError("The edges must satisfy 0 < fpass < fstop <= "
+                         "fs / factor - fpass")
+
+    candidates = sorted(
+        (estimate_chain(fs, factors, fpass, fstop, ripple_db, atten_db)
+         for n_stage in n_stages
+         for factors in ordered_factorizations(factor, n_stage)),
+        key=lambda chain: chain.mults_per_input)
+    if not candidates:
+        raise ValueError(f"{factor} has no factorization into {n_stages} "
+                         f"stages")
+
+    designed = []
+    errors = []
+    for chain in candidates[:n_candidate]:
+        try:
+            designed.append(design_chain(fs, chain.factors, fpass, fstop,
+                                         ripple_db, atten_db, jobs,
+                                         max_n_tap))
+        except ValueError as e:
+            errors.append(f"{' x '.join(map(str, chain.factors))}: {e}")
+    if not designed:
+        raise ValueError(f"No candidate could be designed "
+                         f"({'; '.join(errors)})")
+    best = min(designed, key=lambda chain: chain.mults_per_input)
+
+    try:
+        single = design_chain(fs, (factor,), fpass, fstop, ripple_db,
+                              atten_db, jobs, max_n_tap)
+    except ValueError:
+        single = estimate_chain(fs, (factor,), fpass, fstop, ripple_db,
+                                atten_db)
+
+    return MultistageResult(best, single, candidates,
+                            time.perf_counter() - t_start)
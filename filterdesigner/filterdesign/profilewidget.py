@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""UI for the timing spans of the profiler."""
+
+# Third party imports
+from qtpy.QtCore import Qt, QTimer, Slot
+from qtpy.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QCheckBox,
+                            QPushButton, QTableWidget, QTableWidgetItem,
+                            QFileDialog, QMessageBox, QAbstractItemView)
+
+# Local import
+from filterdesigner.helper.profiler import profiler
+
+COLUMNS = ["Span", "Start [ms]", "Duration [ms]", "Peak [MB]", "Track"]
+MAX_ROWS = 500
+
+
+class ProfileDialog(QDialog):
+    """Show the latest spans of the profiler and export them."""
+
+    def __init__(self, parent=None):
+        super(ProfileDialog, self).__init__(parent)
+        self.setWindowTitle("Diagnostics")
+
+        self.check_enable = QCheckBox("Record spans", self)
+        self.check_enable.setChecked(profiler.enabled)
+        self.check_enable.toggled.connect(self.set_enabled)
+        self.check_memory = QCheckBox("Trace memory (slow)", self)
+        self.check_memory.setChecked(profiler.trace_memory)
+        self.check_memory.setEnabled(profiler.enabled)
+        self.check_memory.toggled.connect(self.set_enabled)
+
+        self.table = QTableWidget(0, len(COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+        push_clear = QPushButton("Clear", self)
+        push_clear.clicked.connect(self.clear)
+        push_json = QPushButton("Export JSON", self)
+        push_json.clicked.connect(self.export_json)
+        push_trace = QPushButton("Export Chrome Trace", self)
+        push_trace.clicked.connect(self.export_chrome_trace)
+
+        hbox_check = QHBoxLayout()
+        hbox_check.addWidget(self.check_enable)
+        hbox_check.addWidget(self.check_memory)
+        hbox_check.addStretch()
+
+        hbox_push = QHBoxLayout()
+        hbox_push.addStretch()
+        hbox_push.addWidget(push_clear)
+        hbox_push.addWidget(push_json)
+        hbox_push.addWidget(push_trace)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(hbox_check)
+        layout.addWidget(self.table)
+        layout.addLayout(hbox_push)
+
+        self.n_span = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.refresh)
+
+        self.resize(650, 500)
+
+    @Slot()
+    def set_enabled(self):
+        """Apply the check boxes to the profiler."""
+        profiler.set_enabled(self.check_enable.isChecked(),
+                             self.check_memory.isChecked())
+        self.check_memory.setEnabled(profiler.enabled)
+
+    @Slot()
+    def refresh(self):
+        """Show the latest MAX_ROWS spans if there are new ones."""
+        spans = list(profiler.spans)[-MAX_ROWS:]
+        n_span = (len(profiler.spans), spans[-1] if spans else None)
+        if n_span == self.n_span:
+            return
+        self.n_span = n_span
+
+        self.table.setRowCount(len(spans))
+        for row, span in enumerate(spans):
+            peak = ('' if span.peak_bytes is None
+                    else f"{span.peak_bytes / 2 ** 20:.3f}")
+            values = ['  ' * span.depth + span.name,
+                      f"{span.start * 1e3:.1f}",
+                      f"{span.duration * 1e3:.3f}", peak, span.track]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if col in (1, 2, 3):
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, col, item)
+        self.table.resizeColumnToContents(0)
+        self.table.scrollToBottom()
+
+    @Slot()
+    def clear(self):
+        """Remove every span."""
+        profiler.clear()
+        self.refresh()
+
+    @Slot()
+    def export_json(self):
+        """Write the spans to a json file."""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export JSON", "spans.json", "JSON (*.json)")
+        if path:
+            self.export(profiler.to_json, path)
+
+    @Slot()
+    def export_chrome_trace(self):
+        """Write the spans to a file of chrome://tracing."""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Chrome Trace", "trace.json", "JSON (*.json)")
+        if path:
+            self.export(profiler.to_chrome_trace, path)
+
+    def export(self, write, path):
+        """Call write(path) and report the failure."""
+        try:
+            write(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Error", str(e))
+
+    def showEvent(self, event):
+        """Override showEvent of Qt."""
+        self.refresh()
+        self.timer.start()
+        super(ProfileDialog, self).showEvent(event)
+
+    def closeEvent(self, event):
+        """Override closeEvent of Qt."""
+        self.timer.stop()
+        super(ProfileDialog, self).closeEvent(event)
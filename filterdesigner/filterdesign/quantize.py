@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Fixed-point quantization of designed taps."""
+
+# Standard library imports
+from typing import NamedTuple
+
+# Third party imports
+import numpy as np
+
+# Local import
+from filterdesigner.filterdesign.metrics import (band_metrics, POINTS_PER_TAP,
+                                                 MIN_POINTS)
+from filterdesigner.helper.signal import complex_response_points
+
+ROUND = 'round'
+TRUNCATE = 'truncate'
+ROUNDINGS = (ROUND, TRUNCATE)
+MAX_BITS = 53  # integers exactly representable by float64
+WORD_LENGTHS = tuple(range(8, 33))
+
+
+class QuantizedTaps(NamedTuple):
+    """Taps in a signed fixed-point format.
+
+    The value of a tap is integers / 2 ** frac_bits, and integers fit in
+    n_bit bits in two's complement.
+
+    Attributes
+    ----------
+    integers: ndarray
+        int64 codes of the taps
+    n_bit: int
+        word length including the sign bit
+    frac_bits: int
+        number of fractional bits (may be negative or larger than n_bit)
+    """
+    integers: np.ndarray
+    n_bit: int
+    frac_bits: int
+
+    @property
+    def taps(self):
+        """Return the quantized taps as float64."""
+        return np.ldexp(self.integers.astype(float), -self.frac_bits)
+
+    @property
+    def q_format(self):
+        """Return the format as 'Qm.n' (integer bits without the sign)."""
+        return f"Q{self.n_bit - 1 - self.frac_bits}.{self.frac_bits}"
+
+
+class WordLengthPoint(NamedTuple):
+    """Metrics of the taps quantized to a word length."""
+    n_bit: int
+    frac_bits: int
+    passband_ripple_db: float
+    stopband_atten_db: float
+    degradation_db: float
+
+    def meets(self, min_atten_db, max_ripple_db=np.inf):
+        """Return True if the quantized taps meet the target."""
+        return (self.stopband_atten_db >= min_atten_db and
+                self.passband_ripple_db <= max_ripple_db)
+
+
+def max_frac_bits(taps, n_bit):
+    """Return the most fractional bits with which taps fit in n_bit bits.
+
+    Parameters
+    ----------
+    taps: ndarray
+    n_bit: int or ndarray of int
+
+    Returns
+    -------
+    int or ndarray of int
+    """
+    taps = np.asarray(taps, dtype=float)
+    int_bits = -np.inf
+    # The codes are in [-2 ** (n_bit - 1), 2 ** (n_bit - 1)), so the most
+    # positive tap must be below 2 ** int_bits and the most negative one
+    # must not be below -2 ** int_bits
+    if np.any(taps > 0):
+        int_bits = np.floor(np.log2(taps.max())) + 1
+    if np.any(taps < 0):
+        int_bits = max(int_bits, np.ceil(np.log2(-taps.min())))
+    if int_bits == -np.inf:
+        int_bits = 0
+    return np.asarray(n_bit) - 1 - int(int_bits)
+
+
+def _quantize(taps, n_bit, frac_bits, rounding):
+    """Quantize taps to the formats broadcast from n_bit and frac_bits.
+
+    n_bit and frac_bits of shape (..., 1) give one row of codes per format.
+    """
+    if rounding not in ROUNDINGS:
+        raise ValueError(f"rounding must be one of {ROUNDINGS}")
+    scaled = np.ldexp(taps, frac_bits)
+    scaled = np.round(scaled) if rounding == ROUND else np.floor(scaled)
+    high = np.ldexp(1.0, n_bit - 1)
+    # Saturate the codes which are rounded up beyond the range
+    return np.clip(scaled, -high, high - 1).astype(np.int64)
+
+
+def quantize_taps(taps, n_bit, frac_bits=None, rounding=ROUND):
+    """Quantize taps to a signed fixed-point format.
+
+    Parameters
+    ----------
+    taps: ndarray
+    n_bit: int
+        word length including the sign bit
+    frac_bits: int, optional
+        (the default is None, None이면 max_frac_bits, 가장 큰 tap이 들어가는
+        최대 소수 비트)
+    rounding: str
+        ROUND (to nearest) or TRUNCATE (toward -inf)
+
+    Returns
+    -------
+    QuantizedTaps
+    """
+    taps = np.asarray(taps, dtype=float)
+    n_bit = int(n_bit)
+    if not 2 <= n_bit <= MAX_BITS:
+        raise ValueError(f"n_bit must be in [2, {MAX_BITS}]")
+    if frac_bits is None:
+        frac_bits = max_frac_bits(taps, n_bit)
+    frac_bits = int(frac_bits)
+    return QuantizedTaps(_quantize(taps, n_bit, frac_bits, rounding), n_bit,
+                         frac_bits)
+
+
+def explore_word_lengths(spec, taps, n_bits=WORD_LENGTHS, rounding=ROUND,
+                         n_point=None):
+    """Measure the taps quantized to every word length at once.
+
+    The taps are quantized to every word length with the most fractional
+    bits, and the responses of all the word lengths are computed by one
+    batched FFT.
+
+    Parameters
+    ----------
+    spec: FilterSpec
+        The specification which defines the bands
+    taps: ndarray
+        designed float taps
+    n_bits: iterable of int
+        word lengths including the sign bit
+    rounding: str
+        ROUND or TRUNCATE
+    n_point: int, optional
+        number of frequency points (the default is None, None이면
+        POINTS_PER_TAP * len(taps))
+
+    Returns
+    -------
+    list of WordLengthPoint
+        in the order of n_bits. degradation_db is the attenuation of the
+        float taps minus the attenuation of the quantized taps.
+    """
+    taps = np.asarray(taps, dtype=float)
+    n_bits = np.array(list(n_bits), dtype=int)
+    if np.any((n_bits < 2) | (n_bits > MAX_BITS)):
+        raise ValueError(f"n_bits must be in [2, {MAX_BITS}]")
+    if n_point is None:
+        n_point = max(POINTS_PER_TAP * len(taps), MIN_POINTS)
+
+    frac_bits = max_frac_bits(taps, n_bits)
+    codes = _quantize(taps, n_bits[:, None], frac_bits[:, None], rounding)
+    stack = np.vstack([taps, np.ldexp(codes.astype(float),
+                                      -frac_bits[:, None])])
+    mag = np.abs(complex_response_points(stack, n_point))
+    ripple, atten = band_metrics(spec, mag)
+
+    return [WordLengthPoint(int(n_bit), int(frac), float(rip), float(att),
+                            float(atten[0] - att))
+            for n_bit, frac, rip, att in zip(n_bits, frac_bits, ripple[1:],
+                                             atten[1:])]
+
+
+def narrowest_word_length(points, min_atten_db, max_ripple_db=np.inf):
+    """Return the point with the fewest bits which meets the target.
+
+    None is returned if no point meets the target.
+    """
+    candidates = [point for point in points
+                  if point.meets(min_atten_db, max_ripple_db)]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda point: point.n_bit)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Parameter sweep of filter designs."""
+
+# Standard library imports
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import NamedTuple, Optional
+
+# Local import
+from filterdesigner.filterdesign.design import FilterSpec
+from filterdesigner.filterdesign.metrics import design_and_measure
+
+
+class SweepPoint(NamedTuple):
+    """Result of one design of a sweep."""
+    spec: FilterSpec
+    passband_ripple_db: float
+    stopband_atten_db: float
+    design_time: float
+    error: Optional[str] = None
+
+    @classmethod
+    def from_result(cls, spec, result):
+        """Create SweepPoint from the result of design_and_measure."""
+        _, metrics, elapsed, error = result
+        if error is not None:
+            return cls(spec, float('nan'), float('nan'), elapsed, error)
+        return cls(spec, metrics.passband_ripple_db,
+                   metrics.stopband_atten_db, elapsed)
+
+    def meets(self, max_ripple_db, min_atten_db):
+        """Return True if the design meets the ripple/attenuation target."""
+        return (self.error is None and
+                self.passband_ripple_db <= max_ripple_db and
+                self.stopband_atten_db >= min_atten_db)
+
+
+def sweep_specs(base_spec, n_taps=None, weights=None, densities=None):
+    """Return the grid of specs around base_spec.
+
+    Parameters
+    ----------
+    base_spec: FilterSpec
+    n_taps: iterable of int, optional
+        (the default is None, None이면 base_spec의 값만 사용)
+    weights: iterable of tuple of float, optional
+    densities: iterable of int, optional
+
+    Returns
+    -------
+    list of FilterSpec
+    """
+    n_taps = [base_spec.n_tap] if n_taps is None else n_taps
+    weights = [base_spec.weights] if weights is None else weights
+    densities = [base_spec.density] if densities is None else densities
+
+    return [FilterSpec.create(base_spec.filter_type, base_spec.method, n_tap,
+                              base_spec.fs, base_spec.freqs, weight, density)
+            for n_tap, weight, density in product(n_taps, weights,
+                                                  densities)]
+
+
+def run_sweep(specs, jobs=None, executor=None):
+    """Design specs in a process pool and measure them.
+
+    Parameters
+    ----------
+    specs: list of FilterSpec
+        (ex. the result of sweep_specs)
+    jobs: int, optional
+        number of worker processes (the default is None, None이면 CPU 개수)
+    executor: concurrent.futures.Executor, optional
+        executor to use instead of a new ProcessPoolExecutor
+
+    Returns
+    -------
+    list of SweepPoint
+    """
+    if executor is not None:
+        results = executor.map(design_and_measure, specs)
+        return [SweepPoint.from_result(spec, result)
+                for spec, result in zip(specs, results)]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return run_sweep(specs, executor=executor)
+
+
+def cheapest_point(points, max_ripple_db, min_atten_db):
+    """Return the point with the fewest taps which meets the target.
+
+    Ties are broken by the design time. None is returned if no point meets
+    the target.
+    """
+    candidates = [point for point in points
+                  if point.meets(max_ripple_db, min_atten_db)]
+    if not candidates:
+        return None
+    return min(candidates,
+               key=lambda point: (point.spec.n_tap, point.design_time))
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""UI for parameter sweep."""
+
+# Standard library imports
+import math
+import os
+from decimal import Decimal
+
+# Third party imports
+from qtpy.QtCore import Qt, QTimer, Slot
+from qtpy.QtGui import QDoubleValidator
+from qtpy.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
+                            QLineEdit, QSpinBox, QPushButton, QProgressBar,
+                            QTableWidget, QTableWidgetItem, QMessageBox,
+                            QAbstractItemView)
+
+# Local import
+from filterdesigner.filterdesign.design import BAND_GAINS
+from filterdesigner.filterdesign.metrics import design_and_measure
+from filterdesigner.filterdesign.sweep import (SweepPoint, sweep_specs,
+                                               cheapest_point)
+from filterdesigner.filterdesign.worker import spawn_pool
+
+COLUMNS = ["Order", "Weights", "Density", "Ripple [dB]",
+           "Attenuation [dB]", "Time [ms]"]
+
+
+def parse_values(text, cast=float):
+    """Parse "1, 2, 5" or "start:stop:step" (stop inclusive) to a list.
+
+    Parameters
+    ----------
+    text: str
+    cast: type
+        type of the values (ex. int, float)
+
+    Returns
+    -------
+    list
+    """
+    text = text.strip()
+    if ':' in text:
+        texts = text.split(':')
+        parts = [cast(part) for part in texts]
+        if (len(parts) != 3 or parts[2] <= 0 or
+                not all(math.isfinite(part) for part in parts)):
+            raise ValueError(f"Invalid range: {text}")
+        start, stop, step = parts
+        if stop < start:
+            return []
+        # Every value is computed from start, so the errors of the float
+        # steps do not accumulate, and rounded to the decimals of the text
+        n_value = int(math.floor((stop - start) / step + 1e-9)) + 1
+        values = [cast(start + idx * step) for idx in range(n_value)]
+        if cast is float:
+            decimals = max(-Decimal(part.strip()).as_tuple().exponent
+                           for part in (texts[0], texts[2]))
+            values = [round(value, decimals) for value in values]
+        return values
+
+    return [cast(part) for part in text.split(',') if part.strip()]
+
+
+class SweepDialog(QDialog):
+    """Design a grid of parameters around a spec and show the metrics."""
+
+    def __init__(self, base_spec, parent=None):
+        super(SweepDialog, self).__init__(parent)
+        self.setWindowTitle("Parameter Sweep")
+        self.base_spec = base_spec
+        self.executor = None
+        self.futures = []
+        self.points = []
+
+        self.order_line = QLineEdit(
+            f"{max(base_spec.n_tap - 64, 1)}:{base_spec.n_tap + 64}:16", self)
+        gains = BAND_GAINS[base_spec.filter_type]
+        stop_weights = [w for w, gain in zip(base_spec.weights, gains)
+                        if not gain]
+        self.weight_line = QLineEdit(
+            ', '.join(f"{w:g}" for w in sorted(set(stop_weights))), self)
+        self.density_line = QLineEdit(f"{base_spec.density}", self)
+        self.ripple_line = QLineEdit("0.1", self)
+        self.ripple_line.setValidator(QDoubleValidator(0, 100, 10))
+        self.atten_line = QLineEdit("60", self)
+        self.atten_line.setValidator(QDoubleValidator(0, 1000, 10))
+        self.jobs_spin = QSpinBox(self)
+        self.jobs_spin.setRange(1, 256)
+        self.jobs_spin.setValue(os.cpu_count() or 1)
+
+        form = QFormLayout()
+        form.addRow("Orders", self.order_line)
+        form.addRow("Stopband weights", self.weight_line)
+        form.addRow("Density factors", self.density_line)
+        form.addRow("Max passband ripple [dB]", self.ripple_line)
+        form.addRow("Min stopband attenuation [dB]", self.atten_line)
+        form.addRow("Processes", self.jobs_spin)
+
+        self.table = QTableWidget(0, len(COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSortingEnabled(True)
+
+        self.progress = QProgressBar(self)
+        self.push_run = QPushButton("Run", self)
+        self.push_run.clicked.connect(self.run)
+        self.push_cancel = QPushButton("Cancel", self)
+        self.push_cancel.clicked.connect(self.cancel)
+        self.push_cancel.setEnabled(False)
+
+        hbox = QHBoxLayout()
+        hbox.addWidget(self.progress)
+        hbox.addWidget(self.push_run)
+        hbox.addWidget(self.push_cancel)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        layout.addWidget(self.table)
+        layout.addLayout(hbox)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(50)
+        self.timer.timeout.connect(self.poll)
+
+        self.resize(700, 600)
+
+    def get_specs(self):
+        """Return the specs of the grid in the UI."""
+        gains = BAND_GAINS[self.base_spec.filter_type]
+        weights = [tuple(w if gain else stop_weight
+                         for w, gain in zip(self.base_spec.weights, gains))
+                   for stop_weight in parse_values(self.weight_line.text())]
+        return sweep_specs(self.base_spec,
+                           parse_values(self.order_line.text(), int),
+                           weights,
+                           parse_values(self.density_line.text(), int))
+
+    @Slot()
+    def run(self):
+        """Submit every design of the grid to a process pool."""
+        try:
+            specs = self.get_specs()
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
+
+        self.cancel()
+        self.points = []
+        self.table.setRowCount(0)
+        self.progress.setRange(0, len(specs))
+        self.progress.setValue(0)
+
+        self.executor = spawn_pool(self.jobs_spin.value())
+        self.futures = [(spec, self.executor.submit(design_and_measure, spec))
+                        for spec in specs]
+        self.push_cancel.setEnabled(True)
+        self.timer.start()
+
+    @Slot()
+    def cancel(self):
+        """Cancel the designs which have not started."""
+        self.timer.stop()
+        for _, future in self.futures:
+            future.cancel()
+        self.futures = []
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        self.push_cancel.setEnabled(False)
+
+    @Slot()
+    def poll(self):
+        """Add the finished designs to the table."""
+        pending = []
+        for spec, future in self.futures:
+            if future.done():
+                point = SweepPoint.from_result(spec, future.result())
+                self.points.append(point)
+                self.add_row(point, len(self.points) - 1)
+            else:
+                pending.append((spec, future))
+        self.futures = pending
+        self.progress.setValue(len(self.points))
+
+        if not pending:
+            self.cancel()
+            self.select_cheapest()
+
+    def add_row(self, point, index):
+        """Add point, which is self.points[index], to the table."""
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        values = [point.spec.n_tap,
+                  ', '.join(f"{w:g}" for w in point.spec.weights),
+                  point.spec.density,
+                  point.passband_ripple_db,
+                  point.stopband_atten_db,
+                  point.design_time * 1e3]
+        for col, value in enumerate(values):
+            item = QTableWidgetItem()
+            if isinstance(value, float):
+                item.setData(Qt.DisplayRole, round(value, 4))
+            else:
+                item.setData(Qt.DisplayRole, value)
+            if point.error is not None:
+                item.setToolTip(point.error)
+            self.table.setItem(row, col, item)
+        self.table.item(row, 0).setData(Qt.UserRole, index)
+        self.table.setSortingEnabled(sorting)
+
+    def select_cheapest(self):
+        """Select the row of the cheapest design which meets the target."""
+        try:
+            best = cheapest_point(self.points,
+                                  float(self.ripple_line.text()),
+                                  float(self.atten_line.text()))
+        except ValueError:
+            return
+        if best is None:
+            return
+
+        index = self.points.index(best)
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).data(Qt.UserRole) == index:
+                self.table.selectRow(row)
+                break
+
+    def closeEvent(self, event):
+        """Override closeEvent of Qt."""
+        self.cancel()
+        super(SweepDialog, self).closeEvent(event)
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Run filter design in a background process."""
+
+# Standard library imports
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import (CancelledError, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from threading import Event
+
+# Third party imports
+from qtpy.QtCore import QObject, QTimer, Signal
+
+# Local import
+from filterdesigner.filterdesign.design import design_filter
+from filterdesigner.filterdesign.minorder import minimum_order
+from filterdesigner.helper.profiler import profiler
+
+
+def spawn_pool(max_workers):
+    """Return a ProcessPoolExecutor whose processes are spawned.
+
+    Forking the GUI process would copy the state of Qt. Before Python 3.7,
+    ProcessPoolExecutor has no mp_context and uses the default start
+    method.
+    """
+    if sys.version_info >= (3, 7):
+        return ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context('spawn'))
+    return ProcessPoolExecutor(max_workers)
+
+
+def terminate_pool(pool):
+    """Shut pool down without waiting for its running tasks.
+
+    ProcessPoolExecutor.shutdown only cancels the tasks which have not
+    started, so the processes of the pool are terminated.
+    """
+    processes = list((getattr(pool, '_processes', None) or {}).values())
+    for process in processes:
+        process.terminate()
+    pool.shutdown(wait=False)
+    for process in processes:
+        process.join()
+
+
+class SearchExecutor(object):
+    """Executor for minimum_order whose designs can be cancelled from
+    another thread.
+
+    map submits every candidate to a process pool and returns the results
+    once they are all done, or raises CancelledError soon after cancel is
+    called. The candidates which have not started are never designed.
+    """
+
+    def __init__(self, executor, poll_interval=0.05):
+        self.executor = executor
+        self.poll_interval = poll_interval
+        self._cancelled = Event()
+        self._futures = []
+
+    def map(self, func, *iterables):
+        """Return the list of func(*args) designed in parallel."""
+        futures = [self.executor.submit(func, *args)
+                   for args in zip(*iterables)]
+        self._futures.extend(futures)
+        while True:
+            if self._cancelled.is_set():
+                self.cancel()
+                raise CancelledError()
+            _, pending = wait(futures, timeout=self.poll_interval)
+            if not pending:
+                return [future.result() for future in futures]
+
+    def cancel(self):
+        """Stop the search and the designs which have not started."""
+        self._cancelled.set()
+        for future in self._futures:
+            future.cancel()
+
+    def running(self):
+        """Return True if a design of the search is still running."""
+        return any(not future.done() for future in self._futures)
+
+
+def _serve(conn):
+    """Run every task received from conn until None is received.
+
+    (job_id, result, error, seconds of the task) is sent back for every task.
+    """
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            break
+        if msg is None:
+            break
+
+        job_id, task, spec = msg
+        t_start = time.perf_counter()
+        try:
+            result = task(spec)
+        except Exception as e:  # Report every failure to the GUI
+            conn.send((job_id, None, str(e), time.perf_counter() - t_start))
+        else:
+            conn.send((job_id, result, None, time.perf_counter() - t_start))
+
+
+class DesignWorker(QObject):
+    """Design filters in a background process.
+
+    Only the result of the latest submitted job is emitted. A job which is
+    still running when a new one is submitted or when cancel is called is
+    stopped by terminating the process. A standby process is kept started,
+    so the next job does not wait for python and scipy to be imported.
+
+    The minimum order search of submit_search runs in a thread of this
+    process and designs its candidates in parallel on a pool of processes,
+    which the daemonic design process could not start.
+    """
+    sig_finished = Signal(int, object, object)  # job_id, spec, result
+    sig_failed = Signal(int, str)  # job_id, error message
+    sig_busy = Signal(bool)
+
+    def __init__(self, parent=None, poll_interval=20):
+        super(DesignWorker, self).__init__(parent)
+        self._ctx = multiprocessing.get_context('spawn')
+        self._process = None
+        self._conn = None
+        self._standby = None  # (process, conn)
+        self._pool = None  # process pool of the candidates of a search
+        self._threads = None
+        self._search = None  # (Future, SearchExecutor) of a running search
+
+        self._job_id = 0
+        self._spec = None
+        self._task_name = None
+        self._submit_time = 0.0
+        self.busy = False
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(poll_interval)
+        self._timer.timeout.connect(self._poll)
+
+    def _spawn(self):
+        """Start a new design process and return (process, conn)."""
+        conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_serve, args=(child_conn,),
+                                    daemon=True)
+        process.start()
+        child_conn.close()
+        return process, conn
+
+    def start(self):
+        """Start the design process and the standby if they are not alive."""
+        if self._process is None or not self._process.is_alive():
+            if self._standby is not None and self._standby[0].is_alive():
+                self._process, self._conn = self._standby
+                self._standby = None
+            else:
+                self._process, self._conn = self._spawn()
+
+        if self._standby is None or not self._standby[0].is_alive():
+            self._standby = self._spawn()
+
+    def _search_pool(self):
+        """Return the process pool of the searches, started on first use."""
+        if self._pool is None:
+            self._pool = spawn_pool(os.cpu_count() or 1)
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(1)
+        return self._pool
+
+    def _stop_job(self):
+        """Stop the running process job or search immediately.
+
+        The pool is discarded if designs of the search are running, since
+        the next search would wait for them.
+        """
+        if self._search is not None:
+            executor = self._search[1]
+            executor.cancel()
+            if executor.running():
+                terminate_pool(self._pool)
+                self._pool = None
+            self._search = None
+        else:
+            self._kill_process()
+
+    def _kill_process(self):
+        """Stop the design process immediately."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def _set_busy(self, busy):
+        if busy:
+            self._timer.start()
+        else:
+            self._timer.stop()
+        if busy != self.busy:
+            self.busy = busy
+            self.sig_busy.emit(busy)
+
+    def submit(self, spec, task=design_filter):
+        """Run task(spec) in background and return the id of the job.
+
+        task must be picklable, such as a function of a module or a
+        functools.partial of it. The default task returns the taps of spec.
+        """
+        if self.busy:
+            self._stop_job()
+
+        self._job_id += 1
+        self._spec = spec
+        self.start()
+        self._conn.send((self._job_id, task, spec))
+        self._task_name = getattr(getattr(task, 'func', task), '__name__',
+                                  'task')
+        self._submit_time = profiler.now()
+        self._set_busy(True)
+        return self._job_id
+
+    def submit_search(self, spec, max_ripple_db, min_atten_db):
+        """Search the minimum order of spec and return the id of the job.
+
+        The result is an OrderSearchResult.
+        """
+        if self.busy:
+            self._stop_job()
+
+        self._job_id += 1
+        self._spec = spec
+        executor = SearchExecutor(self._search_pool())
+        future = self._threads.submit(minimum_order, spec, max_ripple_db,
+                                      min_atten_db, executor=executor)
+        self._search = (future, executor)
+        self._task_name = 'minimum_order'
+        self._submit_time = profiler.now()
+        self._set_busy(True)
+        return self._job_id
+
+    def cancel(self):
+        """Stop the running job."""
+        if self.busy:
+            self._stop_job()
+            self._set_busy(False)
+
+    def shutdown(self):
+        """Stop the design process and the standby."""
+        self.cancel()
+        for process, conn in [(self._process, self._conn),
+                              self._standby or (None, None)]:
+            if process is not None:
+                if process.is_alive():
+                    conn.send(None)
+                process.join()
+                conn.close()
+        self._process = None
+        self._conn = None
+        self._standby = None
+        if self._threads is not None:
+            self._threads.shutdown(wait=False)
+        if self._pool is not None:
+            terminate_pool(self._pool)
+        self._pool = None
+        self._threads = None
+
+    def _poll_search(self):
+        """Emit the result of the search when it is done."""
+        future, _ = self._search
+        if not future.done():
+            return
+        self._search = None
+        self._set_busy(False)
+        try:
+            result = future.result()
+        except Exception as e:  # Report every failure to the GUI
+            self.sig_failed.emit(self._job_id, str(e))
+            return
+        if profiler.enabled:
+            profiler.add_span('worker.minimum_order', self._submit_time,
+                              profiler.now() - self._submit_time)
+        self.sig_finished.emit(self._job_id, self._spec, result)
+
+    def _poll(self):
+        """Emit the result of the latest job when it is ready."""
+        if self._search is not None:
+            self._poll_search()
+            return
+        while self._conn is not None and self._conn.poll():
+            try:
+                job_id, result, error, elapsed = self._conn.recv()
+            except (EOFError, OSError):
+                self._kill_process()
+                self._set_busy(False)
+                self.sig_failed.emit(self._job_id,
+                                     "Design process exited unexpectedly")
+                return
+
+            if job_id != self._job_id:  # stale result
+                continue
+
+            if profiler.enabled:
+                now = profiler.now()
+                profiler.add_span('worker.roundtrip', self._submit_time,
+                                  now - self._submit_time)
+                profiler.add_span(f'worker.{self._task_name}',
+                                  now - elapsed, elapsed)
+            self._set_busy(False)
+            if error is None:
+                self.sig_finished.emit(job_id, self._spec, result)
+            else:
+                self.sig_failed.emit(job_id, error)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""Filter signal files larger than the memory.
+
+Usage::
+
+    python -m filterdesigner.filterfile capture.npy filtered.npy --taps lpf.npy
+    python -m filterdesigner.filterfile capture.bin filtered.bin --taps lpf.npy \\
+        --dtype int16 --channels 4 --chunk 1048576
+
+The input is a .npy file, whose last axis is the time (ex. channels x
+samples), or a raw binary file of --dtype samples, interleaved if there are
+several --channels. Both are memory-mapped and filtered chunk by chunk with
+overlap-save FFT convolution, so the memory does not depend on the size of
+the file. The output has the layout of the input, with float32 samples for
+real input and complex64 samples for complex input by default. The taps are
+a .npy file such as the output of filterdesigner.batch.
+"""
+
+# Standard library imports
+import argparse
+import sys
+import time
+from typing import NamedTuple
+
+# Third party imports
+import numpy as np
+
+# Local import
+from filterdesigner.helper.stream import StreamFilter
+
+CHUNK_SIZE = 1 << 20
+LOG_INTERVAL = 5.0  # seconds
+
+
+class FilterFileResult(NamedTuple):
+    """Result of filter_file."""
+    n_sample: int
+    elapsed: float
+
+    @property
+    def samples_per_second(self):
+        """Throughput in samples per channel per second."""
+        return self.n_sample / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def open_input(path, dtype=None, channels=1):
+    """Memory-map a signal file.
+
+    Returns
+    -------
+    (np.memmap, int)
+        data, time axis
+    """
+    if path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+        return data, data.ndim - 1
+
+    if dtype is None:
+        raise ValueError("dtype is required for a raw file")
+    data = np.memmap(path, dtype=dtype, mode='r')
+    if channels > 1:
+        if len(data) % channels:
+            raise ValueError(f"The file size is not a multiple of "
+                             f"{channels} channels")
+        return data.reshape(-1, channels), 0
+    return data, 0
+
+
+def open_output(path, dtype, shape):
+    """Create a memory-mapped output file (.npy or raw)."""
+    if path.endswith('.npy'):
+        return np.lib.format.open_memmap(path, mode='w+', dtype=dtype,
+                                         shape=shape)
+    return np.memmap(path, dtype=dtype, mode='w+', shape=shape)
+
+
+def _time_slice(axis, start, stop):
+    return (slice(None),) * axis + (slice(start, stop),)
+
+
+def filter_file(taps, in_path, out_path, dtype=None, channels=1,
+                out_dtype=None, chunk_size=CHUNK_SIZE, log=None):
+    """Filter a signal file into another file chunk by chunk.
+
+    Parameters
+    ----------
+    taps: ndarray
+    in_path: str
+        .npy file or raw binary file
+    out_path: str
+        .npy file or raw binary file
+    dtype: dtype, optional
+        sample type of a raw input file (ex. 'int16', 'complex64')
+    channels: int
+        number of interleaved channels of a raw input file
+    out_dtype: dtype, optional
+        (the default is None, None이면 float32 or complex64)
+    chunk_size: int
+        number of samples per channel read at once
+    log: callable, optional
+        called with the progress and the throughput
+
+    Returns
+    -------
+    FilterFileResult
+    """
+    data, axis = open_input(in_path, dtype, channels)
+    if out_dtype is None:
+        out_dtype = (np.complex64 if np.iscomplexobj(data)
+                     else np.float32)
+    out = open_output(out_path, out_dtype, data.shape)
+    n_sample = data.shape[axis]
+
+    stream_filter = StreamFilter(taps)
+    t_start = time.perf_counter()
+    t_log = t_start
+    n_written = 0
+
+    def write(block):
+        nonlocal n_written
+        n_block = block.shape[-1]
+        out[_time_slice(axis, n_written, n_written + n_block)] = \
+            np.moveaxis(block, -1, axis)
+        n_written += n_block
+
+    for start in range(0, n_sample, chunk_size):
+        chunk = data[_time_slice(axis, start, start + chunk_size)]
+        write(stream_filter.process(np.moveaxis(chunk, axis, -1)))
+
+        now = time.perf_counter()
+        if log is not None and now - t_log > LOG_INTERVAL:
+            t_log = now
+            log(f"{start + chunk.shape[axis]} / {n_sample} samples, "
+                f"{(start + chunk.shape[axis]) / (now - t_start):.3g} "
+                f"samples/s")
+    if n_sample:
+        write(stream_filter.flush())
+    out.flush()
+    del out
+
+    result = FilterFileResult(n_sample, time.perf_counter() - t_start)
+    if log is not None:
+        log(f"{n_sample} samples in {result.elapsed:.2f} s, "
+            f"{result.samples_per_second:.3g} samples/s")
+    return result
+
+
+def main(argv=None):
+    """Filter a signal file from the command line."""
+    parser = argparse.ArgumentParser(
+        prog='python -m filterdesigner.filterfile',
+        description="Filter a signal file larger than the memory.")
+    parser.add_argument('input', help=".npy or raw binary signal file")
+    parser.add_argument('output', help=".npy or raw binary output file")
+    parser.add_argument('--taps', required=True, help=".npy file of taps")
+    parser.add_argument('--dtype', help="sample type of a raw input file "
+                                        "(ex. int16, complex64)")
+    parser.add_argument('--channels', type=int, default=1,
+                        help="interleaved channels of a raw input file")
+    parser.add_argument('--out-dtype', help="sample type of the output")
+    parser.add_argument('--chunk', type=int, default=CHUNK_SIZE,
+                        help="samples per channel read at once")
+    args = parser.parse_args(argv)
+
+    filter_file(np.load(args.taps), args.input, args.output, args.dtype,
+                args.channels, args.out_dtype, args.chunk, log=print)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Standard library imports
+import hashlib
+from collections import OrderedDict
+
+# Third party imports
+from numpy import ndarray, ascontiguousarray
+
+
+def array_hash(data):
+    """Return the digest of the dtype, shape and values of data.
+
+    Parameters
+    ----------
+    data: ndarray
+
+    Returns
+    -------
+    str
+    """
+    data = ascontiguousarray(data)
+    digest = hashlib.sha1(f"{data.dtype.str}{data.shape}".encode())
+    digest.update(data.tobytes())
+    return digest.hexdigest()
+
+
+def nbytes(value):
+    """Return the memory used by the ndarrays in value."""
+    if isinstance(value, ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(nbytes(v) for v in value)
+    return 0
+
+
+class LRUCache(object):
+    """Least recently used cache limited by the memory of its values.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The least recently used items are removed while the memory of the
+        cached values exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.n_bytes = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """Return the value of key and mark it as the most recently used."""
+        try:
+            value, _ = self._items[key]
+        except KeyError:
+            return default
+        self._items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Cache value of key."""
+        size = nbytes(value)
+        if key in self._items:
+            self.n_bytes -= self._items.pop(key)[1]
+        if size > self.max_bytes:
+            return
+
+        self._items[key] = (value, size)
+        self.n_bytes += size
+        while self.n_bytes > self.max_bytes:
+            _, (_, size_old) = self._items.popitem(last=False)
+            self.n_bytes -= size_old
+
+    def clear(self):
+        """Remove every item."""
+        self._items.clear()
+        self.n_bytes = 0
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Half storage and folded filtering of linear-phase taps."""
+
+# Standard library imports
+from typing import NamedTuple
+
+# Third party imports
+import numpy as np
+
+SYMMETRIC = 1
+ANTISYMMETRIC = -1
+# Outputs of a block of FoldedFilter, small enough for the block of every
+# tap pair to stay in the cache
+BLOCK_SAMPLES = 1 << 15
+
+
+def symmetry_of(taps, rtol=1e-9):
+    """Return SYMMETRIC, ANTISYMMETRIC or None if taps are neither.
+
+    taps[k] and ±taps[-1 - k] may differ by rtol of the largest tap.
+    """
+    taps = np.asarray(taps, dtype=float)
+    tol = rtol * np.max(np.abs(taps), initial=0)
+    if np.all(np.abs(taps - taps[::-1]) <= tol):
+        return SYMMETRIC
+    if np.all(np.abs(taps + taps[::-1]) <= tol):
+        return ANTISYMMETRIC
+    return None
+
+
+class LinearPhaseTaps(NamedTuple):
+    """Linear-phase taps stored as their first half.
+
+    Attributes
+    ----------
+    half: ndarray
+        taps[:(n_tap + 1) // 2], including the center tap of an odd n_tap
+    n_tap: int
+    symmetry: int
+        SYMMETRIC (taps[k] == taps[-1 - k], type I and II) or ANTISYMMETRIC
+        (taps[k] == -taps[-1 - k], type III and IV)
+    """
+    half: np.ndarray
+    n_tap: int
+    symmetry: int
+
+    @classmethod
+    def from_taps(cls, taps, rtol=1e-9):
+        """Create LinearPhaseTaps from the full taps.
+
+        Raises ValueError if taps are neither symmetric nor antisymmetric.
+        """
+        taps = np.asarray(taps, dtype=float)
+        symmetry = symmetry_of(taps, rtol)
+        if taps.ndim != 1 or len(taps) == 0 or symmetry is None:
+            raise ValueError("taps must be a symmetric or an antisymmetric "
+                             "1-D array")
+        return cls(taps[:(len(taps) + 1) // 2].copy(), len(taps), symmetry)
+
+    @classmethod
+    def from_design(cls, result, rtol=1e-9):
+        """Create LinearPhaseTaps from (taps, fs) returned by calc_filter."""
+        taps, _ = result
+        return cls.from_taps(taps, rtol)
+
+    @property
+    def fir_type(self):
+        """Return the type (1 to 4) of the linear-phase FIR filter."""
+        if self.symmetry == SYMMETRIC:
+            return 1 if self.n_tap % 2 else 2
+        return 3 if self.n_tap % 2 else 4
+
+    @property
+    def taps(self):
+        """Return the full taps."""
+        n_mirror = self.n_tap // 2
+        mirror = self.symmetry * self.half[:n_mirror][::-1]
+        return np.concatenate([self.half, mirror])
+
+
+class FoldedFilter(object):
+    """Stateful direct-form filter of linear-phase taps.
+
+    The two samples which meet mirrored taps are added before the multiply,
+    so an output takes (n_tap + 1) // 2 multiplies instead of n_tap, and
+    only the half of the taps is stored. The output equals
+    np.convolve(data, taps)[:len(data)] up to the rounding. The samples lie
+    along the last axis and the leading axes (ex. channels) are filtered
+    independently.
+
+    Parameters
+    ----------
+    taps: LinearPhaseTaps or ndarray
+        full taps are converted by LinearPhaseTaps.from_taps
+    """
+
+    def __init__(self, taps):
+        if not isinstance(taps, LinearPhaseTaps):
+            taps = LinearPhaseTaps.from_taps(taps)
+        self.linear_phase = taps
+        self.n_tap = taps.n_tap
+        self.n_pair = taps.n_tap // 2
+        self.reset()
+
+    @classmethod
+    def from_design(cls, result):
+        """Create FoldedFilter from (taps, fs) returned by calc_filter."""
+        return cls(LinearPhaseTaps.from_design(result))
+
+    def reset(self):
+        """Clear the state as if no sample had been processed."""
+        self._history = None
+
+    def process(self, chunk):
+        """Filter the next chunk of the stream.
+
+        Parameters
+        ----------
+        chunk: ndarray
+            real or complex samples along the last axis
+
+        Returns
+        -------
+        ndarray
+            one output per input sample
+        """
+        chunk = np.asarray(chunk)
+        if not np.iscomplexobj(chunk):
+            chunk = chunk.astype(float, copy=False)
+        n_keep = self.n_tap - 1
+        if self._history is None:
+            self._history = np.zeros(chunk.shape[:-1] + (n_keep,),
+                                     dtype=chunk.dtype)
+        elif chunk.shape[:-1] != self._history.shape[:-1]:
+            raise ValueError(f"chunk must have the leading shape "
+                             f"{self._history.shape[:-1]}")
+
+        if chunk.shape[-1] == 0:
+            return np.empty(chunk.shape, dtype=self._history.dtype)
+
+        buffer = np.concatenate([self._history, chunk], axis=-1)
+        n_sample = chunk.shape[-1]
+        out = np.empty(chunk.shape, dtype=buffer.dtype)
+
+        # The output n meets buffer[..., n + j] with the tap n_keep - j. The
+        # taps are applied pair by pair to a block of outputs: the two
+        # samples of a pair are pre-added, then multiplied once.
+        half = self.linear_phase.half
+        symmetry = self.linear_phase.symmetry
+        n_row = max(int(np.prod(chunk.shape[:-1])), 1)
+        n_block = max(BLOCK_SAMPLES // n_row, 256)
+        for start in range(0, n_sample, n_block):
+            stop = min(start + n_block, n_sample)
+            block = out[..., start:stop]
+            pair = np.empty_like(block)
+            if self.n_tap % 2:
+                np.multiply(buffer[..., start + self.n_pair:
+                                   stop + self.n_pair],
+                            half[self.n_pair], out=block)
+            else:
+                block[...] = 0
+            for idx in range(self.n_pair):
+                # buffer[..., n + n_keep - idx] meets the tap idx and
+                # buffer[..., n + idx] meets the mirrored tap
+                if symmetry == SYMMETRIC:
+                    np.add(buffer[..., start + n_keep - idx:
+                                  stop + n_keep - idx],
+                           buffer[..., start + idx:stop + idx], out=pair)
+                else:
+                    np.subtract(buffer[..., start + n_keep - idx:
+                                       stop + n_keep - idx],
+                                buffer[..., start + idx:stop + idx],
+                                out=pair)
+                pair *= half[idx]
+                block += pair
+
+        self._history = buffer[..., buffer.shape[-1] - n_keep:]
+        return out
+
+    def flush(self, full=False):
+        """Return the decay after the end of the input if full is True, and
+        reset the state."""
+        if self._history is None:
+            return np.empty(0)
+        n_zero = self.n_tap - 1 if full else 0
+        out = self.process(np.zeros(self._history.shape[:-1] + (n_zero,),
+                                    dtype=self._history.dtype))
+        self.reset()
+        return out
+
+    def filter(self, data, full=False):
+        """Filter a whole signal from the current state and reset the state.
+
+        The output has the length of data, or n_tap - 1 more samples if
+        full is True.
+        """
+        return np.concatenate([self.process(data), self.flush(full)],
+                              axis=-1)
+
+    def stream(self, chunks, full=False):
+        """Yield the output of every chunk of an iterable, then the decay."""
+        for chunk in chunks:
+            out = self.process(chunk)
+            if out.shape[-1]:
+                yield out
+        out = self.flush(full)
+        if out.shape[-1]:
+            yield out
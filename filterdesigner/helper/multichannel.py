@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Filtering of multichannel signals on several cores."""
+
+# Standard library imports
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+# Third party imports
+import numpy as np
+
+# Local imports
+from filterdesigner.helper.stream import StreamFilter, optimal_fft_size
+
+BACKENDS = ('thread', 'process')
+
+
+def channel_groups(n_channel, workers):
+    """Split range(n_channel) into at most workers contiguous slices of
+    nearly equal sizes."""
+    bounds = np.linspace(0, n_channel, min(workers, n_channel) + 1)
+    bounds = np.round(bounds).astype(int)
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _filter_rows(taps, n_fft, data, out, rows, full):
+    """Filter data[rows] into out[rows] with an own StreamFilter."""
+    out[rows] = StreamFilter(taps, n_fft).filter(data[rows], full)
+
+
+def _attach(name):
+    """Attach to a shared memory block created by another process."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+class _SharedArray(object):
+    """Array shared with the worker processes.
+
+    The array is in a shared memory block, or in a memory-mapped temporary
+    file before Python 3.8. spec, (name, shape, dtype, is_file), attaches
+    to the array in another process.
+    """
+
+    def __init__(self, shape, dtype, spec=None):
+        self.owner = spec is None
+        if spec is None:
+            is_file = shared_memory is None
+            name = None
+        else:
+            name, shape, dtype, is_file = spec
+
+        self.block = None
+        if is_file:
+            if self.owner:
+                fd, name = tempfile.mkstemp(suffix='.dat')
+                os.close(fd)
+            self.array = np.memmap(name, dtype,
+                                   'w+' if self.owner else 'r+', shape=shape)
+        else:
+            if self.owner:
+                size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+                self.block = shared_memory.SharedMemory(create=True,
+                                                        size=size)
+                name = self.block.name
+            else:
+                self.block = _attach(name)
+            self.array = np.ndarray(shape, dtype, buffer=self.block.buf)
+        self.spec = (name, shape, dtype, is_file)
+
+    def close(self):
+        """Release the array, and remove it if this process created it."""
+        if isinstance(self.array, np.memmap):
+            self.array.flush()
+        # No view of the buffer may remain when the block is closed
+        self.array = None
+        if self.block is not None:
+            self.block.close()
+            if self.owner:
+                self.block.unlink()
+        elif self.owner:
+            os.remove(self.spec[0])
+
+
+def _filter_shared(taps, n_fft, data_spec, out_spec, rows, full):
+    """Process pool task of _filter_rows on shared arrays.
+
+    data_spec and out_spec are the specs of _SharedArray.
+    """
+    shared = [_SharedArray(None, None, spec)
+              for spec in (data_spec, out_spec)]
+    try:
+        data, out = (item.array for item in shared)
+        _filter_rows(taps, n_fft, data, out, rows, full)
+        del data, out
+    finally:
+        for item in shared:
+            item.close()
+
+
+def filter_channels(taps, data, workers=None, backend='thread', full=False,
+                    out=None):
+    """Filter every channel of a (channels x samples) array with the same
+    taps on several cores.
+
+    The channels are split into one contiguous group per worker, and every
+    group is filtered by its own StreamFilter, so the FFTs of a group run
+    on several channels at once. With the 'thread' backend the workers
+    share the arrays, which is enough to use every core since the FFTs of
+    NumPy release the GIL. The 'process' backend copies data to shared
+    memory (a memory-mapped temporary file before Python 3.8) once and the
+    workers write to a shared output, for the platforms or the small FFTs
+    where the GIL limits the threads.
+
+    Parameters
+    ----------
+    taps: ndarray
+        real taps (ex. the first item of the result of calc_filter)
+    data: ndarray
+        (channels, samples) real or complex signals, or a single channel
+    workers: int, optional
+        (the default is None, None이면 CPU 개수)
+    backend: str
+        'thread' or 'process'
+    full: bool
+        If True, the n_tap - 1 samples of the decay are returned too.
+    out: ndarray, optional
+        output array of the shape of the result
+
+    Returns
+    -------
+    ndarray
+        the filtered channels, as StreamFilter(taps).filter(data, full)
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}")
+    data = np.asarray(data)
+    if data.ndim == 1:
+        return StreamFilter(taps).filter(data, full)
+    if data.ndim != 2:
+        raise ValueError("data must be a (channels, samples) array")
+
+    taps = np.asarray(taps, dtype=float)
+    n_fft = optimal_fft_size(len(taps))
+    n_out = data.shape[1] + (len(taps) - 1 if full else 0)
+    shape = (data.shape[0], n_out)
+    dtype = np.complex128 if np.iscomplexobj(data) else np.float64
+    if out is None:
+        out = np.empty(shape, dtype)
+    elif out.shape != shape:
+        raise ValueError(f"out must have the shape {shape}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    groups = channel_groups(data.shape[0], workers)
+
+    if len(groups) <= 1 or n_out == 0:
+        _filter_rows(taps, n_fft, data, out, slice(None), full)
+    elif backend == 'thread':
+        with ThreadPoolExecutor(len(groups)) as executor:
+            for future in [executor.submit(_filter_rows, taps, n_fft, data,
+                                           out, rows, full)
+                           for rows in groups]:
+                future.result()
+    else:
+        _filter_processes(taps, n_fft, data, out, groups, full)
+    return out
+
+
+def _filter_processes(taps, n_fft, data, out, groups, full):
+    """Run _filter_shared on a process pool for every group of channels."""
+    shared_data = _SharedArray(data.shape, data.dtype)
+    try:
+        shared_data.array[...] = data
+        shared_out = _SharedArray(out.shape, out.dtype)
+        try:
+            with ProcessPoolExecutor(len(groups)) as executor:
+                for future in [executor.submit(_filter_shared, taps, n_fft,
+                                               shared_data.spec,
+                                               shared_out.spec, rows, full)
+                               for rows in groups]:
+                    future.result()
+            out[...] = shared_out.array
+        finally:
+            shared_out.close()
+    finally:
+        shared_data.close()
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Named timing spans of the stages of design and plotting."""
+
+# Standard library imports
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import NamedTuple, Optional
+
+MAX_SPANS = 10000
+
+
+class Span(NamedTuple):
+    """A finished span.
+
+    Attributes
+    ----------
+    name: str
+    start: float
+        seconds from the creation of the profiler
+    duration: float
+        seconds
+    depth: int
+        number of enclosing spans
+    peak_bytes: int, optional
+        peak of the memory traced by tracemalloc in the span above the memory
+        at its start (None if the memory is not traced, or before Python 3.9
+        whose tracemalloc can not reset the peak)
+    track: str
+        'main' for the spans of this thread, or where an added span was
+        measured (ex. 'worker')
+    """
+    name: str
+    start: float
+    duration: float
+    depth: int = 0
+    peak_bytes: Optional[int] = None
+    track: str = 'main'
+
+
+class _NullSpan(object):
+    """Context manager of a disabled profiler."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+    """Context manager which records a Span on exit."""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._enter(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler._exit(self)
+        return False
+
+
+class Profiler(object):
+    """Recorder of named timing spans.
+
+    Spans are only recorded while enabled. When disabled, span() returns a
+    shared context manager which does nothing, so the spans can be left in
+    the hot paths.
+
+    Parameters
+    ----------
+    enabled: bool
+    trace_memory: bool
+        If True, the peak memory of every span is measured with tracemalloc,
+        which slows down the allocations a lot.
+    max_spans: int
+        Only the latest max_spans spans are kept.
+    """
+
+    def __init__(self, enabled=False, trace_memory=False,
+                 max_spans=MAX_SPANS):
+        self.enabled = False
+        self.trace_memory = False
+        self.spans = deque(maxlen=max_spans)
+        self._epoch = time.perf_counter()
+        self._local = threading.local()
+        self.set_enabled(enabled, trace_memory)
+
+    def set_enabled(self, enabled, trace_memory=None):
+        """Enable or disable the recording and the memory tracing."""
+        if trace_memory is None:
+            trace_memory = self.trace_memory
+        trace_memory = enabled and trace_memory
+
+        if trace_memory and not self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+        elif self.trace_memory and not trace_memory:
+            if getattr(self, '_started_tracing', False):
+                tracemalloc.stop()
+                self._started_tracing = False
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+
+    def span(self, name):
+        """Return a context manager which records the span of name.
+
+        Examples
+        --------
+        >>> with profiler.span('tight_layout'):
+        ...     fig.tight_layout()
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def now(self):
+        """Return the seconds from the creation of the profiler."""
+        return time.perf_counter() - self._epoch
+
+    def add_span(self, name, start, duration, track='worker'):
+        """Record a span measured elsewhere (ex. in another process)."""
+        if self.enabled:
+            self.spans.append(Span(name, start, duration, 0, None, track))
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, span):
+        stack = self._stack()
+        span.depth = len(stack)
+        span.memory = None
+        if (self.trace_memory and tracemalloc.is_tracing() and
+                hasattr(tracemalloc, 'reset_peak')):  # python >= 3.9
+            current, peak = tracemalloc.get_traced_memory()
+            if stack and stack[-1].memory is not None:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            span.memory = current
+            span.peak = current
+            tracemalloc.reset_peak()
+        stack.append(span)
+        span.start = self.now()
+
+    def _exit(self, span):
+        end = self.now()
+        stack = self._stack()
+        stack.pop()
+
+        peak_bytes = None
+        if span.memory is not None and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], span.peak)
+            peak_bytes = peak - span.memory
+            tracemalloc.reset_peak()
+            if stack and stack[-1].memory is not None:
+                stack[-1].peak = max(stack[-1].peak, peak)
+
+        self.spans.append(Span(span.name, span.start, end - span.start,
+                               span.depth, peak_bytes))
+
+    def clear(self):
+        """Remove every recorded span."""
+        self.spans.clear()
+
+    def summary(self, since=0.0):
+        """Return {name: total seconds} of the spans started after since."""
+        totals = {}
+        for span in self.spans:
+            if span.start >= since:
+                totals[span.name] = totals.get(span.name, 0) + span.duration
+        return totals
+
+    def to_json(self, path):
+        """Write the spans to path as a json list."""
+        with open(path, 'w') as f:
+            json.dump([span._asdict() for span in self.spans], f, indent=2)
+
+    def to_chrome_trace(self, path):
+        """Write the spans to path in the Trace Event Format.
+
+        The file can be opened by chrome://tracing or https://ui.perfetto.dev.
+        """
+        pid = os.getpid()
+        tracks = {}
+        events = []
+        for span in self.spans:
+            if span.track not in tracks:
+                tracks[span.track] = len(tracks)
+                events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid,
+                               'tid': tracks[span.track],
+                               'args': {'name': span.track}})
+            event = {'name': span.name, 'ph': 'X', 'pid': pid,
+                     'tid': tracks[span.track], 'ts': span.start * 1e6,
+                     'dur': span.duration * 1e6}
+            if span.peak_bytes is not None:
+                event['args'] = {'peak_bytes': span.peak_bytes}
+            events.append(event)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+profiler = Profiler()
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Polyphase decimation, interpolation and rational resampling."""
+
+# Third party imports
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+
+def polyphase_branches(taps, n_branch):
+    """Split taps into n_branch polyphase branches.
+
+    Parameters
+    ----------
+    taps: ndarray
+    n_branch: int
+
+    Returns
+    -------
+    ndarray
+        (n_branch, ceil(len(taps) / n_branch)) array whose row p is
+        taps[p::n_branch], padded with zeros
+    """
+    taps = np.asarray(taps, dtype=float)
+    n_col = -(-len(taps) // n_branch)
+    branches = np.zeros(n_branch * n_col)
+    branches[:len(taps)] = taps
+    return branches.reshape(n_col, n_branch).T
+
+
+def _windows(buffer, n_window):
+    """Return a read-only view of every window of n_window samples along
+    the last axis, as sliding_window_view of NumPy 1.20."""
+    n_start = buffer.shape[-1] - n_window + 1
+    return as_strided(buffer, buffer.shape[:-1] + (n_start, n_window),
+                      buffer.strides + buffer.strides[-1:], writeable=False)
+
+
+class Resampler(object):
+    """Stateful polyphase resampler by up / down of real signals.
+
+    The output is the signal upsampled by `up` (zeros inserted), filtered by
+    taps and downsampled by `down`, but only the kept outputs are computed
+    and only from the nonzero input samples: every output is one branch of
+    ceil(len(taps) / up) taps applied to the input, so the cost follows the
+    output rate.
+
+    Every output whose input is available is returned by process(), up to
+    the length of scipy.signal.upfirdn, so the output does not depend on
+    the chunking. up and down need not be coprime. The samples lie along
+    the last axis and the leading axes (ex. channels) are resampled
+    independently.
+
+    Parameters
+    ----------
+    taps: ndarray
+        lowpass taps designed at the upsampled rate, with the cutoff below
+        min(1 / up, 1 / down) * fs / 2 of the upsampled rate
+    up: int
+    down: int
+    gain: float, optional
+        taps are multiplied by gain (the default is None, None이면 up so that
+        the interpolated signal keeps its amplitude)
+    """
+
+    def __init__(self, taps, up=1, down=1, gain=None):
+        taps = np.asarray(taps, dtype=float)
+        if taps.ndim != 1 or len(taps) == 0:
+            raise ValueError("taps must be a non-empty 1-D array")
+        if up < 1 or down < 1:
+            raise ValueError("up and down must be positive integers")
+
+        # up and down are not reduced by their gcd: the taps are designed
+        # at the rate upsampled by up, as in scipy.signal.upfirdn
+        self.up = int(up)
+        self.down = int(down)
+        self.taps = taps
+        if gain is None:
+            gain = self.up
+
+        # Reversed branches, so that an output is a dot product with the
+        # window of input samples in ascending time
+        self.branches = polyphase_branches(taps * gain, self.up)[:, ::-1]
+        self.n_branch_tap = self.branches.shape[1]
+        self.reset()
+
+    @classmethod
+    def from_design(cls, result, up=1, down=1):
+        """Create Resampler from (taps, fs) returned by calc_filter."""
+        taps, _ = result
+        return cls(taps, up, down)
+
+    def reset(self):
+        """Clear the state as if no sample had been processed."""
+        self._history = None
+        self._n_input = 0  # input samples before the history ends
+        self._n_output = 0
+
+    def n_output(self, n_input):
+        """Return the number of outputs of the first n_input samples.
+
+        An output needs an input at or before it, and the outputs end with
+        the last nonzero output of scipy.signal.upfirdn if the taps are
+        shorter than up.
+        """
+        if n_input <= 0:
+            return 0
+        return min(-(-n_input * self.up // self.down),
+                   -(-((n_input - 1) * self.up + len(self.taps)) //
+                     self.down))
+
+    def process(self, chunk):
+        """Resample the next chunk of the stream.
+
+        Parameters
+        ----------
+        chunk: ndarray
+            real samples along the last axis
+
+        Returns
+        -------
+        ndarray
+            every output which depends only on the input so far
+        """
+        chunk = np.asarray(chunk, dtype=float)
+        n_keep = self.n_branch_tap - 1
+        if self._history is None:
+            self._history = np.zeros(chunk.shape[:-1] + (n_keep,))
+        elif chunk.shape[:-1] != self._history.shape[:-1]:
+            raise ValueError(f"chunk must have the leading shape "
+                             f"{self._history.shape[:-1]}")
+
+        if chunk.shape[-1] == 0:
+            return np.empty(chunk.shape)
+
+        buffer = np.concatenate([self._history, chunk], axis=-1)
+        base = self._n_input  # input index of chunk[..., 0]
+        n_start = self._n_output
+        n_end = self.n_output(base + chunk.shape[-1])
+        out = np.zeros(chunk.shape[:-1] + (n_end - n_start,))
+
+        # The outputs held back by n_output at the end of the previous chunk
+        # only meet zeros of the taps and stay zero. The others need an
+        # input of this chunk.
+        n_compute = max(n_start, -(-base * self.up // self.down))
+        skip = n_compute - n_start
+
+        # windows[..., idx, :] are the inputs of index base + idx - n_keep
+        # up to base + idx
+        windows = _windows(buffer, self.n_branch_tap)
+        for offset in range(min(self.up, n_end - n_compute)):
+            n_first = n_compute + offset
+            phase = n_first * self.down % self.up
+            first = n_first * self.down // self.up - base
+            count = len(range(offset, n_end - n_compute, self.up))
+            stop = first + (count - 1) * self.down + 1
+            out[..., skip + offset::self.up] = (
+                windows[..., first:stop:self.down, :] @ self.branches[phase])
+
+        self._history = buffer[..., buffer.shape[-1] - n_keep:]
+        self._n_input = base + chunk.shape[-1]
+        self._n_output = n_end
+        return out
+
+    def flush(self, full=False):
+        """Return the rest of the output and reset the state.
+
+        Parameters
+        ----------
+        full: bool
+            If True, the outputs of the decay after the end of the input are
+            returned too, up to the length of scipy.signal.upfirdn.
+
+        Returns
+        -------
+        ndarray
+        """
+        if self._history is None:
+            return np.empty(0)
+
+        leading = self._history.shape[:-1]
+        out = np.empty(leading + (0,))
+        if full:
+            n_full = -(-((self._n_input - 1) * self.up + len(self.taps)) //
+                       self.down)
+            n_zero = -(-(len(self.taps) - 1) // self.up)
+            out = self.process(np.zeros(leading + (n_zero,)))
+            out = out[..., :max(n_full - (self._n_output - out.shape[-1]),
+                                0)]
+        self.reset()
+        return out
+
+    def resample(self, data, full=False):
+        """Resample a whole signal from the current state and reset the
+        state."""
+        return np.concatenate([self.process(data), self.flush(full)],
+                              axis=-1)
+
+    def stream(self, chunks, full=False):
+        """Yield the output of every chunk of an iterable, then the rest."""
+        for chunk in chunks:
+            out = self.process(chunk)
+            if out.shape[-1]:
+                yield out
+        out = self.flush(full)
+        if out.shape[-1]:
+            yield out
+
+
+class Decimator(Resampler):
+    """Polyphase FIR decimator by factor.
+
+    Only every factor-th output of the filter is computed.
+    """
+
+    def __init__(self, taps, factor):
+        super(Decimator, self).__init__(taps, 1, factor)
+
+    @classmethod
+    def from_design(cls, result, factor):
+        """Create Decimator from (taps, fs) returned by calc_filter."""
+        taps, _ = result
+        return cls(taps, factor)
+
+
+class Interpolator(Resampler):
+    """Polyphase FIR interpolator by factor.
+
+    The inserted zeros are never multiplied.
+    """
+
+    def __init__(self, taps, factor):
+        super(Interpolator, self).__init__(taps, factor, 1)
+
+    @classmethod
+    def from_design(cls, result, factor):
+        """Create Interpolator from (taps, fs) returned by calc_filter."""
+        taps, _ = result
+        return cls(taps, factor)
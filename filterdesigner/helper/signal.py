@@ -5,8 +5,16 @@
 """."""
 
 import numpy as np
-from numpy import ndarray, arange, angle, rad2deg, unwrap
-from numpy.fft import fft
+from numpy import (ndarray, arange, angle, rad2deg, unwrap, zeros, empty,
+                   linspace, searchsorted)
+from numpy.fft import fft, rfft
+
+from filterdesigner.helper.profiler import profiler
+
+# Approximate peak memory per frequency point of frequency_response_points
+# (folded input, rfft output, magnitude, phase and frequency).
+BYTES_PER_POINT = 64
+MAX_RESPONSE_BYTES = 64 * 1024 * 1024
 
 
 def db2(data, db_range=60.0, db_cut=None, b_normalize=True):
@@ -69,3 +77,263 @@ def frequency_response(data, fs, uprate):
     frequency = arange(n_sample) / n_sample * fs / 2
 
     return mag_db, phase_rad, frequency
+
+
+def fold(data, n_fft):
+    """Alias data to n_fft samples along the last axis.
+
+    The fft of the result samples the DTFT of data at n_fft frequencies even
+    if data is longer than n_fft.
+
+    Parameters
+    ----------
+    data: ndarray
+    n_fft: int
+
+    Returns
+    -------
+    ndarray
+        folded data of length n_fft
+    """
+    n_sample = data.shape[-1]
+    if n_sample <= n_fft:
+        return data
+
+    folded = zeros(data.shape[:-1] + (n_fft,), dtype=data.dtype)
+    for idx in range(0, n_sample, n_fft):
+        segment = data[..., idx:idx + n_fft]
+        folded[..., :segment.shape[-1]] += segment
+    return folded
+
+
+def complex_response_points(data, n_point):
+    """Return the DTFT of real taps at n_point frequencies in [0, fs/2).
+
+    Parameters
+    ----------
+    data: ndarray
+        real taps along the last axis
+    n_point: int
+        number of frequency points
+
+    Returns
+    -------
+    ndarray
+        complex response at arange(n_point) / n_point * fs / 2
+    """
+    n_fft = 2 * n_point
+    return rfft(fold(np.asarray(data), n_fft), n_fft)[..., :n_point]
+
+
+def frequency_response_points(data, fs, n_point,
+                              max_bytes=MAX_RESPONSE_BYTES):
+    """Evaluate the response of real taps at n_point frequencies in [0, fs/2).
+
+    Unlike frequency_response, the cost depends on n_point instead of the
+    number of taps, and n_point is reduced to keep the peak memory below
+    max_bytes.
+
+    Parameters
+    ----------
+    data: ndarray
+        real taps
+    fs: float
+        sampling frequency
+    n_point: int
+        number of frequency points
+    max_bytes: int
+        upper bound of the memory used for the evaluation
+
+    Returns
+    -------
+    (ndarray, ndarray, ndarray)
+        mag_fre_db, phase_fre_rad, frequnecy
+    """
+    n_point = int(max(1, min(n_point, max_bytes // BYTES_PER_POINT)))
+    return frequency_response_batch(data, fs, n_point)
+
+
+def unwrap_inplace(phase):
+    """Unwrap phase along the last axis in place, like numpy.unwrap.
+
+    Parameters
+    ----------
+    phase: ndarray
+        float array, overwritten by the unwrapped phase
+
+    Returns
+    -------
+    ndarray
+        phase
+    """
+    if phase.shape[-1] < 2:
+        return phase
+
+    diff = np.diff(phase, axis=-1)
+    correction = np.add(diff, np.pi)
+    np.mod(correction, 2 * np.pi, out=correction)
+    correction -= np.pi
+    # A jump of exactly pi keeps its sign, as numpy.unwrap does
+    np.copyto(correction, np.pi, where=(correction == -np.pi) & (diff > 0))
+    correction -= diff
+    np.copyto(correction, 0, where=np.abs(diff) < np.pi)
+    np.cumsum(correction, axis=-1, out=correction)
+    phase[..., 1:] += correction
+    return phase
+
+
+def frequency_response_batch(data, fs, n_point, axis=-1, dtype=np.float64,
+                             out=None, db_range=90.0):
+    """Evaluate the responses of many real filters in one call.
+
+    The taps of every filter lie along axis (ex. one filter per row of a 2-D
+    array). The magnitude is normalized to the maximum of each filter like
+    db2(response, db_range), and the magnitude and the phase are computed in
+    the output buffers without other full-size temporaries than the complex
+    rfft and the scratch of the unwrap.
+
+    Parameters
+    ----------
+    data: ndarray
+        real taps
+    fs: float
+        sampling frequency
+    n_point: int
+        number of frequency points in [0, fs/2)
+    axis: int
+        axis of the taps (the default is -1)
+    dtype: dtype
+        float32 or float64 (the default is float64)
+    out: (ndarray, ndarray), optional
+        buffers of mag_fre_db and phase_fre_rad with the shape of data whose
+        axis is replaced by n_point, and the dtype of dtype (the default is
+        None, None이면 새로 할당)
+    db_range: float
+        dB Dynamic Range (the default is 90.0)
+
+    Returns
+    -------
+    (ndarray, ndarray, ndarray)
+        mag_fre_db, phase_fre_rad, frequnecy
+        (mag_fre_db and phase_fre_rad are out if it is given)
+    """
+    data = np.moveaxis(np.asarray(data), axis, -1)
+    shape = data.shape[:-1] + (n_point,)
+    if out is None:
+        mag_db = empty(shape, dtype=dtype)
+        phase_rad = empty(shape, dtype=dtype)
+        out = (np.moveaxis(mag_db, -1, axis),
+               np.moveaxis(phase_rad, -1, axis))
+    else:
+        mag_db, phase_rad = (np.moveaxis(buffer, axis, -1) for buffer in out)
+        if mag_db.shape != shape or phase_rad.shape != shape:
+            raise ValueError(f"out must have the shape {shape} along the "
+                             f"last axis")
+
+    with profiler.span('response.fft'):
+        response = complex_response_points(data.astype(dtype, copy=False),
+                                           n_point)
+
+    db_phase(response, mag_db, phase_rad, db_range)
+    frequency = arange(n_point) / n_point * fs / 2
+    return out[0], out[1], frequency
+
+
+def db_phase(response, mag_db, phase_rad, db_range=90.0):
+    """Write the normalized dB magnitude and the unwrapped phase of complex
+    responses along the last axis into mag_db and phase_rad."""
+    with profiler.span('response.db'), np.errstate(divide='ignore'):
+        np.abs(response, out=mag_db)
+        np.log10(mag_db, out=mag_db)
+        mag_db *= 20
+        db_max = mag_db.max(axis=-1, keepdims=True)
+        np.maximum(mag_db, db_max - db_range, out=mag_db)
+        mag_db -= db_max
+
+    with profiler.span('response.unwrap'):
+        np.arctan2(response.imag, response.real, out=phase_rad)
+        unwrap_inplace(phase_rad)
+
+
+def sos_response_points(sos, fs, n_point, db_range=90.0):
+    """Evaluate the response of second-order sections at n_point
+    frequencies in [0, fs/2).
+
+    The response of every section is the ratio of the DTFTs of its
+    numerator and denominator, and the responses of the sections are
+    multiplied, so the polynomial of the whole filter is never formed.
+
+    Parameters
+    ----------
+    sos: ndarray
+        (n_section, 6) array of [b0, b1, b2, a0, a1, a2]
+    fs: float
+        sampling frequency
+    n_point: int
+        number of frequency points
+    db_range: float
+        dB Dynamic Range (the default is 90.0)
+
+    Returns
+    -------
+    (ndarray, ndarray, ndarray)
+        mag_fre_db, phase_fre_rad, frequnecy
+    """
+    sos = np.atleast_2d(np.asarray(sos, dtype=float))
+    with profiler.span('response.fft'):
+        response = np.prod(complex_response_points(sos[:, :3], n_point) /
+                           complex_response_points(sos[:, 3:], n_point),
+                           axis=0)
+
+    mag_db = empty(n_point)
+    phase_rad = empty(n_point)
+    db_phase(response, mag_db, phase_rad, db_range)
+    frequency = arange(n_point) / n_point * fs / 2
+    return mag_db, phase_rad, frequency
+
+
+def minmax_envelope(x, y, n_bin, x_lim=None):
+    """Reduce a curve to the min/max envelope of n_bin bins.
+
+    Each bin is drawn as a vertical segment from its minimum to its maximum,
+    so narrow peaks and nulls stay visible while the number of vertices is
+    bounded by 2 * n_bin + 1.
+
+    Parameters
+    ----------
+    x: ndarray
+        ascending x values
+    y: ndarray
+    n_bin: int
+        number of bins (ex. width of the axes in pixel)
+    x_lim: (float, float), optional
+        Only the part of the curve in x_lim is reduced (the default is None,
+        None이면 전체 구간)
+
+    Returns
+    -------
+    (ndarray, ndarray)
+        x, y of the envelope
+    """
+    if x_lim is not None:
+        start = max(searchsorted(x, x_lim[0], 'left') - 1, 0)
+        stop = min(searchsorted(x, x_lim[1], 'right') + 1, len(x))
+        x = x[start:stop]
+        y = y[start:stop]
+
+    n_bin = max(int(n_bin), 1)
+    if len(x) <= 2 * n_bin + 1:
+        return x, y
+
+    edges = linspace(0, len(x), n_bin, endpoint=False).astype(int)
+
+    x_env = empty(2 * n_bin + 1, dtype=x.dtype)
+    y_env = empty(2 * n_bin + 1, dtype=y.dtype)
+    x_env[:-1:2] = x[edges]
+    x_env[1:-1:2] = x[edges]
+    y_env[:-1:2] = np.minimum.reduceat(y, edges)
+    y_env[1:-1:2] = np.maximum.reduceat(y, edges)
+    x_env[-1] = x[-1]
+    y_env[-1] = y[-1]
+
+    return x_env, y_env
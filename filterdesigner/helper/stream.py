@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Streaming FIR filtering by overlap-save FFT convolution and IIR filtering
+by second-order sections."""
+
+# Third party imports
+import numpy as np
+from numpy.fft import rfft, irfft
+
+# Largest FFT considered by optimal_fft_size, relative to the number of taps
+MAX_FFT_RATIO = 64
+# The impulse response of an IIR filter is cut where its envelope decays by
+# IMPULSE_DECAY, and at most MAX_IMPULSE_LENGTH samples
+IMPULSE_DECAY = 1e-6
+MAX_IMPULSE_LENGTH = 1 << 16
+
+
+def optimal_fft_size(n_tap):
+    """Return the FFT size with the fewest operations per output sample.
+
+    Every block of overlap-save costs about n_fft * log2(n_fft) and yields
+    n_fft - n_tap + 1 output samples.
+
+    Parameters
+    ----------
+    n_tap: int
+
+    Returns
+    -------
+    int
+        power of 2
+    """
+    n_fft = 1 << max(int(n_tap - 1).bit_length(), 1)
+    best, best_cost = n_fft, np.inf
+    while n_fft <= MAX_FFT_RATIO * max(n_tap, 2):
+        cost = n_fft * np.log2(n_fft) / (n_fft - n_tap + 1)
+        if cost < best_cost:
+            best, best_cost = n_fft, cost
+        n_fft *= 2
+    return best
+
+
+class StreamFilter(object):
+    """Stateful FIR filter of signals processed chunk by chunk.
+
+    The input is cut into blocks of `step` samples at fixed positions from
+    the start of the stream, so the output does not depend on how the
+    signal is chunked: it is bit-identical to filtering the whole signal
+    with filter(). The memory is bounded by the FFT size whatever the
+    length of the stream.
+
+    The samples lie along the last axis, and every leading axis (ex.
+    channels) is filtered independently with the same taps. Complex
+    signals are filtered as their real and imaginary parts.
+
+    Parameters
+    ----------
+    taps: ndarray
+        real taps (ex. the first item of the result of calc_filter)
+    n_fft: int, optional
+        FFT size, not less than the number of taps (the default is None,
+        None이면 optimal_fft_size)
+    fs: float, optional
+        sampling frequency, kept for the caller
+
+    Examples
+    --------
+    >>> stream_filter = StreamFilter(taps)
+    >>> for out in stream_filter.stream(read_chunks()):
+    ...     write(out)
+    """
+
+    def __init__(self, taps, n_fft=None, fs=None):
+        taps = np.asarray(taps, dtype=float)
+        if taps.ndim != 1 or len(taps) == 0:
+            raise ValueError("taps must be a non-empty 1-D array")
+        if n_fft is None:
+            n_fft = optimal_fft_size(len(taps))
+        if n_fft < len(taps):
+            raise ValueError(f"n_fft must be at least {len(taps)}")
+
+        self.taps = taps
+        self.fs = fs
+        self.n_tap = len(taps)
+        self.n_fft = int(n_fft)
+        self.step = self.n_fft - self.n_tap + 1
+        self._taps_fft = rfft(taps, self.n_fft)
+        self._window = None
+        self._n_pending = 0
+        self._complex = False
+
+    @classmethod
+    def from_design(cls, result, n_fft=None):
+        """Create StreamFilter from (taps, fs) returned by calc_filter."""
+        taps, fs = result
+        return cls(taps, n_fft, fs)
+
+    def reset(self):
+        """Clear the state as if no sample had been processed."""
+        self._window = None
+        self._n_pending = 0
+
+    def process(self, chunk):
+        """Filter the next chunk of the stream.
+
+        Only complete blocks are filtered, so the output lags the input by
+        less than `step` samples; the rest is returned by flush().
+
+        Parameters
+        ----------
+        chunk: ndarray
+            real or complex samples along the last axis
+
+        Returns
+        -------
+        ndarray
+            the next output samples
+        """
+        chunk = np.asarray(chunk)
+        is_complex = np.iscomplexobj(chunk)
+        if is_complex:
+            chunk = np.stack([chunk.real, chunk.imag])
+        if self._window is None:
+            self._complex = is_complex
+            self._window = np.zeros(chunk.shape[:-1] + (self.n_fft,))
+        elif (is_complex != self._complex or
+              chunk.shape[:-1] != self._window.shape[:-1]):
+            raise ValueError("chunk must have the leading shape and the "
+                             "kind (real or complex) of the first chunk")
+        return self._join(self._process(chunk))
+
+    def _join(self, out):
+        """Combine the real and the imaginary parts of a complex signal."""
+        if self._complex:
+            return out[0] + 1j * out[1]
+        return out
+
+    def _process(self, chunk):
+        """Filter real chunk with the leading shape of the window."""
+        outputs = []
+        offset = self.n_tap - 1
+        pos = 0
+        n_sample = chunk.shape[-1]
+        while pos < n_sample:
+            n_take = min(self.step - self._n_pending, n_sample - pos)
+            start = offset + self._n_pending
+            self._window[..., start:start + n_take] = \
+                chunk[..., pos:pos + n_take]
+            self._n_pending += n_take
+            pos += n_take
+            if self._n_pending == self.step:
+                outputs.append(self._filter_block())
+
+        if not outputs:
+            return np.empty(chunk.shape[:-1] + (0,))
+        return np.concatenate(outputs, axis=-1)
+
+    def _filter_block(self):
+        """Filter the full window and keep its last n_tap - 1 samples."""
+        out = irfft(rfft(self._window) * self._taps_fft, self.n_fft)
+        self._window[..., :self.n_tap - 1] = self._window[..., self.step:]
+        self._n_pending = 0
+        return out[..., self.n_tap - 1:]
+
+    def flush(self, full=False):
+        """Return the output of the pending samples and reset the state.
+
+        Parameters
+        ----------
+        full: bool
+            If True, the n_tap - 1 samples of the decay after the end of the
+            input are returned too, as in np.convolve(x, taps).
+
+        Returns
+        -------
+        ndarray
+        """
+        if self._window is None:
+            return np.empty(0)
+
+        n_out = self._n_pending + (self.n_tap - 1 if full else 0)
+        outputs = [np.empty(self._window.shape[:-1] + (0,))]
+        n_done = 0
+        while n_done < n_out:
+            zeros = np.zeros(self._window.shape[:-1] +
+                             (self.step - self._n_pending,))
+            outputs.append(self._process(zeros))
+            n_done += outputs[-1].shape[-1]
+
+        out = self._join(np.concatenate(outputs, axis=-1)[..., :n_out])
+        self.reset()
+        return out
+
+    def filter(self, data, full=False):
+        """Filter a whole signal from the current state and reset the state.
+
+        The output has the length of data, like lfilter(taps, 1, data), or
+        n_tap - 1 more samples if full is True.
+        """
+        return np.concatenate([self.process(data), self.flush(full)],
+                              axis=-1)
+
+    def stream(self, chunks, full=False):
+        """Yield the output of every chunk of an iterable, then the rest.
+
+        Chunks which do not complete a block yield nothing.
+        """
+        for chunk in chunks:
+            out = self.process(chunk)
+            if out.shape[-1]:
+                yield out
+        out = self.flush(full)
+        if out.shape[-1]:
+            yield out
+
+
+def impulse_length(sos, decay=IMPULSE_DECAY):
+    """Return the number of samples after which the impulse response of
+    second-order sections has decayed by decay.
+
+    It is estimated from the pole of the largest radius, and limited to
+    MAX_IMPULSE_LENGTH for the poles on the unit circle.
+    """
+    sos = np.atleast_2d(np.asarray(sos, dtype=float))
+    radius = max((np.abs(np.roots(section[3:])).max(initial=0)
+                  for section in sos), default=0)
+    n_sample = 2 * len(sos) + 1
+    if radius >= 1:
+        return MAX_IMPULSE_LENGTH
+    if radius > 0:
+        n_sample += int(np.ceil(np.log(decay) / np.log(radius)))
+    return min(n_sample, MAX_IMPULSE_LENGTH)
+
+
+def sos_impulse_response(sos, n_sample=None):
+    """Return the impulse response of second-order sections.
+
+    Parameters
+    ----------
+    sos: ndarray
+        (n_section, 6) array of [b0, b1, b2, a0, a1, a2]
+    n_sample: int, optional
+        (the default is None, None이면 impulse_length)
+
+    Returns
+    -------
+    ndarray
+    """
+    if n_sample is None:
+        n_sample = impulse_length(sos)
+    impulse = np.zeros(n_sample)
+    impulse[0] = 1
+    return SOSStreamFilter(sos).filter(impulse)
+
+
+class SOSStreamFilter(object):
+    """Stateful IIR filter of second-order sections processed chunk by chunk.
+
+    The sections are applied in cascade by scipy.signal.sosfilt, which keeps
+    the rounding of a high order filter as small as that of its sections.
+    The state of every section is carried between the chunks, so the output
+    does not depend on the chunking. The samples lie along the last axis
+    and the leading axes (ex. channels) are filtered independently.
+
+    Parameters
+    ----------
+    sos: ndarray
+        (n_section, 6) array of [b0, b1, b2, a0, a1, a2] (ex. the first
+        item of the result of calc_filter of an IIR method)
+    fs: float, optional
+        sampling frequency, kept for the caller
+    """
+
+    def __init__(self, sos, fs=None):
+        sos = np.atleast_2d(np.asarray(sos, dtype=float))
+        if sos.ndim != 2 or sos.shape[1] != 6 or len(sos) == 0:
+            raise ValueError("sos must be a (n_section, 6) array")
+        self.sos = sos
+        self.fs = fs
+        self.n_section = len(sos)
+        self._zi = None
+
+    @classmethod
+    def from_design(cls, result):
+        """Create SOSStreamFilter from (sos, fs) returned by calc_filter."""
+        sos, fs = result
+        return cls(sos, fs)
+
+    def reset(self):
+        """Clear the state as if no sample had been processed."""
+        self._zi = None
+
+    def process(self, chunk):
+        """Filter the next chunk of the stream.
+
+        Parameters
+        ----------
+        chunk: ndarray
+            real or complex samples along the last axis
+
+        Returns
+        -------
+        ndarray
+            one output per input sample
+        """
+        from scipy.signal import sosfilt  # scipy.signal is slow to import
+
+        chunk = np.asarray(chunk)
+        dtype = np.result_type(chunk.dtype, np.float64)
+        shape = (self.n_section,) + chunk.shape[:-1] + (2,)
+        if self._zi is None:
+            self._zi = np.zeros(shape, dtype=dtype)
+        elif self._zi.shape != shape or self._zi.dtype != dtype:
+            raise ValueError("chunk must have the leading shape and the "
+                             "kind (real or complex) of the first chunk")
+        if chunk.shape[-1] == 0:
+            return np.empty(chunk.shape, dtype=dtype)
+
+        out, self._zi = sosfilt(self.sos, chunk, axis=-1, zi=self._zi)
+        return out
+
+    def flush(self, full=False):
+        """Return the decay after the end of the input and reset the state.
+
+        Parameters
+        ----------
+        full: bool
+            If True, the impulse_length samples of the decay after the end
+            of the input are returned.
+
+        Returns
+        -------
+        ndarray
+        """
+        if self._zi is None:
+            return np.empty(0)
+        n_zero = impulse_length(self.sos) if full else 0
+        out = self.process(np.zeros(self._zi.shape[1:-1] + (n_zero,),
+                                    dtype=self._zi.dtype))
+        self.reset()
+        return out
+
+    def filter(self, data, full=False):
+        """Filter a whole signal from the current state and reset the state.
+
+        The output has the length of data, like sosfilt(sos, data), or
+        impulse_length more samples if full is True.
+        """
+        return np.concatenate([self.process(data), self.flush(full)],
+                              axis=-1)
+
+    def stream(self, chunks, full=False):
+        """Yield the output of every chunk of an iterable, then the decay."""
+        for chunk in chunks:
+            out = self.process(chunk)
+            if out.shape[-1]:
+                yield out
+        out = self.flush(full)
+        if out.shape[-1]:
+            yield out
@@ -5,14 +5,14 @@
 import sys
 
 # Third party imports
-from jupyterthemes import jtplot
-
-from qdarkstyle import load_stylesheet_from_environment
-from qtpy.QtWidgets import (QMainWindow, QApplication, QStackedWidget)
+from qtpy.QtWidgets import (QMainWindow, QApplication, QStackedWidget,
+                            QPushButton)
 
 # Local import
 from filterdesigner.config import UserConfig as CONF
+from filterdesigner.filterdesign.designcache import design_cache
 from filterdesigner.filterdesign.filterwidget import FilterDesignWidget
+from filterdesigner.filterdesign.profilewidget import ProfileDialog
 
 
 class QDesignerMainWindow(QMainWindow):
@@ -20,6 +20,7 @@ class QDesignerMainWindow(QMainWindow):
     def __init__(self, parent=None):
         super(QDesignerMainWindow, self).__init__(parent)
 
+        from jupyterthemes import jtplot  # imports matplotlib
         if CONF.dark_theme:
             jtplot.style('onedork', fscale=0.8)
         else:
@@ -27,17 +28,44 @@ class QDesignerMainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget(self)
 
         # Widget Add
-        self.stacked_widget.addWidget(FilterDesignWidget(self))
+        filter_widget = FilterDesignWidget(self)
+        self.stacked_widget.addWidget(filter_widget)
 
         self.setCentralWidget(self.stacked_widget)
 
+        # Status bar shows the spans of the last design if profiling
+        self.profile_dialog = None
+        push_diagnostics = QPushButton("Diagnostics", self)
+        push_diagnostics.setFlat(True)
+        push_diagnostics.clicked.connect(self.show_diagnostics)
+        self.statusBar().addPermanentWidget(push_diagnostics)
+        filter_widget.sig_profile.connect(self.statusBar().showMessage)
+
+    def closeEvent(self, event):
+        """Stop the design processes before the window is closed."""
+        for idx in range(self.stacked_widget.count()):
+            self.stacked_widget.widget(idx).shutdown()
+        super(QDesignerMainWindow, self).closeEvent(event)
+
+    def show_diagnostics(self):
+        """Open the diagnostics panel of the profiler."""
+        if self.profile_dialog is None:
+            self.profile_dialog = ProfileDialog(self)
+        self.profile_dialog.show()
+        self.profile_dialog.raise_()
+
 
 if __name__ == '__main__':
+    # The designs are kept on disk only by the application
+    design_cache.cache_dir = CONF.design_cache_dir
+    design_cache.max_disk_bytes = CONF.design_cache_disk_bytes
+
     app = QApplication(sys.argv)
     window = QDesignerMainWindow()
 
     # setup stylesheet
     if CONF.dark_theme:
+        from qdarkstyle import load_stylesheet_from_environment
         app.setStyleSheet(load_stylesheet_from_environment())
 
     # run
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Standard library imports
+import json
+
+# Third Party Libraries Imports
+import numpy as np
+import pytest
+
+# Local imports
+from filterdesigner.batch import main, read_specs
+
+
+def test_batch(tmpdir):
+    specs = [{'name': 'lpf', 'filter_type': 'lowpass',
+              'method': 'Equiripple', 'n_tap': 65, 'fs': 1000,
+              'freqs': [100, 150], 'weights': [1, 10]},
+             {'name': 'bsf', 'filter_type': 'bandstop',
+              'method': 'Least-squares', 'n_tap': 65, 'fs': 1000,
+              'freqs': [100, 150, 300, 350], 'weights': [1, 10, 1]}]
+    path = tmpdir.join('specs.jsonl')
+    path.write('\n'.join(json.dumps(spec) for spec in specs))
+    out = tmpdir.join('out')
+
+    assert main([str(path), '--jobs', '2', '--out', str(out)]) == 0
+
+    summary = json.loads(out.join('summary.json').read())
+    assert [record['name'] for record in summary] == ['lpf', 'bsf']
+    assert summary[0]['stopband_atten_db'] > 40
+    assert summary[0]['cost']['mults_per_sample'] == 33
+    assert summary[0]['cost']['group_delay'] == 32
+    assert len(np.load(str(out.join('bsf.npy')))) == 65
+
+
+def test_batch_bits(tmpdir):
+    spec = {'name': 'lpf', 'filter_type': 'lowpass',
+            'method': 'Equiripple', 'n_tap': 65, 'fs': 1000,
+            'freqs': [100, 150], 'weights': [1, 10]}
+    path = tmpdir.join('specs.jsonl')
+    path.write(json.dumps(spec))
+    out = tmpdir.join('out')
+
+    assert main([str(path), '--out', str(out), '--bits', '12',
+                 '--explore-bits', '10:16']) == 0
+
+    record = json.loads(out.join('summary.json').read())[0]
+    codes = np.load(str(out.join('lpf_q12.npy')))
+    assert codes.dtype == np.int64 and np.abs(codes).max() < 2 ** 11
+    assert [point['n_bit'] for point in record['word_lengths']] == \
+        list(range(10, 17))
+
+
+def test_read_specs_names(tmpdir):
+    spec = {'filter_type': 'lowpass', 'method': 'Equiripple', 'n_tap': 33,
+            'fs': 1000, 'freqs': [100, 150], 'weights': [1, 10]}
+    lines = [dict(spec, name='lpf'), dict(spec, name='LPF'),
+             dict(spec, name='../evil/lpf'), {'name': 'broken'}, 'not json',
+             dict(spec)]
+    path = tmpdir.join('specs.jsonl')
+    path.write('\n'.join(line if isinstance(line, str) else json.dumps(line)
+                         for line in lines))
+
+    errors = []
+    names = [name for name, _ in read_specs(str(path), errors)]
+    assert names == ['lpf', 'LPF_2', '_evil_lpf', 'spec0006']
+    assert [error.split(':')[0] for error in errors] == ['line 4', 'line 5']
+
+    with pytest.raises(ValueError, match='line 4'):
+        read_specs(str(path))
+
+    out = tmpdir.join('out')
+    assert main([str(path), '--jobs', '1', '--out', str(out)]) == 1
+    assert sorted(p.basename for p in out.listdir('*.npy')) == \
+        ['LPF_2.npy', '_evil_lpf.npy', 'lpf.npy', 'spec0006.npy']
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Tests of the benchmark suite."""
+
+# Local imports
+from filterdesigner.benchmarks.suite import compare, measure, run
+
+
+def test_measure():
+    result = measure(lambda: bytearray(10 ** 6))
+    assert result['error'] is None
+    assert result['peak_bytes'] >= 10 ** 6
+    assert result['time'] > 0
+
+    assert measure(lambda: 1 / 0)['error'] == 'division by zero'
+
+
+def test_compare_baseline():
+    base = {'time': 0.1, 'peak_bytes': 1000, 'error': None}
+    baseline = {'case': base}
+    assert compare({'case': base, 'new': base}, baseline, 0.5, 0.1) == []
+
+    slow = dict(base, time=0.2)
+    assert len(compare({'case': slow}, baseline, 0.5, 0.1)) == 1
+    large = dict(base, peak_bytes=2000)
+    assert len(compare({'case': large}, baseline, 0.5, 0.1)) == 1
+    failed = dict(base, error='error')
+    assert len(compare({'case': failed}, baseline, 0.5, 0.1)) == 1
+    assert len(compare({'case': base}, {'case': failed}, 0.5, 0.1)) == 1
+
+
+def test_run_response_cases():
+    results = run(select='db2/129', gui=False, log=lambda line: None)
+    assert list(results) == ['db2/129']
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import numpy as np
+
+# Local imports
+from filterdesigner.helper.cache import LRUCache, array_hash
+
+
+def test_array_hash():
+    data = np.arange(10.0)
+
+    assert array_hash(data) == array_hash(data.copy())
+    assert array_hash(data) != array_hash(data.astype(np.float32))
+
+
+def test_lru_cache_evicts_by_memory():
+    cache = LRUCache(max_bytes=3 * 80)
+    for idx in range(3):
+        cache.put(idx, np.zeros(10))
+    cache.get(0)
+    cache.put(3, np.zeros(10))
+
+    assert 0 in cache
+    assert 1 not in cache
+    assert len(cache) == 3
+    assert cache.n_bytes == 3 * 80
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import numpy as np
+import pytest
+from scipy.signal import butter, group_delay, sos2tf
+
+# Local imports
+from filterdesigner.filterbase import TYPE_LPF
+from filterdesigner.filterdesign.cost import (DesignResult, design_cost,
+                                              fir_cost, sos_cost)
+from filterdesigner.filterdesign.design import (FilterSpec, METHOD_EQUIRIPPLE,
+                                                design_filter)
+from filterdesigner.filterdesign.multistage import design_chain
+
+
+@pytest.mark.parametrize('n_tap', [64, 65])
+def test_fir_cost(n_tap):
+    spec = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, n_tap, 1000,
+                             [100, 150], [1, 10])
+    cost = fir_cost(design_filter(spec), 1000)
+
+    assert cost.mults_per_sample == (n_tap + 1) // 2
+    assert cost.adds_per_sample == n_tap - 1
+    assert cost.n_coef == (n_tap + 1) // 2
+    assert cost.n_state == n_tap - 1
+    assert cost.group_delay == (n_tap - 1) / 2
+    assert cost.group_delay_s == pytest.approx((n_tap - 1) / 2 / 1000)
+
+
+def test_fir_cost_nonlinear_phase():
+    cost = fir_cost([0.0, 0.0, 1.0, 0.5], 100)
+    assert cost.mults_per_sample == 4
+    assert cost.n_coef == 4
+    assert cost.group_delay == pytest.approx(7 / 3)
+
+
+def test_sos_cost():
+    sos = butter(6, 0.2, output='sos')
+    cost = sos_cost(sos, 1000)
+
+    assert cost.mults_per_sample == np.count_nonzero(sos[:, [0, 1, 2, 4, 5]])
+    assert cost.n_state == 6
+    # Butterworth has the highest gain at DC
+    _, delay = group_delay(sos2tf(sos), w=[0])
+    assert cost.group_delay == pytest.approx(delay[0], rel=1e-2)
+    assert design_cost(sos, 1000) == cost
+
+
+def test_design_result():
+    taps = np.ones(5) / 5
+    result = DesignResult(taps, 1000.0)
+    coefs, fs = result
+    assert coefs is taps and fs == 1000
+    assert result.cost == fir_cost(taps, 1000)
+
+
+def test_chain_cost():
+    chain = design_chain(96000, (4, 2), 4000, 5500, 0.1, 60)
+    first, second = chain.n_taps
+    cost = chain.cost
+
+    assert cost.fs == 12000
+    assert cost.mults_per_sample == 2 * first + second
+    assert cost.n_coef == first + second
+    assert cost.group_delay_s == pytest.approx(
+        (first - 1) / 2 / 96000 + (second - 1) / 2 / 24000)
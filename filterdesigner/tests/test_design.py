@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import pytest
+from numpy import allclose
+
+# Local imports
+from filterdesigner.filterbase import TYPE_LPF, TYPE_BPF, TYPE_BSF
+from filterdesigner.filterdesign.design import (
+    FilterSpec, IIRSpec, METHOD_EQUIRIPPLE, METHOD_LEASTSQUARE, IIR_METHODS,
+    design_filter, design_iir, iir_order)
+from filterdesigner.helper.signal import sos_response_points
+
+
+def test_spec_is_hashable():
+    spec1 = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 129, 1000,
+                              [100, 200, 300, 400], [1, 80, 80])
+    spec2 = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 129.0, 1000,
+                              [100, 200], [1, 80])
+
+    assert spec1 == spec2
+    assert hash(spec1) == hash(spec2)
+    assert spec1.freqs == (100.0, 200.0)
+
+
+@pytest.mark.parametrize('method', [METHOD_EQUIRIPPLE, METHOD_LEASTSQUARE])
+def test_design_filter(method):
+    spec = FilterSpec.create(TYPE_BPF, method, 65, 1000,
+                             [100, 150, 250, 300], [80, 1, 80])
+    taps = design_filter(spec)
+
+    assert len(taps) == 65
+    assert allclose(taps, taps[::-1])
+
+
+def test_design_filter_invalid():
+    spec = FilterSpec(TYPE_LPF, 'Unknown', 129, 1000, (100, 200), (1, 80))
+    with pytest.raises(ValueError):
+        design_filter(spec)
+    for freqs in [(200, 100), (0, 100), (100, 500)]:
+        spec = FilterSpec(TYPE_LPF, METHOD_EQUIRIPPLE, 129, 1000, freqs,
+                          (1, 80))
+        with pytest.raises(ValueError, match="ascending"):
+            design_filter(spec)
+
+
+@pytest.mark.parametrize('method', IIR_METHODS)
+@pytest.mark.parametrize('filter_type', [TYPE_BPF, TYPE_BSF])
+def test_design_iir(method, filter_type):
+    freqs = [100, 150, 250, 300]
+    spec = IIRSpec.create(filter_type, method, 0, 1000, freqs, 1, 60)
+    sos = design_filter(spec)
+    order, _ = iir_order(spec)
+
+    assert sos.shape == (order, 6)  # a band filter doubles the order
+    mag_db, _, fre = sos_response_points(sos, 1000, 4096)
+    stopbands = ((fre > 300) | (fre < 100) if filter_type == TYPE_BPF
+                 else (fre > 150) & (fre < 250))
+    assert mag_db[stopbands].max() < -60 + 0.1
+
+    spec = spec._replace(order=4)
+    assert design_filter(spec).shape == (4, 6)
+
+
+def test_design_iir_order():
+    spec = IIRSpec.create(TYPE_LPF, IIR_METHODS[-1], 0, 1000, [100, 150])
+    design = design_iir(spec)
+
+    assert design.spec == spec._replace(order=iir_order(spec)[0])
+    assert allclose(design.sos, design_filter(spec))
+
+
+def test_design_iir_invalid():
+    spec = IIRSpec.create(TYPE_LPF, IIR_METHODS[0], 4, 1000, [200, 100])
+    with pytest.raises(ValueError):
+        design_filter(spec)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Standard library imports
+import os
+import time
+
+# Third Party Libraries Imports
+import numpy as np
+
+# Local imports
+from filterdesigner.filterbase import TYPE_LPF
+from filterdesigner.filterdesign.design import FilterSpec, METHOD_EQUIRIPPLE
+from filterdesigner.filterdesign.designcache import (DesignCache,
+                                                     cached_design_filter,
+                                                     spec_key)
+
+
+def get_spec(n_tap):
+    return FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, n_tap, 1000,
+                             [100, 200], [1, 80])
+
+
+def test_design_cache_on_disk(tmpdir):
+    cache = DesignCache(cache_dir=str(tmpdir))
+    taps = cached_design_filter(get_spec(33), cache)
+
+    cache_new = DesignCache(cache_dir=str(tmpdir))
+    assert np.array_equal(cache_new.get(get_spec(33)), taps)
+    assert cache_new.get(get_spec(35)) is None
+
+
+def test_design_cache_disk_limit(tmpdir):
+    cache = DesignCache(cache_dir=str(tmpdir), max_disk_bytes=0)
+    cache.put(get_spec(33), np.ones(33))
+
+    assert not tmpdir.listdir()[0].listdir()
+    assert cache.get(get_spec(33)) is not None  # still in memory
+
+
+def test_design_cache_disk_index(tmpdir):
+    cache = DesignCache(cache_dir=str(tmpdir), max_disk_bytes=1 << 20)
+    for n_tap in (33, 35, 37):
+        cache.put(get_spec(n_tap), np.ones(n_tap))
+    sizes = [path.size() for path in tmpdir.visit('*.npz')]
+    assert cache._disk_bytes == sum(sizes)
+    # Distinct times of use, since the file system may round them
+    for n_tap in (33, 35, 37):
+        path = cache._path(spec_key(get_spec(n_tap)))
+        os.utime(path, (time.time() - 100 + n_tap, ) * 2)
+
+    # The scan of an existing directory is done once and the least recently
+    # used file is removed first
+    cache_new = DesignCache(cache_dir=str(tmpdir))
+    assert cache_new.get(get_spec(33)) is not None
+    cache_new.max_disk_bytes = sum(sizes) - 1
+    cache_new.put(get_spec(35), np.ones(35))
+    assert cache_new.get(get_spec(33)) is not None
+    assert DesignCache(cache_dir=str(tmpdir)).get(get_spec(37)) is None
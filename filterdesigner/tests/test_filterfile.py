@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import numpy as np
+
+# Local imports
+from filterdesigner.filterfile import filter_file, main
+
+
+def test_filter_file_raw(tmpdir):
+    rng = np.random.RandomState(0)
+    taps = rng.standard_normal(33)
+    data = (rng.standard_normal((5000, 3)) * 1000).astype(np.int16)
+    in_path = str(tmpdir.join('in.bin'))
+    data.tofile(in_path)
+    taps_path = str(tmpdir.join('taps.npy'))
+    np.save(taps_path, taps)
+    out_path = str(tmpdir.join('out.bin'))
+
+    assert main([in_path, out_path, '--taps', taps_path, '--dtype', 'int16',
+                 '--channels', '3', '--chunk', '777']) == 0
+
+    out = np.fromfile(out_path, np.float32).reshape(-1, 3)
+    expected = np.convolve(data[:, 1].astype(float), taps)[:len(data)]
+    assert np.allclose(out[:, 1], expected, rtol=1e-5, atol=1e-2)
+
+
+def test_filter_file_npy_complex(tmpdir):
+    rng = np.random.RandomState(1)
+    taps = rng.standard_normal(65)
+    data = (rng.standard_normal((2, 3000)) +
+            1j * rng.standard_normal((2, 3000))).astype(np.complex64)
+    in_path = str(tmpdir.join('in.npy'))
+    np.save(in_path, data)
+    out_path = str(tmpdir.join('out.npy'))
+
+    result = filter_file(taps, in_path, out_path, chunk_size=500)
+
+    out = np.load(out_path)
+    assert out.dtype == np.complex64 and out.shape == data.shape
+    assert np.allclose(out[0], np.convolve(data[0], taps)[:3000], atol=1e-4)
+    assert result.n_sample == 3000 and result.samples_per_second > 0
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import numpy as np
+import pytest
+
+# Local imports
+from filterdesigner.helper.linearphase import (LinearPhaseTaps, FoldedFilter,
+                                               SYMMETRIC, ANTISYMMETRIC,
+                                               symmetry_of)
+
+
+@pytest.mark.parametrize('n_tap', [1, 2, 7, 8, 65])
+@pytest.mark.parametrize('symmetry', [SYMMETRIC, ANTISYMMETRIC])
+def test_folded_filter(n_tap, symmetry):
+    rng = np.random.RandomState(n_tap)
+    taps = rng.standard_normal(n_tap)
+    taps = taps + symmetry * taps[::-1]
+    if not taps.any():
+        return  # a single antisymmetric tap is 0
+    linear_phase = LinearPhaseTaps.from_taps(taps)
+    assert linear_phase.symmetry == symmetry
+    assert len(linear_phase.half) == (n_tap + 1) // 2
+    assert np.array_equal(linear_phase.taps, taps)
+
+    data = rng.standard_normal((2, 1000))
+    folded_filter = FoldedFilter(linear_phase)
+    out = np.concatenate(list(folded_filter.stream(
+        np.array_split(data, 7, axis=-1), full=True)), axis=-1)
+    expected = np.array([np.convolve(row, taps) for row in data])
+    assert np.allclose(out, expected)
+
+    complex_data = data[0] + 1j * data[1]
+    assert np.allclose(folded_filter.filter(complex_data),
+                       np.convolve(complex_data, taps)[:1000])
+
+
+def test_linear_phase_taps():
+    assert LinearPhaseTaps.from_taps([1, 2, 3, 2, 1]).fir_type == 1
+    assert LinearPhaseTaps.from_taps([1, 2, 2, 1]).fir_type == 2
+    assert LinearPhaseTaps.from_taps([1, 2, 0, -2, -1]).fir_type == 3
+    assert LinearPhaseTaps.from_taps([1, 2, -2, -1]).fir_type == 4
+    assert symmetry_of([1, 2, 3]) is None
+    with pytest.raises(ValueError):
+        LinearPhaseTaps.from_taps([1, 2, 3])
@@ -6,8 +6,13 @@
 
 # Third Party Libraries Imports
 import pytest
+from qtpy.QtTest import QTest
 
 # Local imports
+from filterdesigner.config import UserConfig as CONF
+from filterdesigner.filterdesign.design import METHOD_ELLIPTIC
+from filterdesigner.filterdesign.designcache import design_cache
+from filterdesigner.filterdesign.filterwidget import PREVIEW_DENSITY
 from filterdesigner.main import QDesignerMainWindow
 
 # @pytest.fixture
@@ -17,6 +22,68 @@ def test_mainwindow_init(qtbot):
 
     assert mainwindow
 
+    worker = mainwindow.stacked_widget.widget(0).design_worker
+    standby, _ = worker._standby
+    mainwindow.close()
+    assert worker._standby is None
+    assert not standby.is_alive()
+
+
+def test_mainwindow_keeps_design_cache(qtbot):
+    cache_dir = design_cache.cache_dir
+    mainwindow = QDesignerMainWindow()
+    qtbot.addWidget(mainwindow)
+    assert design_cache.cache_dir == cache_dir
+    mainwindow.close()
+
+
+def test_live_preview(qtbot, monkeypatch, tmpdir):
+    monkeypatch.setattr(CONF, 'design_cache_dir', str(tmpdir))
+    mainwindow = QDesignerMainWindow()
+    qtbot.addWidget(mainwindow)
+    widget = mainwindow.stacked_widget.widget(0)
+    widget.check_preview.setChecked(True)
+    densities = []
+    widget.design_worker.sig_finished.connect(
+        lambda job_id, spec, taps: densities.append(spec.density))
+
+    order_line = widget.get_filter().order_line
+    order_line.selectAll()
+    QTest.keyClicks(order_line, '65')
+
+    qtbot.waitUntil(lambda: len(densities) == 2, timeout=30000)
+    assert densities == [PREVIEW_DENSITY, 16]
+    assert len(widget.taps) == 65
+
+
+def test_iir_design(qtbot, monkeypatch, tmpdir):
+    monkeypatch.setattr(CONF, 'design_cache_dir', str(tmpdir))
+    mainwindow = QDesignerMainWindow()
+    qtbot.addWidget(mainwindow)
+    widget = mainwindow.stacked_widget.widget(0)
+
+    widget.radio_iir.click()
+    widget.combo_iir.setCurrentIndex(widget.combo_iir.findText(
+        METHOD_ELLIPTIC))
+    filter_instance = widget.get_filter()
+    assert filter_instance.name == METHOD_ELLIPTIC
+    assert not widget.push_sweep.isEnabled()
+
+    filter_instance.auto_order_check.setChecked(True)
+    filter_instance.order_line.setText('1')
+    assert filter_instance.get_spec(widget.type_radio_group.checkedId()) \
+        .order == 0
+    assert filter_instance.order_line.text() == '1'
+    with qtbot.waitSignal(widget.design_worker.sig_finished,
+                          timeout=30000):
+        widget.push_design.click()
+
+    order = int(filter_instance.order_line.text())
+    assert order > 1
+    assert widget.sos.shape == ((order + 1) // 2, 6)
+    assert widget.line_mag.get_visible()
+    assert widget.cost_label.text().startswith("Cost:")
+
 
 # def test_name():
 #     l = LeastSquareLPF()
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import pytest
+
+# Local imports
+from filterdesigner.filterbase import TYPE_LPF, TYPE_HPF
+from filterdesigner.filterdesign.design import (
+    FilterSpec, METHOD_EQUIRIPPLE, METHOD_LEASTSQUARE, design_filter)
+from filterdesigner.filterdesign.metrics import filter_metrics
+from filterdesigner.filterdesign.minorder import minimum_order
+
+
+@pytest.mark.parametrize('filter_type, method, jobs, step',
+                         [(TYPE_LPF, METHOD_EQUIRIPPLE, 1, 1),
+                          (TYPE_HPF, METHOD_LEASTSQUARE, 1, 2),
+                          (TYPE_LPF, METHOD_LEASTSQUARE, 3, 2)])
+def test_minimum_order(filter_type, method, jobs, step):
+    spec = FilterSpec.create(filter_type, method, 1, 1000, [100, 150],
+                             [1, 10])
+    result = minimum_order(spec, 0.1, 60, jobs=jobs)
+
+    assert result.metrics.passband_ripple_db <= 0.1
+    assert result.metrics.stopband_atten_db >= 60
+    assert len(result.taps) == result.spec.n_tap
+    assert result.n_design >= 2
+
+    smaller = spec._replace(n_tap=result.spec.n_tap - step)
+    metrics = filter_metrics(smaller, design_filter(smaller))
+    assert metrics.passband_ripple_db > 0.1 or \
+        metrics.stopband_atten_db < 60
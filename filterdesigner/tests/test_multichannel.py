@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import numpy as np
+import pytest
+
+# Local imports
+from filterdesigner.helper import multichannel
+from filterdesigner.helper.multichannel import channel_groups, filter_channels
+from filterdesigner.helper.stream import StreamFilter
+
+
+def test_channel_groups():
+    sizes = [len(range(10)[rows]) for rows in channel_groups(10, 4)]
+    assert sum(sizes) == 10 and max(sizes) - min(sizes) <= 1
+    assert len(channel_groups(3, 8)) == 3
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_filter_channels(backend):
+    rng = np.random.RandomState(0)
+    taps = rng.standard_normal(65)
+    data = rng.standard_normal((7, 5000))
+
+    out = filter_channels(taps, data, workers=3, backend=backend)
+    assert np.array_equal(out, StreamFilter(taps).filter(data))
+
+    complex_data = data[:3] + 1j * data[3:6]
+    out = filter_channels(taps, complex_data, workers=2, backend=backend,
+                          full=True)
+    assert np.allclose(out[1], np.convolve(complex_data[1], taps))
+
+
+def test_filter_channels_file_fallback(monkeypatch):
+    # Python < 3.8 has no multiprocessing.shared_memory
+    monkeypatch.setattr(multichannel, 'shared_memory', None)
+    rng = np.random.RandomState(1)
+    taps = rng.standard_normal(33)
+    data = rng.standard_normal((4, 3000))
+
+    out = filter_channels(taps, data, workers=2, backend='process')
+    assert np.array_equal(out, StreamFilter(taps).filter(data))
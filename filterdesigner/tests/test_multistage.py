@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import numpy as np
+import pytest
+
+# Local imports
+from filterdesigner.filterdesign import multistage
+from filterdesigner.filterdesign.multistage import (
+    design_multistage, ordered_factorizations, stage_specs)
+
+
+def test_ordered_factorizations():
+    assert ordered_factorizations(12, 1) == [(12,)]
+    assert ordered_factorizations(12, 2) == [(2, 6), (3, 4), (4, 3), (6, 2)]
+    assert sorted(ordered_factorizations(12, 3)) == [(2, 2, 3), (2, 3, 2),
+                                                     (3, 2, 2)]
+    assert ordered_factorizations(7, 2) == []
+
+
+def test_stage_specs():
+    specs = stage_specs(96000, (4, 2), 4000, 5500, 0.1, 60)
+    assert [spec.fs for spec in specs] == [96000, 24000]
+    assert [spec.freqs for spec in specs] == [(4000, 18500), (4000, 5500)]
+
+
+def test_design_multistage():
+    result = design_multistage(96000, 8, 4000, 5500, 0.1, 60)
+    best = result.best
+
+    assert np.prod(best.factors) == 8
+    assert len(best.factors) >= 2
+    assert best.passband_ripple_db <= 0.1
+    assert best.stopband_atten_db >= 60
+    assert best.mults_per_input < result.single.mults_per_input
+    assert result.saving > 1
+    assert result.single.factors == (8,)
+    assert 'single stage' in result.report()
+
+    # A tone in the stopband is removed and a tone in the passband is kept
+    time = np.arange(96000) / 96000
+    for freq, gain in ((1000, 1), (30000, 0)):
+        data = np.cos(2 * np.pi * freq * time)
+        for decimator in best.decimators():
+            data = decimator.resample(data)
+        assert len(data) == 12000
+        rms = np.sqrt(np.mean(data[2000:] ** 2))
+        np.testing.assert_allclose(rms * np.sqrt(2), gain, atol=1e-2)
+
+
+def test_design_multistage_invalid():
+    with pytest.raises(ValueError):
+        design_multistage(96000, 8, 4000, 9000, 0.1, 60)
+    with pytest.raises(ValueError):
+        design_multistage(96000, 1, 4000, 5500, 0.1, 60)
+
+
+def test_design_multistage_skips_candidate(monkeypatch):
+    design_chain = multistage.design_chain
+
+    def design_two_stages(fs, factors, *args):
+        if len(factors) > 2:
+            raise ValueError("too many taps")
+        return design_chain(fs, factors, *args)
+
+    def design_none(*args):
+        raise ValueError("too many taps")
+
+    monkeypatch.setattr(multistage, 'design_chain', design_two_stages)
+    result = design_multistage(96000, 8, 4000, 5500, 0.1, 60)
+    assert len(result.best.factors) == 2
+    assert (2, 2, 2) in [chain.factors for chain in result.candidates]
+
+    monkeypatch.setattr(multistage, 'design_chain', design_none)
+    with pytest.raises(ValueError, match="No candidate"):
+        design_multistage(96000, 8, 4000, 5500, 0.1, 60)
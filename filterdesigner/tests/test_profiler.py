@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Tests of the timing spans."""
+
+# Standard library imports
+import json
+import sys
+
+# Third Party Libraries Imports
+import pytest
+
+# Local imports
+from filterdesigner.config import UserConfig as CONF
+from filterdesigner.helper.profiler import Profiler, profiler
+from filterdesigner.main import QDesignerMainWindow
+
+
+def test_disabled_profiler_records_nothing():
+    prof = Profiler()
+    with prof.span('a'):
+        pass
+    prof.add_span('b', 0, 1)
+    assert len(prof.spans) == 0
+
+
+def test_nested_spans():
+    prof = Profiler(enabled=True)
+    with prof.span('outer'):
+        with prof.span('inner'):
+            pass
+    inner, outer = prof.spans
+    assert (inner.name, inner.depth) == ('inner', 1)
+    assert (outer.name, outer.depth) == ('outer', 0)
+    assert outer.start <= inner.start
+    assert outer.duration >= inner.duration
+    assert inner.peak_bytes is None
+    assert set(prof.summary()) == {'inner', 'outer'}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9),
+                    reason="tracemalloc can not reset the peak")
+def test_trace_memory():
+    prof = Profiler(enabled=True, trace_memory=True)
+    try:
+        with prof.span('outer'):
+            with prof.span('inner'):
+                data = bytearray(10 ** 6)
+            del data
+    finally:
+        prof.set_enabled(False)
+    inner, outer = prof.spans
+    assert inner.peak_bytes >= 10 ** 6
+    assert outer.peak_bytes >= 10 ** 6
+
+
+def test_trace_memory_sequential_spans():
+    prof = Profiler(enabled=True, trace_memory=True)
+    try:
+        with prof.span('large'):
+            data = bytearray(10 ** 6)
+            del data
+        with prof.span('small'):
+            data = bytearray(10 ** 4)
+            del data
+    finally:
+        prof.set_enabled(False)
+    large, small = prof.spans
+    if sys.version_info < (3, 9):
+        assert large.peak_bytes is None
+        assert small.peak_bytes is None
+    else:
+        assert large.peak_bytes >= 10 ** 6
+        assert 10 ** 4 <= small.peak_bytes < 10 ** 6
+
+
+def test_export(tmpdir):
+    prof = Profiler(enabled=True)
+    with prof.span('plot'):
+        pass
+    prof.add_span('worker.design_filter', 0.0, 0.5)
+
+    prof.to_json(str(tmpdir.join('spans.json')))
+    spans = json.loads(tmpdir.join('spans.json').read())
+    assert [span['name'] for span in spans] == ['plot',
+                                                'worker.design_filter']
+
+    prof.to_chrome_trace(str(tmpdir.join('trace.json')))
+    events = json.loads(tmpdir.join('trace.json').read())['traceEvents']
+    complete = [event for event in events if event['ph'] == 'X']
+    assert len(complete) == 2
+    assert complete[1]['dur'] == 0.5e6
+    assert complete[0]['tid'] != complete[1]['tid']
+
+
+def test_design_spans(qtbot, monkeypatch, tmpdir):
+    monkeypatch.setattr(CONF, 'design_cache_dir', str(tmpdir))
+    monkeypatch.setattr(CONF, 'profile', True)
+    mainwindow = QDesignerMainWindow()
+    qtbot.addWidget(mainwindow)
+    widget = mainwindow.stacked_widget.widget(0)
+    profiler.clear()
+    try:
+        with qtbot.waitSignal(widget.design_worker.sig_finished,
+                              timeout=30000):
+            widget.push_filter_design()
+        widget.canvas.draw()
+        qtbot.waitUntil(lambda: 'plot.draw' in
+                        mainwindow.statusBar().currentMessage(),
+                        timeout=5000)
+    finally:
+        profiler.set_enabled(False)
+
+    names = {span.name for span in profiler.spans}
+    assert {'push_filter_design', 'design.spec', 'worker.design_filter',
+            'plot_filter', 'plot.response', 'response.fft',
+            'response.unwrap', 'plot.draw'} <= names
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import numpy as np
+
+# Local imports
+from filterdesigner.filterbase import TYPE_LPF
+from filterdesigner.filterdesign.design import (FilterSpec, METHOD_EQUIRIPPLE,
+                                                design_filter)
+from filterdesigner.filterdesign.metrics import filter_metrics
+from filterdesigner.filterdesign.quantize import (quantize_taps, TRUNCATE,
+                                                  explore_word_lengths,
+                                                  narrowest_word_length)
+
+
+def test_quantize_taps():
+    taps = np.array([0.75, -0.5, 0.25001, -1.0])
+    quantized = quantize_taps(taps, 8)
+    assert quantized.frac_bits == 7
+    assert list(quantized.integers) == [96, -64, 32, -128]
+    assert quantized.q_format == "Q0.7"
+    assert np.allclose(quantized.taps, taps, atol=2 ** -8)
+
+    # 0.75 * 2 ** 2 = 3 saturates to the largest code of 3 bits
+    quantized = quantize_taps(taps, 3, frac_bits=2, rounding=TRUNCATE)
+    assert list(quantized.integers) == [3, -2, 1, -4]
+
+
+def test_explore_word_lengths():
+    spec = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 65, 1000,
+                             [100, 150], [1, 10])
+    taps = design_filter(spec)
+    atten = filter_metrics(spec, taps).stopband_atten_db
+
+    points = explore_word_lengths(spec, taps, n_bits=range(6, 25))
+    assert [point.n_bit for point in points] == list(range(6, 25))
+    assert points[0].degradation_db > 10
+    assert abs(points[-1].degradation_db) < 0.1
+
+    for point in points[::6]:
+        quantized = quantize_taps(taps, point.n_bit)
+        assert np.isclose(filter_metrics(spec, quantized.taps)
+                          .stopband_atten_db, point.stopband_atten_db)
+
+    best = narrowest_word_length(points, atten - 1)
+    assert best.degradation_db <= 1
+    assert all(point.degradation_db > 1 for point in points
+               if point.n_bit < best.n_bit)
+    assert narrowest_word_length(points, atten + 100) is None
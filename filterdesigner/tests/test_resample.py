@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Tests of the polyphase resampler."""
+
+# Third Party Libraries Imports
+import numpy as np
+import pytest
+from scipy.signal import upfirdn
+
+# Local imports
+from filterdesigner.helper.resample import (Decimator, Interpolator,
+                                            Resampler, polyphase_branches)
+
+
+def test_polyphase_branches():
+    branches = polyphase_branches(np.arange(7), 3)
+    assert np.array_equal(branches, [[0, 3, 6], [1, 4, 0], [2, 5, 0]])
+
+
+@pytest.mark.parametrize('up, down, n_tap',
+                         [(1, 4, 64), (3, 1, 64), (3, 2, 64), (2, 3, 64),
+                          (147, 160, 64), (4, 6, 64), (2, 2, 64),
+                          (6, 4, 64), (4, 3, 3)])
+def test_resampler_matches_upfirdn(up, down, n_tap):
+    rng = np.random.RandomState(up * down)
+    taps = rng.randn(n_tap)
+    data = rng.randn(3001)
+    resampler = Resampler(taps, up, down)
+    expected = upfirdn(taps * up, data, up, down)
+
+    out = resampler.resample(data)
+    assert len(out) == min(-(-len(data) * up // down), len(expected))
+    n_out = min(len(out), len(expected))
+    assert np.allclose(out[:n_out], expected[:n_out])
+
+    full = resampler.resample(data, full=True)
+    assert np.allclose(full[:len(expected)], expected)
+
+    chunks = np.split(data, np.sort(rng.randint(0, len(data), 20)))
+    streamed = np.concatenate(list(resampler.stream(chunks, full=True)))
+    assert np.array_equal(streamed, full)
+
+
+def test_decimator_interpolator_channels():
+    taps = np.hanning(31)
+    data = np.random.RandomState(0).randn(2, 1000)
+
+    out = Decimator.from_design((taps, 1000), 4).resample(data)
+    assert out.shape == (2, 250)
+    assert np.allclose(out[1], np.convolve(data[1], taps)[:1000:4])
+
+    out = Interpolator(taps, 3).resample(data)
+    upsampled = np.zeros((2, 3000))
+    upsampled[:, ::3] = data
+    assert np.allclose(out[0], 3 * np.convolve(upsampled[0], taps)[:3000])
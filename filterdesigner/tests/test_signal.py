@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Third Party Libraries Imports
+import numpy as np
+
+# Local imports
+from filterdesigner.helper.signal import (BYTES_PER_POINT, db2,
+                                          complex_response_points,
+                                          frequency_response_batch,
+                                          frequency_response_points,
+                                          minmax_envelope, unwrap_inplace,
+                                          sos_response_points)
+
+
+def test_frequency_response_points_long_taps():
+    taps = np.random.RandomState(0).randn(500)
+    n_point = 100
+
+    mag_db, phase_rad, fre = frequency_response_points(taps, 1000, n_point)
+
+    w = np.arange(n_point) / (2 * n_point)
+    expected = np.exp(-2j * np.pi * np.outer(w, np.arange(len(taps)))) @ taps
+    assert np.allclose(mag_db, db2(expected, 90))
+    assert np.allclose(fre, w * 1000)
+
+
+def test_frequency_response_batch():
+    taps = np.random.RandomState(0).randn(5, 300)
+    n_point = 256
+
+    mag_db, phase_rad, fre = frequency_response_batch(taps, 1000, n_point)
+
+    assert mag_db.shape == phase_rad.shape == (5, n_point)
+    for idx, row in enumerate(taps):
+        response = complex_response_points(row, n_point)
+        assert np.allclose(mag_db[idx], db2(response, 90))
+        assert np.allclose(phase_rad[idx], np.unwrap(np.angle(response)))
+    assert np.allclose(fre, np.arange(n_point) / n_point * 500)
+
+
+def test_frequency_response_batch_out_float32():
+    taps = np.random.RandomState(0).randn(300, 5)
+    out = (np.empty((64, 5), np.float32), np.empty((64, 5), np.float32))
+
+    mag_db, phase_rad, _ = frequency_response_batch(
+        taps, 1000, 64, axis=0, dtype=np.float32, out=out)
+
+    assert mag_db is out[0] and phase_rad is out[1]
+    expected, _, _ = frequency_response_batch(taps.T, 1000, 64)
+    assert np.allclose(mag_db.T, expected, atol=1e-3)
+
+
+def test_unwrap_inplace():
+    phase = np.angle(np.exp(1j * np.linspace(0, 40, 1000)))
+    phase = np.stack([phase, -phase])
+    expected = np.unwrap(phase)
+    assert unwrap_inplace(phase) is phase
+    assert np.allclose(phase, expected)
+
+
+def test_frequency_response_points_memory_cap():
+    mag_db, _, _ = frequency_response_points(
+        np.ones(10), 1, 10 ** 9, max_bytes=1000 * BYTES_PER_POINT)
+
+    assert len(mag_db) == 1000
+
+
+def test_minmax_envelope():
+    x = np.arange(10000.0)
+    y = np.zeros(10000)
+    y[1234] = -100
+
+    x_env, y_env = minmax_envelope(x, y, 100)
+    assert len(x_env) == 201
+    assert y_env.min() == -100
+
+    x_env, y_env = minmax_envelope(x, y, 100, x_lim=(1000, 1100))
+    assert len(x_env) == 103
+    assert x_env[0] == 999
+
+
+def test_sos_response_points():
+    from scipy.signal import ellip, sosfreqz
+
+    sos = ellip(10, 0.5, 80, [0.2, 0.3], 'bandpass', output='sos')
+    mag_db, phase_rad, fre = sos_response_points(sos, 2.0, 2048)
+    _, response = sosfreqz(sos, 2048, fs=2.0)
+
+    expected = db2(response, 90)
+    assert np.allclose(mag_db, expected, atol=1e-9)
+    assert np.allclose(phase_rad, np.unwrap(np.angle(response)))
+    assert np.allclose(fre, np.arange(2048) / 2048)
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Tests of the startup benchmark."""
+
+# Local imports
+from filterdesigner.benchmarks.startup import compare, parse_importtime
+
+
+def test_parse_importtime():
+    text = ("import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   numpy.core\n"
+            "import time:       200 |       1500 | numpy\n")
+    assert parse_importtime(text) == {'numpy.core': 1e-4, 'numpy': 1.5e-3}
+
+
+def test_compare_baseline():
+    baseline = {'import': 1.0, 'first_paint': 2.0}
+    assert compare({'import': 1.2, 'first_paint': 2.0}, baseline, 0.25) == []
+    regressions = compare({'import': 1.3, 'first_paint': 2.0}, baseline, 0.25)
+    assert len(regressions) == 1 and regressions[0].startswith('import')
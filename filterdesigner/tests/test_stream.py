@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""Tests of the streaming filter."""
+
+# Third Party Libraries Imports
+import numpy as np
+import pytest
+
+# Local imports
+from filterdesigner.filterdesign.design import (FilterSpec, design_filter,
+                                                METHOD_EQUIRIPPLE)
+from filterdesigner.filterbase import TYPE_LPF
+from filterdesigner.helper.stream import (StreamFilter, SOSStreamFilter,
+                                          optimal_fft_size, impulse_length,
+                                          sos_impulse_response)
+
+
+@pytest.mark.parametrize('n_tap', [1, 2, 31, 129])
+def test_stream_matches_one_shot(n_tap):
+    rng = np.random.RandomState(n_tap)
+    taps = rng.randn(n_tap)
+    data = rng.randn(5000)
+    stream_filter = StreamFilter(taps)
+
+    one_shot = stream_filter.filter(data, full=True)
+    assert np.allclose(one_shot, np.convolve(data, taps))
+
+    chunks = np.split(data, np.sort(rng.randint(0, len(data), 20)))
+    streamed = np.concatenate(list(stream_filter.stream(chunks, full=True)))
+    assert np.array_equal(streamed, one_shot)
+
+
+def test_stream_from_design():
+    spec = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 65, 1000,
+                             [100, 200], [1, 1])
+    stream_filter = StreamFilter.from_design((design_filter(spec), spec.fs))
+    data = np.random.RandomState(0).randn(2, 1000)
+
+    out = stream_filter.filter(data)
+
+    assert out.shape == data.shape
+    for channel, expected in zip(out, data):
+        assert np.allclose(channel,
+                           np.convolve(expected, stream_filter.taps)[:1000])
+
+    stream_filter.process(data[:, :10])
+    with pytest.raises(ValueError):
+        stream_filter.process(np.zeros((3, 10)))
+
+
+def test_optimal_fft_size():
+    assert optimal_fft_size(129) == 1024
+    assert optimal_fft_size(1025) >= 4096
+    with pytest.raises(ValueError):
+        StreamFilter(np.ones(10), n_fft=8)
+
+
+def test_sos_stream_filter():
+    from scipy.signal import ellip, sosfilt
+
+    sos = ellip(6, 1, 60, [0.2, 0.4], 'bandpass', output='sos')
+    data = np.random.RandomState(0).randn(3, 5000)
+    sos_filter = SOSStreamFilter(sos)
+    out = np.concatenate(list(sos_filter.stream(
+        np.array_split(data, 7, axis=-1))), axis=-1)
+    assert np.allclose(out, sosfilt(sos, data))
+
+    complex_data = data[0] + 1j * data[1]
+    assert np.allclose(sos_filter.filter(complex_data),
+                       sosfilt(sos, complex_data))
+
+    impulse = sos_impulse_response(sos)
+    assert len(impulse) == impulse_length(sos)
+    assert np.abs(impulse[-10:]).max() < 1e-6 * np.abs(impulse).max()
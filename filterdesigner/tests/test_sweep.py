@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Local imports
+from filterdesigner.filterbase import TYPE_LPF
+from filterdesigner.filterdesign.design import FilterSpec, METHOD_EQUIRIPPLE
+from filterdesigner.filterdesign.sweep import (sweep_specs, run_sweep,
+                                               cheapest_point)
+from filterdesigner.filterdesign.sweepwidget import parse_values
+
+
+def test_sweep():
+    base_spec = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 33, 1000,
+                                  [100, 150], [1, 10])
+    specs = sweep_specs(base_spec, n_taps=[9, 33, 65],
+                        weights=[(1, 1), (1, 10)])
+    assert len(specs) == 6
+
+    points = run_sweep(specs, jobs=2)
+    assert [point.spec for point in points] == specs
+
+    best = cheapest_point(points, max_ripple_db=0.5, min_atten_db=30)
+    assert best.spec.n_tap == 33
+    assert cheapest_point(points, max_ripple_db=0, min_atten_db=1000) is None
+
+
+def test_parse_values():
+    assert parse_values("65:129:32", int) == [65, 97, 129]
+    assert parse_values("1, 10,80") == [1.0, 10.0, 80.0]
+    assert parse_values("0:1:0.1") == [idx / 10 for idx in range(11)]
+    assert parse_values("0.3:0.6:0.1") == [0.3, 0.4, 0.5, 0.6]
+    assert parse_values("1e-3:3e-3:1e-3") == [0.001, 0.002, 0.003]
+    assert parse_values("5:1:1", int) == []
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the MIT License
+
+"""."""
+
+# Local imports
+from filterdesigner.filterbase import TYPE_LPF
+from filterdesigner.filterdesign.design import FilterSpec, METHOD_EQUIRIPPLE
+from filterdesigner.filterdesign.minorder import OrderSearchResult
+from filterdesigner.filterdesign.worker import DesignWorker
+
+
+def test_worker_rejects_stale_result(qtbot):
+    worker = DesignWorker()
+    spec_slow = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 4001, 1000,
+                                  [100, 110], [1, 80])
+    spec = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 33, 1000,
+                             [100, 200], [1, 80])
+    results = []
+    worker.sig_finished.connect(
+        lambda job_id, s, taps: results.append((job_id, s, len(taps))))
+
+    worker.submit(spec_slow)
+    with qtbot.waitSignal(worker.sig_busy, timeout=30000):
+        job_id = worker.submit(spec)
+
+    assert results == [(job_id, spec, 33)]
+    worker.shutdown()
+
+
+def test_worker_cancel(qtbot):
+    worker = DesignWorker()
+    spec = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 8001, 1000,
+                             [100, 101], [1, 80])
+    worker.submit(spec)
+    with qtbot.waitSignal(worker.sig_busy, timeout=1000) as blocker:
+        worker.cancel()
+
+    assert blocker.args == [False]
+    assert not worker.busy
+
+
+def test_worker_shutdown_not_started():
+    worker = DesignWorker()
+    worker.shutdown()
+    assert worker._standby is None
+
+
+def test_worker_search(qtbot):
+    worker = DesignWorker()
+    spec = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 1, 1000,
+                             [100, 150], [1, 10])
+    with qtbot.waitSignal(worker.sig_finished, timeout=60000) as blocker:
+        job_id = worker.submit_search(spec, 0.1, 60)
+
+    result_id, _, result = blocker.args
+    assert result_id == job_id
+    assert isinstance(result, OrderSearchResult)
+    assert result.metrics.stopband_atten_db >= 60
+
+    worker.submit_search(spec, 0.01, 80)
+    worker.cancel()
+    assert not worker.busy
+    worker.shutdown()
+
+
+def test_worker_cancel_running_search(qtbot):
+    worker = DesignWorker()
+    spec_slow = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 1, 1000,
+                                  [100, 101], [1, 10])
+    worker.submit_search(spec_slow, 0.01, 80)
+    qtbot.waitUntil(lambda: worker._search[1].running(), timeout=60000)
+    pool = worker._pool
+    processes = list(pool._processes.values())
+
+    worker.cancel()
+    assert worker._pool is None
+    assert not any(process.is_alive() for process in processes)
+
+    spec = FilterSpec.create(TYPE_LPF, METHOD_EQUIRIPPLE, 1, 1000,
+                             [100, 150], [1, 10])
+    with qtbot.waitSignal(worker.sig_finished, timeout=60000) as blocker:
+        job_id = worker.submit_search(spec, 0.1, 60)
+    assert blocker.args[0] == job_id
+    worker.shutdown()